@@ -0,0 +1,171 @@
+"""
+Benchmark cases for the simulation and inference engines.
+
+Each case is a setup function `setup(n) -> callable` that builds a fixed-seed fixture for n entities and
+returns the zero-argument function to time. Setup cost is never included in the timings.
+"""
+import random
+import tempfile
+import itertools
+from functools import partial
+
+from src.boolean_network_representation.network import BooleanNetwork
+from src.boolean_network_representation.rules import TruthTableToRules, RuleLoader
+from src.data_processing.truth_table_from_gui_import import generate_truth_table
+from src.inference_engine.cost_functions.hamming_distance import calculate_hamming_distance
+from src.inference_engine.mutation_strategies.flip_mutation import flip_bit
+from src.inference_engine.mutation_strategies.edame_mutation import edame_mutation
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
+from src.inference_engine.metaheuristics.simulated_annealing import (
+    simulated_annealing, TemperatureSchedule, metropolis_acceptance
+)
+from src.inference_engine.metaheuristics.genetic_algorithm import genetic_algorithm
+
+SEED = 1234
+
+
+def entity_names(n):
+    return [f"N{i + 1}" for i in range(n)]
+
+
+def random_trace(n, seed=SEED):
+    rng = random.Random(seed)
+    states = [''.join(bits) for bits in itertools.product('01', repeat=n)]
+    return {state: [rng.randint(0, 1) for _ in range(n)] for state in states}
+
+
+def network_from_trace(trace):
+    n = len(next(iter(trace)))
+    entities = entity_names(n)
+    network = BooleanNetwork(n, rule_source="manual")
+    network.current_rules = build_rules(TruthTableToRules.convert(trace, entities), entities)
+    return network
+
+
+def random_network(n, seed=SEED):
+    return network_from_trace(random_trace(n, seed))
+
+
+# Micro benchmarks
+
+def bench_generate_truth_table(n):
+    network = random_network(n)
+    return network.generate_truth_table
+
+
+def bench_gui_truth_table(n):
+    entities = entity_names(n)
+    rules = TruthTableToRules.convert(random_trace(n), entities)
+    for i, name in enumerate(entities):  # rules as the GUI stores them, over entity names
+        rules = {entity: expr.replace(f"state[{i}]", name) for entity, expr in rules.items()}
+    return partial(generate_truth_table, entities, rules, RuleLoader.format_rule_for_python)
+
+
+def bench_detect_attractors(n):
+    network = random_network(n)
+    return network.detect_attractors
+
+
+def bench_infer_wiring(n):
+    network = random_network(n)
+    return network.infer_wiring
+
+
+def bench_rules_convert(n):
+    trace, entities = random_trace(n), entity_names(n)
+    return partial(TruthTableToRules.convert, trace, entities)
+
+
+def bench_rules_convert_minimise(n):
+    trace, entities = random_trace(n), entity_names(n)
+    return partial(TruthTableToRules.convert, trace, entities, minimise=True, readable=True)
+
+
+def bench_hamming_cost(n):
+    return partial(calculate_hamming_distance, random_trace(n, SEED), random_trace(n, SEED + 1))
+
+
+def bench_flip_bit(n):
+    trace, entities = random_trace(n), entity_names(n)
+
+    def run():
+        random.seed(SEED)
+        return flip_bit(trace, entities)
+    return run
+
+
+def bench_edame_mutation(n):
+    network = random_network(n)
+    trace = network.generate_truth_table()
+    target_attractors = random_network(n, SEED + 1).detect_attractors()
+
+    def run():
+        random.seed(SEED)
+        return edame_mutation(network, trace, target_attractors)
+    return run
+
+
+# Macro benchmarks - short fixed-seed searches
+
+def bench_sa_run(n, iterations=300):
+    desired_trace = random_trace(n, SEED + 1)
+    entities = entity_names(n)
+    output_dir = tempfile.mkdtemp(prefix="bench_sa_")
+
+    def run():
+        random.seed(SEED)
+        return simulated_annealing(
+            network=random_network(n),
+            desired_trace=desired_trace,
+            cost_function=calculate_hamming_distance,
+            mutation_function=lambda network, trace: flip_bit(trace, entities),
+            acceptance_function=metropolis_acceptance,
+            temperature_schedule=TemperatureSchedule(initial_temp=5.0, cooling_rate=0.99),
+            entities=entities,
+            max_iterations=iterations,
+            log_interval=iterations + 1,
+            live_update_interval=iterations + 1,
+            output_dir=output_dir,
+            plot_progress=False,
+        )
+    return run
+
+
+def bench_ga_run(n, pop_size=16, generations=5):
+    desired_trace = random_trace(n, SEED + 1)
+    entities = entity_names(n)
+    output_dir = tempfile.mkdtemp(prefix="bench_ga_")
+
+    def run():
+        random.seed(SEED)
+        return genetic_algorithm(
+            network_class=BooleanNetwork,
+            desired_trace=desired_trace,
+            pop_size=pop_size,
+            max_gens=generations,
+            crossover_rate=0.7,
+            mutation_rate=0.05,
+            entities=entities,
+            cost_function=calculate_hamming_distance,
+            mutation_function=lambda network, trace: flip_bit(trace, entities),
+            output_dir=output_dir,
+            live_update_interval=generations + 1,
+            plot_progress=False,
+        )
+    return run
+
+
+# name: (setup, sizes, macro)
+CASES = {
+    "generate_truth_table": (bench_generate_truth_table, range(3, 11), False),
+    "gui_truth_table": (bench_gui_truth_table, range(3, 11), False),
+    "detect_attractors": (bench_detect_attractors, range(3, 11), False),
+    "infer_wiring": (bench_infer_wiring, range(3, 11), False),
+    "rules_convert": (bench_rules_convert, range(3, 11), False),
+    "rules_convert_minimise": (bench_rules_convert_minimise, range(3, 8), False),
+    "hamming_cost": (bench_hamming_cost, range(3, 11), False),
+    "flip_bit": (bench_flip_bit, range(3, 11), False),
+    "edame_mutation": (bench_edame_mutation, range(3, 11), False),
+    "sa_run": (bench_sa_run, range(3, 11), True),
+    "ga_run": (bench_ga_run, range(3, 11), True),
+}
@@ -0,0 +1,125 @@
+"""
+Import-time and GUI start-up benchmarks.
+
+    python -m src.benchmarks.import_time [MODULE] [--top 20]
+
+Imports are cached per process, so every measurement runs in a fresh interpreter. Import cases run
+`python -X importtime -c "import MODULE"` and read the module's cumulative time from the report; the start-up
+case times the main menu from its first import to the window being shown (offscreen). Without arguments the
+command prints the heaviest imports behind the main menu and checks start-up against STARTUP_BUDGET.
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+from functools import partial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STARTUP_BUDGET = 1.0  # seconds until the main menu is shown
+
+_REPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+_STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from src.gui.main_menu_window import MainMenu
+app = QApplication([])
+window = MainMenu()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+"""
+
+
+def _run_python(args, env=None):
+    result = subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ["no output"]
+        raise RuntimeError(f"'python {' '.join(args[:2])} ...' failed: {tail[0]}")
+    return result
+
+
+def parse_importtime(report):
+    """
+    Parses `-X importtime` output into (module, self seconds, cumulative seconds, depth) rows, in report order
+    (a module's dependencies are listed before it).
+    """
+    rows = []
+    for line in report.splitlines():
+        match = _REPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us) / 1e6, int(cumulative_us) / 1e6, len(indent) // 2))
+    return rows
+
+
+def import_profile(module):
+    """
+    Imports module in a fresh interpreter and returns its parsed -X importtime report.
+    """
+    return parse_importtime(_run_python(["-X", "importtime", "-c", f"import {module}"]).stderr)
+
+
+def import_time(module):
+    """
+    Cumulative seconds to import module (and everything it pulls in) in a fresh interpreter.
+    """
+    for name, _, cumulative, depth in reversed(import_profile(module)):
+        if name == module and depth == 0:
+            return cumulative
+    raise RuntimeError(f"'{module}' not found in the import report")
+
+
+def gui_startup_time():
+    """
+    Seconds from the first GUI import to the main menu being shown, in a fresh interpreter.
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return float(_run_python(["-c", _STARTUP_SCRIPT], env=env).stdout.strip().splitlines()[-1])
+
+
+# name -> zero-argument function returning seconds; timed by run_benchmarks alongside cases.CASES
+IMPORT_CASES = {
+    "import_main_menu": partial(import_time, "src.gui.main_menu_window"),
+    "import_network": partial(import_time, "src.boolean_network_representation.network"),
+    "import_experiment_runner": partial(import_time, "src.experiments.run_experiment"),
+    "gui_startup": gui_startup_time,
+}
+
+
+def heaviest_imports(module, top=20):
+    """
+    The `top` modules with the largest self import time behind module, heaviest first.
+    """
+    return sorted(import_profile(module), key=lambda row: -row[1])[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks.import_time",
+                                     description="Import-time breakdown and GUI start-up check.")
+    parser.add_argument("module", nargs="?", default="src.gui.main_menu_window", help="module to profile")
+    parser.add_argument("--top", type=int, default=20, help="number of imports to list")
+    args = parser.parse_args(argv)
+
+    rows = import_profile(args.module)
+    total = next((row[2] for row in reversed(rows) if row[0] == args.module and row[3] == 0), 0.0)
+    print(f"import {args.module}: {total * 1e3:.1f} ms cumulative\n")
+    print(f"{'self ms':>10} {'cumul. ms':>10}  module")
+    for name, self_time, cumulative, _ in heaviest_imports(args.module, args.top):
+        print(f"{self_time * 1e3:>10.1f} {cumulative * 1e3:>10.1f}  {name}")
+
+    if args.module != "src.gui.main_menu_window":
+        return 0
+    startup = gui_startup_time()
+    if startup > STARTUP_BUDGET:
+        print(f"\n❌ Main menu shown after {startup:.3f} s (budget {STARTUP_BUDGET:.1f} s)")
+        return 1
+    print(f"\n✅ Main menu shown after {startup:.3f} s (budget {STARTUP_BUDGET:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Benchmark runner.
+
+    python -m src.benchmarks [--filter NAME] [--sizes 3-6] [--quick] [--output FILE] [--compare BASELINE] [--threshold 0.2]
+
+Times every case in cases.CASES for each network size, plus the import-time / GUI start-up cases in
+import_time.IMPORT_CASES, and writes the results as JSON (with the git commit, Python version and platform) so
+runs can be compared across commits. With --compare, each case's median is
+checked against the baseline file and the exit code is 1 if any case is slower by more than --threshold.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime
+
+from src.benchmarks.cases import CASES
+from src.benchmarks.import_time import IMPORT_CASES
+
+RESULTS_DIR = "benchmark_results"
+
+
+def time_case(func, min_time=0.2, repeat=5, macro=False):
+    """
+    Times func like timeit: calibrates a loop count so one repeat lasts at least min_time (macro cases run
+    once per repeat), then returns per-call seconds over `repeat` repeats.
+    """
+    number = 1
+    if not macro:
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - start >= min_time or number >= 1_000_000:
+                break
+            number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def parse_sizes(text):
+    if not text:
+        return None
+    if "-" in text:
+        low, high = text.split("-")
+        return set(range(int(low), int(high) + 1))
+    return {int(n) for n in text.split(",")}
+
+
+def run_benchmarks(name_filter=None, sizes=None, quick=False, log=print):
+    """
+    Runs the selected cases and returns {"metadata": ..., "results": {"case[n=5]": timing, ...}}.
+    """
+    min_time, repeat = (0.05, 3) if quick else (0.2, 5)
+    results = {}
+    for name, (setup, case_sizes, macro) in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        for n in case_sizes:
+            if sizes is not None and n not in sizes:
+                continue
+            key = f"{name}[n={n}]"
+            # Engine output (progress prints) would swamp the report
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                func = setup(n)
+                timing = time_case(func, min_time=min_time, repeat=1 if quick and macro else repeat, macro=macro)
+            results[key] = timing
+            log(f"{key:<36} {timing['median'] * 1e3:>12.4f} ms  (min {timing['min'] * 1e3:.4f} ms, x{timing['number']})")
+
+    # Import cases don't depend on network size; each sample is a fresh interpreter
+    for name, measure in IMPORT_CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            samples = [measure() for _ in range(repeat)]
+        except RuntimeError as e:
+            log(f"{name:<36} skipped ({e})")
+            continue
+        timing = {
+            "median": statistics.median(samples),
+            "min": min(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "number": 1,
+            "repeat": repeat,
+        }
+        results[name] = timing
+        log(f"{name:<36} {timing['median'] * 1e3:>12.4f} ms  (min {timing['min'] * 1e3:.4f} ms)")
+
+    return {
+        "metadata": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=0.2, log=print):
+    """
+    Compares medians case by case. Returns the list of (case, ratio) slower than 1 + threshold.
+    """
+    regressions = []
+    base_results = baseline["results"]
+    log(f"\nvs baseline {baseline['metadata'].get('commit')} ({baseline['metadata'].get('timestamp')}):")
+    for key, timing in current["results"].items():
+        if key not in base_results:
+            continue
+        ratio = timing["median"] / base_results[key]["median"] if base_results[key]["median"] else float("inf")
+        marker = ""
+        if ratio > 1 + threshold:
+            marker = "  ⚠️ REGRESSION"
+            regressions.append((key, ratio))
+        elif ratio < 1 - threshold:
+            marker = "  ✅ faster"
+        log(f"{key:<36} {ratio:>8.2f}x{marker}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.benchmarks", description="BN Forge benchmark suite.")
+    parser.add_argument("--filter", default=None, help="only cases whose name contains this")
+    parser.add_argument("--sizes", default=None, help="entity counts, e.g. 3-6 or 4,8 (default: each case's range)")
+    parser.add_argument("--quick", action="store_true", help="shorter timings (noisier)")
+    parser.add_argument("--output", default=None, help=f"results JSON (default {RESULTS_DIR}/bench_<commit>_<time>.json)")
+    parser.add_argument("--compare", default=None, metavar="BASELINE", help="baseline results JSON to check against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before failing (default 0.2 = 20%%)")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, case_sizes, macro) in CASES.items():
+            print(f"{name:<28} n={min(case_sizes)}..{max(case_sizes)}{'  (macro)' if macro else ''}")
+        for name in IMPORT_CASES:
+            print(f"{name:<28} (fresh interpreter)")
+        return 0
+
+    report = run_benchmarks(args.filter, parse_sizes(args.sizes), args.quick)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"bench_{report['metadata']['commit'] or 'local'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+        print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
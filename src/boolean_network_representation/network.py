@@ -1,7 +1,6 @@
 import string
-from src.boolean_network_representation.rules import RuleLoader
-from graphviz import Digraph
-import networkx as nx
+from src.boolean_network_representation.rules import RuleLoader, CompiledRule
+from src.boolean_network_representation.static_visualisations.state_graph_dot import render_state_graph
 
 
 class BooleanNetwork:
@@ -21,6 +20,49 @@ class BooleanNetwork:
         # Check that the number of rules matches the number of entities
         self._validate_rules()
 
+    def __getstate__(self):
+        """
+        Pickles the network as its entity count plus rule expression strings (no lambdas), so networks can be
+        deep-copied or sent to worker processes cheaply.
+        """
+        return {
+            "entity_count": self.entity_count,
+            "initial_rules": self._serialise_rules(self.initial_rules),
+            "current_rules": self._serialise_rules(self.current_rules),
+        }
+
+    def __setstate__(self, state):
+        """
+        Rebuilds the network from the compact form produced by __getstate__.
+        """
+        self.entity_count = state["entity_count"]
+        self.nodes = list(string.ascii_uppercase[:self.entity_count])
+        self.states = [f"{i:0{self.entity_count}b}" for i in range(2 ** self.entity_count)]
+        self._rule_loader = RuleLoader(self.entity_count)
+        self.initial_rules = [CompiledRule(e) if e is not None else None for e in state["initial_rules"]]
+        self.current_rules = [CompiledRule(e) if e is not None else None for e in state["current_rules"]]
+
+    def _serialise_rules(self, rules):
+        """
+        Converts rules to expression strings over state[i].
+        Callables that are not CompiledRules (e.g. eval lambdas) are re-derived from their truth table column
+        in Sum-of-Products form.
+        """
+        expressions = []
+        for i, rule in enumerate(rules):
+            if rule is None or isinstance(rule, CompiledRule):
+                expressions.append(rule.expression if rule is not None else None)
+                continue
+
+            terms = []
+            for state in self.states:
+                bits = list(map(int, state))
+                if rule(bits, i):
+                    literals = [f"state[{j}]" if bit else f"not state[{j}]" for j, bit in enumerate(bits)]
+                    terms.append(f"({' and '.join(literals)})")
+            expressions.append(" or ".join(terms) if terms else "0")
+        return expressions
+
     def _validate_rules(self):
         """
         Checks that the number of rules matches the number of entities.
@@ -61,18 +103,15 @@ class BooleanNetwork:
             transitions[state] = next_state_str
         return transitions
 
-    def generate_state_graph(self, filename='state_graph', view=True):
+    def generate_state_graph(self, filename='state_graph', view=True, condense="auto", edge_labels=None):
         """
         Generates the state graph for the Boolean Network.
+        Large networks are basin-condensed by default (see state_graph_dot.render_state_graph).
         """
-        dot = Digraph(comment=f'{self.entity_count}-Entity Boolean Network State Graph')
-        dot.attr(rankdir='LR')
-
-        for state, next_state in self.get_state_transition().items():
-            dot.node(state, state)
-            dot.edge(state, next_state, label=f"{state} → {next_state}")
-
-        dot.render(filename, format='png', view=view)
+        render_state_graph(
+            self.get_state_transition(), filename, view=view, condense=condense, edge_labels=edge_labels,
+            comment=f'{self.entity_count}-Entity Boolean Network State Graph'
+        )
 
     def print_truth_table(self):
         """
@@ -186,6 +225,7 @@ class BooleanNetwork:
         """
         Uses dict from infer_wiring to build static entity-interaction wiring diagram (in networkx).
         """
+        import networkx as nx
         G = nx.DiGraph()
         for target, sources in deps.items():
             for source in sources:
@@ -196,6 +236,7 @@ class BooleanNetwork:
         """
         Generates a entity-interaction wiring diagram PNG using Graphviz.
         """
+        from graphviz import Digraph
         deps = self.infer_wiring()
         dot = Digraph(comment=f'{self.entity_count}-Entity Boolean Network Wiring Diagram')
         dot.attr(rankdir='LR')
@@ -1,9 +1,44 @@
 import re
 import random
-from sympy.logic.boolalg import SOPform
-from sympy.abc import A, B, C, D, E, F, G, H, I, J  # max 10
-from sympy import simplify_logic
-from sympy import symbols, simplify_logic
+
+class CompiledRule:
+    """
+    Picklable next-state rule.
+
+    Stores the Python expression over state[i] (e.g. "state[0] and not state[1]") and compiles it once
+    into a callable. Only the expression string is pickled, so rules (and the networks holding them) can be
+    deep-copied or sent to worker processes - eval-built lambdas cannot.
+    """
+    __slots__ = ("expression", "_fn")
+
+    def __init__(self, expression):
+        self.expression = expression.strip() if isinstance(expression, str) and expression.strip() else "0"
+        self._fn = None
+
+    def __call__(self, state, index):
+        if self._fn is None:
+            self._fn = eval(f"lambda state, index: int({self.expression})")
+        return self._fn(state, index)
+
+    def __getstate__(self):
+        return self.expression
+
+    def __setstate__(self, expression):
+        self.expression = expression
+        self._fn = None
+
+    def __eq__(self, other):
+        return isinstance(other, CompiledRule) and other.expression == self.expression
+
+    def __hash__(self):
+        return hash(self.expression)
+
+    def __repr__(self):
+        return f"CompiledRule({self.expression!r})"
+
+    def __str__(self):
+        return self.expression
+
 
 class RuleLoader:
     def __init__(self, entity_count):
@@ -49,11 +84,11 @@ class RuleLoader:
         node_list = list(rule_dict.keys())  # e.g., ["A", "B", "C", "D", "E"]
         for node, expr in rule_dict.items():
             if expr.strip() == "0":
-                parsed.append(lambda state, index: 0)
+                parsed.append(CompiledRule("0"))
             else:
                 expr_clean = RuleLoader.format_rule_for_python(expr)
                 expr_ready = convert_entity_names(expr_clean, node_list)
-                parsed.append(eval(f"lambda state, index: int({expr_ready})"))
+                parsed.append(CompiledRule(expr_ready))
         return parsed
 
 
@@ -102,8 +137,6 @@ class RuleLoader:
 
         return " ".join(output)
 
-    from sympy.logic.boolalg import SOPform
-    from sympy import symbols, simplify_logic
 
 class TruthTableToRules:
     """Converts a truth table to Boolean rule expressions.
@@ -115,7 +148,7 @@ class TruthTableToRules:
 
     @staticmethod
     def convert(truth_table, entities, minimise=False, readable=False):
-        from sympy.logic.boolalg import SOPform
+        from sympy.logic.boolalg import SOPform  # sympy is slow to import - only load it when converting
         from sympy import symbols, simplify_logic
 
         rules = {}
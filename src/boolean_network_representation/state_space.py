@@ -0,0 +1,73 @@
+"""
+State-space structure of a Boolean network's transition table.
+
+Every state has exactly one successor, so the state graph is a functional graph: each basin of attraction
+is one attractor cycle with transient trees feeding into it. These helpers work on an integer successor
+array and run in linear time, so they scale to the full 2^n state space.
+"""
+
+
+def state_string(state):
+    return state if isinstance(state, str) else "".join(str(bit) for bit in state)
+
+
+def successor_array(transitions):
+    """
+    Converts {state: next_state} (next states as strings or bit lists) into (states, successors), where
+    successors[i] is the index in states of the successor of states[i].
+    """
+    states = [state_string(state) for state in transitions]
+    index = {state: i for i, state in enumerate(states)}
+    successors = [index[state_string(next_state)] for next_state in transitions.values()]
+    return states, successors
+
+
+def transitions_key(transitions):
+    """
+    Hash of a transition table, for caching anything derived from it (layouts, renders).
+    """
+    return hash(tuple((state_string(state), state_string(next_state)) for state, next_state in transitions.items()))
+
+
+def basin_decomposition(successors):
+    """
+    Splits a functional graph into basins.
+
+    Returns (cycles, basin, depth): cycles[k] is attractor k's states in successor order, basin[i] the
+    attractor state i flows into and depth[i] the number of steps before state i reaches its cycle
+    (0 for cycle states).
+    """
+    n = len(successors)
+    status = [0] * n  # 0 unvisited, 1 on the current walk, 2 resolved
+    basin = [-1] * n
+    depth = [-1] * n
+    cycles = []
+
+    for start in range(n):
+        if status[start]:
+            continue
+        path = []
+        i = start
+        while status[i] == 0:
+            status[i] = 1
+            path.append(i)
+            i = successors[i]
+
+        if status[i] == 1:
+            # The walk ran into itself: a new attractor
+            first = path.index(i)
+            cycle = path[first:]
+            for j in cycle:
+                basin[j] = len(cycles)
+                depth[j] = 0
+                status[j] = 2
+            cycles.append(cycle)
+            path = path[:first]
+
+        for j in reversed(path):
+            following = successors[j]
+            basin[j] = basin[following]
+            depth[j] = depth[following] + 1
+            status[j] = 2
+
+    return cycles, basin, depth
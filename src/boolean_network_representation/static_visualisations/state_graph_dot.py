@@ -0,0 +1,115 @@
+import os
+
+from src.boolean_network_representation.state_space import successor_array, basin_decomposition
+
+CONDENSE_ABOVE_STATES = 64  # "auto" condenses state graphs larger than this
+DEFAULT_TREE_THRESHOLD = 4  # transient trees with more states than this become one basin node
+
+
+def _quote(text):
+    return '"' + str(text).replace('"', '\\"') + '"'
+
+
+def write_state_graph_dot(transitions, out, condense=False, tree_threshold=DEFAULT_TREE_THRESHOLD,
+                          edge_labels=False, comment=None):
+    """
+    Streams the state graph of {state: next_state} to `out` as DOT, one line per node/edge.
+
+    With condense, attractor cycles stay explicit but every transient tree feeding a cycle state that has
+    more than tree_threshold states is collapsed into a single basin node (labelled and sized by its state
+    count and depth). Returns (nodes, edges) written.
+    """
+    states, successors = successor_array(transitions)
+    cycles, _, depth = basin_decomposition(successors)
+    n = len(states)
+
+    out.write(f"// {comment}\n" if comment else "")
+    out.write("digraph {\n\trankdir=LR\n")
+
+    def edge(src, dst, label=None, attrs=""):
+        parts = [attrs] if attrs else []
+        if label is not None:
+            parts.append(f"label={_quote(label)}")
+        out.write(f"\t{src} -> {dst}" + (f" [{' '.join(parts)}]" if parts else "") + "\n")
+
+    if not condense:
+        for i in range(n):
+            out.write(f"\t{_quote(states[i])}\n")
+        for i in range(n):
+            src, dst = states[i], states[successors[i]]
+            edge(_quote(src), _quote(dst), f"{src} → {dst}" if edge_labels else None)
+        out.write("}\n")
+        return n, n
+
+    # Cycle state each transient state drains into, and the size/depth of each of those trees
+    entry = list(range(n))
+    order = sorted(range(n), key=depth.__getitem__)
+    for i in order:
+        if depth[i] > 0:
+            entry[i] = entry[successors[i]]
+    tree_size = [0] * n
+    tree_depth = [0] * n
+    for i in range(n):
+        if depth[i] > 0:
+            tree_size[entry[i]] += 1
+            tree_depth[entry[i]] = max(tree_depth[entry[i]], depth[i])
+    collapsed = [tree_size[c] > tree_threshold for c in range(n)]
+
+    nodes = edges = 0
+    for k, cycle in enumerate(cycles):
+        out.write(f"\tsubgraph cluster_{k} {{\n\t\tlabel={_quote(f'Attractor {k + 1} (period {len(cycle)})')}\n")
+        for c in cycle:
+            out.write(f"\t\t{_quote(states[c])} [style=filled fillcolor=orange]\n")
+            nodes += 1
+            if collapsed[c]:
+                width = 0.75 + 0.25 * tree_size[c] ** 0.5
+                label = f'"{tree_size[c]} states' + r'\n' + f'depth ≤ {tree_depth[c]}"'  # \n is a DOT line break
+                out.write(f"\t\tbasin_{c} [shape=box style=rounded width={width:.2f} label={label}]\n")
+                nodes += 1
+        out.write("\t}\n")
+        for j, c in enumerate(cycle):
+            dst = states[cycle[(j + 1) % len(cycle)]]
+            edge(_quote(states[c]), _quote(dst), f"{states[c]} → {dst}" if edge_labels else None, "color=red penwidth=2")
+            edges += 1
+            if collapsed[c]:
+                edge(f"basin_{c}", _quote(states[c]), f"×{tree_size[c]}" if edge_labels else None,
+                     f"penwidth={1 + min(tree_size[c], 64) ** 0.5 / 2:.2f}")
+                edges += 1
+
+    # Transient states in small trees are drawn individually
+    for i in range(n):
+        if depth[i] > 0 and not collapsed[entry[i]]:
+            src, dst = states[i], states[successors[i]]
+            out.write(f"\t{_quote(src)}\n")
+            edge(_quote(src), _quote(dst), f"{src} → {dst}" if edge_labels else None)
+            nodes += 1
+            edges += 1
+
+    out.write("}\n")
+    return nodes, edges
+
+
+def render_state_graph(transitions, filename, view=False, condense="auto", tree_threshold=DEFAULT_TREE_THRESHOLD,
+                       edge_labels=None, fmt="png", comment=None):
+    """
+    Writes the DOT source to `filename` and renders filename.<fmt> with graphviz.
+
+    condense: True, False or "auto" (condense above CONDENSE_ABOVE_STATES states).
+    edge_labels: None labels edges only for uncondensed graphs within that size.
+    """
+    large = len(transitions) > CONDENSE_ABOVE_STATES
+    if condense == "auto":
+        condense = large
+    if edge_labels is None:
+        edge_labels = not condense and not large
+
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as f:
+        write_state_graph_dot(transitions, f, condense=condense, tree_threshold=tree_threshold,
+                              edge_labels=edge_labels, comment=comment)
+
+    import graphviz
+    output = graphviz.render("dot", fmt, filename)
+    if view:
+        graphviz.view(output)
+    return output
@@ -1,11 +1,12 @@
 import os
-from graphviz import Digraph
 from src.boolean_network_representation.network import BooleanNetwork
+from src.boolean_network_representation.static_visualisations.state_graph_dot import render_state_graph
 from src.boolean_network_representation.storage import BooleanNetworkStorage
 
 
-def generate_state_graph(network_name: str, output_folder='saved_networks'):
+def generate_state_graph(network_name: str, output_folder='saved_networks', condense="auto"):
     """Generates a state graph for a saved Boolean Network - GRAPHVIZ IMPLEMENTATION
+    Large state spaces are basin-condensed unless condense=False.
     """
     try:
 
@@ -22,16 +23,11 @@ def generate_state_graph(network_name: str, output_folder='saved_networks'):
         bn = BooleanNetwork(entity_count)
 
 
-        dot = Digraph(comment=f'{entity_count}-Entity Boolean Network State Graph')
-        dot.attr(rankdir='LR')
-
-        for state, next_state in truth_table.items():
-            next_state_str = "".join(str(bit) for bit in next_state)
-            dot.node(state, state)
-            dot.edge(state, next_state_str)
-
         graph_filename = os.path.join(output_folder, f"{network_name.split('.')[0]}_state_graph")
-        dot.render(graph_filename, format='png', view=True)
+        render_state_graph(
+            truth_table, graph_filename, view=True, condense=condense, edge_labels=False,
+            comment=f'{entity_count}-Entity Boolean Network State Graph'
+        )
 
         print(f"State graph generated successfully: {graph_filename}.png")
 
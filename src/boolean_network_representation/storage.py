@@ -1,6 +1,5 @@
 import json
 import os
-import pandas as pd
 
 
 class BooleanNetworkStorage:
@@ -43,6 +42,7 @@ class BooleanNetworkStorage:
     @staticmethod
     def load_csv_as_truth_table(filename):
         """Loads a CSV truth table and returns entities + truth table dictionary."""
+        import pandas as pd
         df = pd.read_csv(f"imported_networks/{filename}")
         input_columns = df.columns[:len(df.columns) // 2]
         output_columns = df.columns[len(df.columns) // 2:]
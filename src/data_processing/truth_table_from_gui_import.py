@@ -1,29 +1,111 @@
-import itertools
+import ast
 
-def generate_truth_table(entities, rules, format_rule_for_python):
+import numpy as np
 
 
-    entity_count = len(entities)
-    states = list(itertools.product([0, 1], repeat=entity_count))
-    truth_table = {}
+_BITWISE = {ast.And: ast.BitAnd, ast.Or: ast.BitOr}
+_BIT_OPS = (ast.BitAnd, ast.BitOr, ast.BitXor)
+
+
+def _bitwise(node):
+    """
+    Rewrites and / or / not into & / | / 1 ^ x, so a rule over 0/1 inputs evaluates on whole arrays of states
+    with the same result as the scalar rule. Returns None for anything else (arithmetic, comparisons, calls),
+    which is evaluated per state instead.
+    """
+    if isinstance(node, ast.Name):
+        return node
+    if isinstance(node, ast.Constant):
+        return node if node.value in (0, 1) else None
+    at = {name: getattr(node, name) for name in node._attributes}
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _bitwise(node.operand)
+        return None if operand is None else ast.BinOp(ast.Constant(1, **at), ast.BitXor(), operand, **at)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, _BIT_OPS):
+        left, right = _bitwise(node.left), _bitwise(node.right)
+        return None if left is None or right is None else ast.BinOp(left, node.op, right, **at)
+    if isinstance(node, ast.BoolOp):
+        operands = [_bitwise(value) for value in node.values]
+        if any(operand is None for operand in operands):
+            return None
+        op = _BITWISE[type(node.op)]
 
-    for state in states:
-        inputs = {entities[i]: state[i] for i in range(entity_count)}
-        next_state = []
+        def combine(lo, hi):  # balanced, so long minterm rules do not nest thousands deep
+            if hi - lo == 1:
+                return operands[lo]
+            mid = (lo + hi) // 2
+            return ast.BinOp(combine(lo, mid), op(), combine(mid, hi), **at)
+        return combine(0, len(operands))
+    return None
 
-        for entity in entities:
-            rule_expr = rules[entity]
 
-            # Apply formatting before evaluation
-            rule_expr = format_rule_for_python(rule_expr)
+def compile_rule(rule_expr, format_rule_for_python, name="<rule>"):
+    """
+    Formats and compiles one GUI rule once. Returns (python_expr, code, vectorised): the code evaluates over
+    whole arrays of states when vectorised, which needs the rule to only use and / or / not / ^ over names and
+    0 / 1; otherwise it is the plain rule, evaluated per state. Raises on a malformed rule.
+    """
+    python_expr = format_rule_for_python(rule_expr)
+    tree = ast.parse(python_expr, name, mode="eval")
+    body = _bitwise(tree.body)
+    if body is None:
+        return python_expr, compile(tree, name, "eval"), False
+    return python_expr, compile(ast.Expression(body), name, "eval"), True
+
+
+def evaluate_rules(entities, rules, format_rule_for_python):
+    """
+    Evaluates every entity's rule over all 2^n states at once.
+
+    Returns (outputs, errors): outputs[s, i] is entity i's next value from state s (first entity = most
+    significant bit) and errors maps each entity whose rule failed to a message. A failing rule gives 0 for the
+    states it cannot be evaluated in, as before.
+    """
+    entity_count = len(entities)
+    states = np.arange(2 ** entity_count, dtype=np.int64)
+    columns = {entities[i]: (states >> (entity_count - 1 - i)) & 1 for i in range(entity_count)}
+    outputs = np.zeros((len(states), entity_count), dtype=np.int64)
+    errors = {}
 
+    for i, entity in enumerate(entities):
+        rule_expr = rules[entity]
+        try:
+            rule_expr, code, vectorised = compile_rule(rule_expr, format_rule_for_python, f"<rule {entity}>")
+        except Exception as e:
+            errors[entity] = f"{e} | Rule: {rule_expr}"
+            continue
+
+        if vectorised:
+            try:
+                outputs[:, i] = np.broadcast_to(np.asarray(eval(code, {}, dict(columns))), len(states))
+                continue
+            except Exception:
+                # e.g. an unknown name - evaluate the plain rule per state, which reports the error as before
+                code = compile(rule_expr, f"<rule {entity}>", "eval")
+
+        failed = 0
+        for s in range(len(states)):
+            inputs = {name: int(column[s]) for name, column in columns.items()}
             try:
-                next_state_value = eval(rule_expr, {}, inputs)
-                next_state.append(int(next_state_value))
+                outputs[s, i] = int(eval(code, {}, inputs))
             except Exception as e:
-                print(f"Error evaluating rule for {entity}: {e} | Rule: {rule_expr}")
-                next_state.append(0)
+                failed += 1
+                errors[entity] = f"{e} | Rule: {rule_expr} ({failed} states set to 0)"
+
+    return outputs, errors
 
-        truth_table["".join(map(str, state))] = next_state
 
-    return truth_table
+def generate_truth_table(entities, rules, format_rule_for_python):
+    """
+    {input_state: [next value per entity]} for every state, from GUI rule expressions.
+    Each rule is formatted and compiled once; rule errors are reported once per entity.
+    """
+    outputs, errors = evaluate_rules(entities, rules, format_rule_for_python)
+    for entity, message in errors.items():
+        print(f"Error evaluating rule for {entity}: {message}")
+
+    entity_count = len(entities)
+    return {
+        format(state, f"0{entity_count}b"): next_state
+        for state, next_state in enumerate(outputs.tolist())
+    }
@@ -0,0 +1,89 @@
+"""
+Background rendering of run artifacts (graphviz state graphs / wiring diagrams, attractor logs).
+
+Renders are queued on a shared thread pool - graphviz runs as a subprocess, so threads render in parallel -
+and run_experiment returns without waiting for them. Renders of the same desired network (same
+transition table) happen once per process; later runs get a copy of the first run's files. Only the
+SHARED_RENDERS most recently used networks are remembered, so a long-lived GUI process does not grow without bound.
+Pending renders finish before the interpreter exits, or call wait_for_artifacts().
+"""
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+ARTIFACT_WORKERS = 4
+SHARED_RENDERS = 64  # (kind, network) renders remembered for copying, least recently used evicted first
+OUTPUT_SUFFIXES = ("", ".png")  # DOT source and rendered image
+
+_executor = None
+_lock = threading.Lock()
+_shared = OrderedDict()  # (kind, network key) -> (future, filename of the first render)
+_pending = []
+
+
+def _render_pool():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=ARTIFACT_WORKERS, thread_name_prefix="artifact-render")
+        return _executor
+
+
+def _report_failure(future):
+    if future.exception() is not None:
+        print(f"⚠️ Artifact render failed: {future.exception()}")
+
+
+def _track(future):
+    future.add_done_callback(_report_failure)
+    with _lock:
+        _pending[:] = [f for f in _pending if not f.done()]
+        _pending.append(future)
+    return future
+
+
+def submit(func, *args, **kwargs):
+    """
+    Queues one render / logging call on the artifact pool.
+    """
+    return _track(_render_pool().submit(func, *args, **kwargs))
+
+
+def _copy_outputs(first, source, destination):
+    first.result()  # submitted earlier, so already running or done
+    for suffix in OUTPUT_SUFFIXES:
+        if os.path.exists(source + suffix):
+            shutil.copyfile(source + suffix, destination + suffix)
+
+
+def submit_shared(kind, key, render, filename):
+    """
+    Queues render(filename) unless the same kind of artifact was already rendered for this key,
+    in which case the earlier output files are copied to filename instead.
+    """
+    pool = _render_pool()
+    with _lock:
+        first = _shared.get((kind, key))
+        if first is None:
+            future = pool.submit(render, filename)
+            _shared[(kind, key)] = (future, filename)
+            if len(_shared) > SHARED_RENDERS:
+                _shared.popitem(last=False)
+        else:
+            _shared.move_to_end((kind, key))
+    if first is None:
+        return _track(future)
+    return submit(_copy_outputs, first[0], first[1], filename)
+
+
+def wait_for_artifacts():
+    """
+    Blocks until every queued render has finished.
+    """
+    with _lock:
+        pending = list(_pending)
+        _pending.clear()
+    for future in pending:
+        future.exception()
@@ -0,0 +1,128 @@
+import os
+import sys
+import copy
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Set in each pool worker by _init_batch_worker - multiprocessing Events can only be shared through inheritance
+_cancel_token = None
+
+
+def final_cost_from_history(history, final_step, config_dict, stopped=False):
+    """
+    Final cost of a run as reported by the batch windows - 0 if the run stopped early (target reached),
+    otherwise the last logged cost. Runs stopped through a cancellation token report their last logged cost.
+    """
+    if isinstance(history, list) and history:
+        max_steps = config_dict.get("max_gens", config_dict.get("max_iterations", float('inf')))
+        return 0 if final_step + 1 < max_steps and not stopped else history[-1]
+    return float("inf")
+
+
+def run_single_experiment(exp_name, run_number, config_dict, target=None, cancel_token=None):
+    """
+    Runs one experiment repetition - executed inside a pool worker process.
+    Returns (exp_name, run_number, final_cost, elapsed); final_cost is None if the batch was cancelled
+    before this run started.
+    """
+    from src.experiments.run_experiment import main as run_experiment_main
+
+    cancel_token = cancel_token if cancel_token is not None else _cancel_token
+    if cancel_token is not None and cancel_token.cancelled:
+        return exp_name, run_number, None, 0.0
+
+    config_copy = copy.deepcopy(config_dict)
+    config_copy["experiment_name"] = exp_name
+    config_copy["is_batch"] = True
+
+    history, final_net, elapsed, final_step = run_experiment_main(
+        config_copy, show_full_plot=False, target=target, cancel_token=cancel_token,
+        run_key=(exp_name, run_number)  # repetitions share a config - each resumes only its own checkpoint
+    )
+
+    stopped = cancel_token is not None and cancel_token.cancelled
+    return exp_name, run_number, final_cost_from_history(history, final_step, config_dict, stopped), elapsed
+
+
+def load_targets(config_list):
+    """
+    Parses each distinct target network in config_list once, keyed by load_network_path.
+    """
+    from src.experiments.run_experiment import TargetNetwork
+
+    targets = {}
+    for _, _, config_dict in config_list:
+        path = config_dict.get("load_network_path")
+        if path and path not in targets:
+            targets[path] = TargetNetwork.from_file(path, name=config_dict.get("network_name"))
+    return targets
+
+
+def _redirect_stdout_to_stderr():
+    """
+    Pool initializer for headless runs - engine chatter goes to stderr so stdout stays machine-readable.
+    """
+    sys.stdout = sys.stderr
+
+
+def _init_batch_worker(cancel_token, log_to_stderr):
+    global _cancel_token
+    _cancel_token = cancel_token
+    if log_to_stderr:
+        _redirect_stdout_to_stderr()
+
+
+def run_batch(config_list, workers=None, on_start=None, on_result=None, on_failure=None, log_to_stderr=False,
+              cancel_token=None):
+    """
+    Dispatches every (experiment, repetition) in config_list to a pool of worker processes and reports
+    results as they complete, not in submission order.
+
+    config_list: list of (experiment_name, num_runs, config_dict) tuples.
+    Callbacks: on_start(exp_name, run_number, num_runs), on_result(exp_name, run_number, final_cost, elapsed),
+    on_failure(exp_name, run_number, traceback_str).
+    log_to_stderr: send the workers' console output to stderr (used by the command-line runner).
+    cancel_token: optional CancellationToken created with a multiprocessing context. Cancelling it stops the
+    running runs (each is still logged with its best-so-far network) and skips the queued ones; pausing it
+    pauses every running run.
+    """
+    jobs = [
+        (exp_name, run_index + 1, num_runs, config_dict)
+        for exp_name, num_runs, config_dict in config_list
+        for run_index in range(num_runs)
+    ]
+    if not jobs:
+        return
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    targets = load_targets(config_list)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(cancel_token, log_to_stderr)) as pool:
+        futures = {}
+        for exp_name, run_number, num_runs, config_dict in jobs:
+            future = pool.submit(
+                run_single_experiment, exp_name, run_number, config_dict,
+                targets.get(config_dict.get("load_network_path"))
+            )
+            futures[future] = (exp_name, run_number)
+            if on_start:
+                on_start(exp_name, run_number, num_runs)
+
+        for future in as_completed(futures):
+            if cancel_token is not None and cancel_token.cancelled:
+                for pending in futures:
+                    pending.cancel()  # only affects runs that have not started
+            if future.cancelled():
+                continue
+            exp_name, run_number = futures[future]
+            try:
+                _, _, final_cost, elapsed = future.result()
+            except Exception:
+                if on_failure:
+                    on_failure(exp_name, run_number, traceback.format_exc())
+                continue
+            if final_cost is None:
+                continue  # cancelled before it started
+            if on_result:
+                on_result(exp_name, run_number, final_cost, elapsed)
@@ -0,0 +1,141 @@
+"""
+Headless command-line runner for experiments and batches.
+
+    python -m src.experiments CONFIG_OR_DIR [CONFIG_OR_DIR ...] [--runs N] [--workers W] [--output DIR] [--plots]
+
+Each YAML config (or every *.yaml in a given directory) is run --runs times. Progress is printed to stdout as
+one JSON object per line (events: start, result, failure, done); the engine's own console output goes to stderr.
+PySide6 and matplotlib are never imported unless --plots is given.
+"""
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import traceback
+import contextlib
+from datetime import datetime
+
+import yaml
+
+
+def emit(event, **fields):
+    """
+    Prints one machine-readable progress line to stdout.
+    """
+    print(json.dumps({"event": event, **fields}, default=str), file=sys.__stdout__, flush=True)
+
+
+def collect_config_paths(paths):
+    config_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            config_paths.extend(sorted(glob.glob(os.path.join(path, "*.yaml")) + glob.glob(os.path.join(path, "*.yml"))))
+        elif os.path.isfile(path):
+            config_paths.append(path)
+        else:
+            raise FileNotFoundError(f"Config file or directory '{path}' not found.")
+    return config_paths
+
+
+def build_config_list(config_paths, runs, output_dir, plots):
+    """
+    Loads each config and prepares it for batch mode: (experiment_name, runs, config_dict) tuples.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    config_list = []
+    for path in config_paths:
+        with open(path, "r") as f:
+            config = yaml.safe_load(f)
+
+        name = config.get("experiment_name") or os.path.splitext(os.path.basename(path))[0]
+        base_dir = output_dir or os.path.join("experiment_results", name)
+        config["batch_output_dir"] = os.path.join(base_dir, f"batch_{timestamp}")
+        config["is_batch"] = True
+        if not plots:
+            config["plot_progress"] = False
+        os.makedirs(config["batch_output_dir"], exist_ok=True)
+        config_list.append((name, runs, config))
+    return config_list
+
+
+def run_in_process(config_list):
+    """
+    Serial fallback (--workers 1): runs everything in this process, no pool start-up cost.
+    """
+    from src.experiments.batch_runner import run_single_experiment, load_targets
+    from src.experiments.artifact_renderer import wait_for_artifacts
+
+    targets = load_targets(config_list)
+    completed, failed = 0, 0
+    for exp_name, num_runs, config in config_list:
+        for run_number in range(1, num_runs + 1):
+            emit("start", experiment=exp_name, run=run_number, runs=num_runs)
+            try:
+                _, _, final_cost, elapsed = run_single_experiment(
+                    exp_name, run_number, config, targets.get(config.get("load_network_path"))
+                )
+            except Exception:
+                failed += 1
+                emit("failure", experiment=exp_name, run=run_number, error=traceback.format_exc())
+                continue
+            completed += 1
+            emit("result", experiment=exp_name, run=run_number, final_cost=final_cost, elapsed=elapsed)
+    # Pool workers finish their queued renders before exiting; here they would outlive the "done" event
+    wait_for_artifacts()
+    return completed, failed
+
+
+def run_in_pool(config_list, workers):
+    from src.experiments.batch_runner import run_batch
+
+    counts = {"completed": 0, "failed": 0}
+
+    def on_result(exp_name, run_number, final_cost, elapsed):
+        counts["completed"] += 1
+        emit("result", experiment=exp_name, run=run_number, final_cost=final_cost, elapsed=elapsed)
+
+    def on_failure(exp_name, run_number, traceback_str):
+        counts["failed"] += 1
+        emit("failure", experiment=exp_name, run=run_number, error=traceback_str)
+
+    run_batch(
+        config_list,
+        workers=workers,
+        on_start=lambda exp_name, run_number, num_runs: emit("start", experiment=exp_name, run=run_number, runs=num_runs),
+        on_result=on_result,
+        on_failure=on_failure,
+        log_to_stderr=True,
+    )
+    return counts["completed"], counts["failed"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.experiments",
+        description="Run BN Forge inference experiments without the GUI."
+    )
+    parser.add_argument("configs", nargs="+", help="YAML config file(s) or directories of configs")
+    parser.add_argument("--runs", type=int, default=1, help="repetitions per config (default 1)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default CPU count; 1 runs serially in this process)")
+    parser.add_argument("--output", default=None,
+                        help="results root (default experiment_results/<experiment name>)")
+    parser.add_argument("--plots", action="store_true", help="save matplotlib progress plots (imports matplotlib)")
+    args = parser.parse_args(argv)
+
+    config_list = build_config_list(collect_config_paths(args.configs), args.runs, args.output, args.plots)
+    total = sum(num_runs for _, num_runs, _ in config_list)
+    workers = args.workers or os.cpu_count() or 1
+
+    start_time = time.time()
+    with contextlib.redirect_stdout(sys.stderr):
+        if workers == 1 or total == 1:
+            completed, failed = run_in_process(config_list)
+        else:
+            completed, failed = run_in_pool(config_list, workers)
+
+    emit("done", total=total, completed=completed, failed=failed, elapsed=time.time() - start_time,
+         batch_dirs=sorted({config["batch_output_dir"] for _, _, config in config_list}))
+    return 1 if failed else 0
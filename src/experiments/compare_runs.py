@@ -1,88 +1,201 @@
 #!/usr/bin/env python3
+"""
+Compare experiment runs recorded in the results database.
+
+    python -m src.experiments.compare_runs [--batch DIR] [--network NAME] [--group-by experiment] [--threshold 0]
+    python -m src.experiments.compare_runs --index experiment_results   # backfill run folders not yet in the database
+
+Run metadata and final metrics come from the indexed runs/metrics tables; cost series are packed
+binary arrays read straight into numpy, and per-group statistics (median, IQR, time-to-threshold, success rate)
+are computed in one pass.
+"""
 import os
 import csv
-import yaml
-import matplotlib.pyplot as plt
-
-results_dir = "results"
-run_dirs = sorted([d for d in os.listdir(results_dir) if d.startswith("run_")])
-
-cost_series = []
-match_series = []
-labels = []
-summary_rows = []
-
-for run in run_dirs:
-    csv_path = os.path.join(results_dir, run, "metrics.csv")
-    config_path = None
-    for root, _, files in os.walk(""):
-        for file in files:
-            if file.endswith(".yaml") and run.split("_")[-1] in file:
-                config_path = os.path.join(root, file)
-                break
-
-    if not os.path.exists(csv_path):
-        continue
-
-    iterations, costs, matched = [], [], []
-    with open(csv_path, 'r') as f:
-        next(f)
-        for row in csv.reader(f):
-            i, c, _, m = row
-            iterations.append(int(i))
-            costs.append(float(c))
-            matched.append(int(m))
-
-    max_iter = max(iterations)
-    norm_iter = [i / max_iter for i in iterations]
-    label = run
-    try:
-        if config_path and os.path.exists(config_path):
-            with open(config_path) as cf:
-                config = yaml.safe_load(cf)
-                label = f"{run} | n={config.get('entity_count')} | {config.get('cost_function')} | {config.get('mutation_function')}"
-    except:
-        pass
-
-    best_cost = min(costs)
-    iter_to_best = iterations[costs.index(best_cost)]
-    max_match = max(matched)
-
-    summary_rows.append([run, best_cost, iter_to_best, max_match, len(matched)])
-
-    cost_series.append((norm_iter, costs))
-    match_series.append((norm_iter, matched))
-    labels.append(label)
-
-# Plot normalised cost comparison
-plt.figure(figsize=(10, 5))
-for (x, y), label in zip(cost_series, labels):
-    plt.plot(x, y, label=label)
-plt.xlabel("Normalised Iteration")
-plt.ylabel("Cost")
-plt.title("Cost Over Normalised Time")
-plt.legend(fontsize='small')
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("results/comparison_cost_progress.png")
-plt.close()
-
-# Plot normalised attractor match comparison
-plt.figure(figsize=(10, 5))
-for (x, y), label in zip(match_series, labels):
-    plt.plot(x, y, label=label)
-plt.xlabel("Normalised Iteration")
-plt.ylabel("Matched Attractors")
-plt.title("Attractor Match Over Normalised Time")
-plt.legend(fontsize='small')
-plt.grid(True)
-plt.tight_layout()
-plt.savefig("results/comparison_attractor_matches.png")
-plt.close()
-
-# Write summary CSV
-summary_path = os.path.join(results_dir, "summary_metrics.csv")
-with open(summary_path, 'w', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(["Run", "Best Cost", "Iteration to Best", "Max Attractors Matched", "Total Iterations"])
-    writer.writerows(summary_rows)
+import json
+import argparse
+
+import numpy as np
+
+from src.experiments.results_store import DEFAULT_DB_PATH, get_store
+
+GROUP_KEYS = {
+    "experiment": lambda run: run["experiment_name"] or run["metaheuristic"],
+    "metaheuristic": lambda run: run["metaheuristic"],
+    "network": lambda run: run["network_name"],
+    "config": lambda run: f"config_{run['config_id']}",
+    "batch": lambda run: os.path.basename(run["batch_dir"] or ""),
+}
+
+
+def load_cost_arrays(store, run_ids):
+    """
+    Returns {run_id: (steps, costs)} as numpy arrays, decoded directly from the packed series blobs.
+    """
+    return {
+        run_id: (np.frombuffer(steps, dtype=np.int64).astype(float), np.frombuffer(costs, dtype=np.float64))
+        for run_id, (steps, costs) in store.cost_series(run_ids).items()
+    }
+
+
+def time_to_threshold(steps, costs, threshold):
+    """
+    First step at which the cost is at or below threshold, or NaN if never reached.
+    """
+    hits = np.flatnonzero(costs <= threshold)
+    return steps[hits[0]] if hits.size else np.nan
+
+
+def aggregate(runs, series, threshold=0.0, group_by="experiment"):
+    """
+    Per-group statistics across runs: median/IQR of final and best cost, median steps to reach the
+    threshold (over runs that reached it), success rate and median runtime.
+    """
+    key = GROUP_KEYS[group_by]
+    groups = {}
+    for run in runs:
+        groups.setdefault(key(run), []).append(run)
+
+    rows = []
+    for group, group_runs in groups.items():
+        final = np.array([r["final_cost"] for r in group_runs if r["final_cost"] is not None], dtype=float)
+        best = np.array([r["best_cost"] for r in group_runs if r["best_cost"] is not None], dtype=float)
+        runtimes = np.array([r["time_taken"] for r in group_runs if r["time_taken"] is not None], dtype=float)
+        ttt = np.array([time_to_threshold(*series[r["id"]], threshold) for r in group_runs], dtype=float)
+        reached = ttt[~np.isnan(ttt)]
+
+        final_q = np.percentile(final, [25, 50, 75]) if final.size else [np.nan] * 3
+        best_q = np.percentile(best, [25, 50, 75]) if best.size else [np.nan] * 3
+        rows.append({
+            "group": group,
+            "runs": len(group_runs),
+            "median_final_cost": final_q[1],
+            "iqr_final_cost": final_q[2] - final_q[0],
+            "median_best_cost": best_q[1],
+            "iqr_best_cost": best_q[2] - best_q[0],
+            "success_rate": reached.size / len(group_runs),
+            "median_steps_to_threshold": np.median(reached) if reached.size else np.nan,
+            "median_runtime": np.median(runtimes) if runtimes.size else np.nan,
+        })
+    return rows
+
+
+def index_run_dirs(store, root):
+    """
+    Backfills run folders under root that are not in the database yet (runs logged before it existed),
+    reading parameters_summary.txt, time_taken.txt and cost_log.csv.
+    """
+    added = 0
+    for dirpath, dirnames, files in os.walk(root):
+        if "cost_log.csv" not in files or "parameters_summary.txt" not in files:
+            continue
+        dirnames[:] = []  # run folders only contain graphs below them
+        if store.has_run(dirpath):
+            continue
+
+        try:
+            with open(os.path.join(dirpath, "parameters_summary.txt")) as f:
+                config = json.load(f)
+            data = np.loadtxt(os.path.join(dirpath, "cost_log.csv"), delimiter=",", skiprows=1, usecols=(0, 1),
+                              ndmin=2)
+            time_taken = None
+            if "time_taken.txt" in files:
+                with open(os.path.join(dirpath, "time_taken.txt")) as f:
+                    time_taken = float(f.readline().split()[0])
+        except Exception as e:
+            print(f"⚠️ Skipping {dirpath}: {e}")
+            continue
+
+        if not data.size:
+            continue
+        config.setdefault("batch_output_dir", os.path.dirname(dirpath) if config.get("is_batch") else None)
+        steps, costs = data[:, 0], data[:, 1]
+        store.record_run(
+            dirpath, config,
+            best_cost=float(costs.min()),
+            final_cost=float(costs[-1]),
+            final_step=int(steps[-1]),
+            time_taken=time_taken,
+            steps=steps,
+            costs=costs,
+            entity_count=len(config.get("rules", {})) or None
+        )
+        added += 1
+    return added
+
+
+def plot_groups(runs, series, group_by, out_path, points=500):
+    """
+    Median cost curve with IQR band per group, on a normalised step axis.
+    """
+    import matplotlib.pyplot as plt
+
+    key = GROUP_KEYS[group_by]
+    grid = np.linspace(0, 1, points)
+    curves = {}
+    for run in runs:
+        steps, costs = series[run["id"]]
+        if steps.size:
+            span = max(steps[-1], 1)
+            curves.setdefault(key(run), []).append(np.interp(grid, steps / span, costs))
+
+    plt.figure(figsize=(10, 5))
+    for group, group_curves in curves.items():
+        q25, median, q75 = np.percentile(np.vstack(group_curves), [25, 50, 75], axis=0)
+        plt.plot(grid, median, label=f"{group} (n={len(group_curves)})")
+        plt.fill_between(grid, q25, q75, alpha=0.2)
+    plt.xlabel("Normalised Iteration")
+    plt.ylabel("Cost (median, IQR band)")
+    plt.title("Cost Over Normalised Time")
+    plt.legend(fontsize='small')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig(out_path)
+    plt.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare experiment runs recorded in the results database.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="results database path")
+    parser.add_argument("--index", default=None, metavar="DIR", help="first add run folders under DIR not yet indexed")
+    parser.add_argument("--batch", default=None, help="only runs from this batch directory")
+    parser.add_argument("--network", default=None, help="only runs on this target network")
+    parser.add_argument("--metaheuristic", default=None, help="only runs of this metaheuristic")
+    parser.add_argument("--group-by", default="experiment", choices=sorted(GROUP_KEYS))
+    parser.add_argument("--threshold", type=float, default=0.0, help="cost counted as solved (default 0)")
+    parser.add_argument("--output", default=None, help="write summary CSV (and plot with --plot) to this directory")
+    parser.add_argument("--plot", action="store_true", help="save a median/IQR cost plot per group")
+    args = parser.parse_args(argv)
+
+    store = get_store(args.db)
+    if args.index:
+        print(f"✅ Indexed {index_run_dirs(store, args.index)} new runs from {args.index}")
+
+    runs = store.runs(batch_dir=args.batch, network_name=args.network, metaheuristic=args.metaheuristic)
+    if not runs:
+        print("⚠️ No matching runs in the results database.")
+        return []
+
+    series = load_cost_arrays(store, (run["id"] for run in runs))
+    rows = aggregate(runs, series, threshold=args.threshold, group_by=args.group_by)
+
+    headers = list(rows[0])
+    print(" | ".join(headers))
+    for row in rows:
+        print(" | ".join(f"{v:.4g}" if isinstance(v, float) else str(v) for v in row.values()))
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        summary_path = os.path.join(args.output, "summary_metrics.csv")
+        with open(summary_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"✅ Summary saved to {summary_path}")
+        if args.plot:
+            plot_groups(runs, series, args.group_by, os.path.join(args.output, "comparison_cost_progress.png"))
+
+    return rows
+
+
+if __name__ == "__main__":
+    main()
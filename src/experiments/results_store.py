@@ -0,0 +1,233 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from array import array
+
+DEFAULT_DB_PATH = os.path.join("experiment_results", "results.db")
+
+# Cost series are stored decimated to at most this many points per run
+SERIES_MAX_POINTS = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS configs (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    config_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_dir TEXT NOT NULL UNIQUE,
+    batch_dir TEXT,
+    experiment_name TEXT,
+    network_name TEXT,
+    metaheuristic TEXT,
+    config_id INTEGER REFERENCES configs(id),
+    entity_count INTEGER,
+    created_at REAL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+    best_cost REAL,
+    final_cost REAL,
+    final_step INTEGER,
+    time_taken REAL
+);
+CREATE TABLE IF NOT EXISTS cost_series (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+    points INTEGER NOT NULL,
+    steps BLOB NOT NULL,         -- array('q') bytes
+    costs BLOB NOT NULL,         -- array('d') bytes
+    temperatures BLOB            -- array('d') bytes, NaN where not recorded
+);
+CREATE INDEX IF NOT EXISTS idx_runs_batch ON runs(batch_dir);
+CREATE INDEX IF NOT EXISTS idx_runs_network ON runs(network_name, metaheuristic);
+CREATE INDEX IF NOT EXISTS idx_runs_config ON runs(config_id);
+"""
+
+# SQLite bound-parameter limit is 999 on older builds
+QUERY_CHUNK = 900
+
+_connections = {}
+
+
+def normalise_path(path):
+    return os.path.abspath(path) if path else None
+
+
+def get_store(db_path=DEFAULT_DB_PATH):
+    """
+    Returns this process's ResultsStore for db_path - one pooled connection per database per process
+    (pool workers each get their own after fork/spawn).
+    """
+    key = (normalise_path(db_path), os.getpid())
+    store = _connections.get(key)
+    if store is None:
+        store = ResultsStore(db_path)
+        _connections[key] = store
+    return store
+
+
+def decimate_series(steps, costs, temperatures=None, max_points=SERIES_MAX_POINTS):
+    """
+    Keeps every k-th point (plus the last) so at most ~max_points are stored per run.
+    Returns packed (steps, costs, temperatures) arrays.
+    """
+    count = len(costs)
+    stride = max(1, -(-count // max_points))
+    indices = list(range(0, count, stride))
+    if count and indices[-1] != count - 1:
+        indices.append(count - 1)
+
+    temperatures = temperatures if temperatures is not None else ()
+    nan = float('nan')
+    return (
+        array('q', (int(steps[i]) for i in indices)),
+        array('d', (float(costs[i]) for i in indices)),
+        array('d', (float(temperatures[i]) if i < len(temperatures) and temperatures[i] is not None else nan
+                    for i in indices)),
+    )
+
+
+def unpack_series(steps_blob, costs_blob):
+    steps, costs = array('q'), array('d')
+    steps.frombytes(steps_blob)
+    costs.frombytes(costs_blob)
+    return steps, costs
+
+
+class ResultsStore:
+    """
+    SQLite database of experiment runs: configs, final metrics and decimated cost series.
+    Opened in WAL mode so batch worker processes can write while the GUI reads.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+
+    def _insert_series(self, run_id, series):
+        steps, costs, temperatures = series
+        self.connection.execute(
+            "INSERT OR REPLACE INTO cost_series (run_id, points, steps, costs, temperatures) VALUES (?, ?, ?, ?, ?)",
+            (run_id, len(steps), steps.tobytes(), costs.tobytes(), temperatures.tobytes())
+        )
+
+    def close(self):
+        self.connection.close()
+        _connections.pop((normalise_path(self.db_path), os.getpid()), None)
+
+    # Writing
+
+    def _config_id(self, config):
+        config_json = json.dumps(config, sort_keys=True, default=str)
+        fingerprint = hashlib.sha1(config_json.encode("utf-8")).hexdigest()
+        self.connection.execute(
+            "INSERT OR IGNORE INTO configs (fingerprint, config_json) VALUES (?, ?)", (fingerprint, config_json)
+        )
+        return self.connection.execute("SELECT id FROM configs WHERE fingerprint = ?", (fingerprint,)).fetchone()[0]
+
+    def record_run(self, run_dir, config, best_cost, final_cost, final_step, time_taken, steps, costs,
+                   temperatures=None, entity_count=None):
+        """
+        Writes one finished run (config, metrics and decimated cost series) in a single transaction.
+        Re-recording the same run_dir replaces the previous entry.
+        """
+        series = decimate_series(steps, costs, temperatures)
+        with self.connection:
+            config_id = self._config_id(config)
+            self.connection.execute("DELETE FROM runs WHERE run_dir = ?", (normalise_path(run_dir),))
+            cursor = self.connection.execute(
+                "INSERT INTO runs (run_dir, batch_dir, experiment_name, network_name, metaheuristic, config_id, "
+                "entity_count, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalise_path(run_dir),
+                    normalise_path(config.get("batch_output_dir")),
+                    config.get("experiment_name"),
+                    config.get("network_name"),
+                    config.get("metaheuristic"),
+                    config_id,
+                    entity_count,
+                    time.time(),
+                )
+            )
+            run_id = cursor.lastrowid
+            self.connection.execute(
+                "INSERT INTO metrics (run_id, best_cost, final_cost, final_step, time_taken) VALUES (?, ?, ?, ?, ?)",
+                (run_id, best_cost, final_cost, final_step, time_taken)
+            )
+            self._insert_series(run_id, series)
+        return run_id
+
+    # Queries
+
+    def has_run(self, run_dir):
+        return self.connection.execute(
+            "SELECT 1 FROM runs WHERE run_dir = ?", (normalise_path(run_dir),)
+        ).fetchone() is not None
+
+    def runs(self, batch_dir=None, network_name=None, metaheuristic=None):
+        """
+        Returns run rows (dicts with run metadata and final metrics), optionally filtered.
+        """
+        clauses, params = [], []
+        if batch_dir is not None:
+            clauses.append("r.batch_dir = ?")
+            params.append(normalise_path(batch_dir))
+        if network_name is not None:
+            clauses.append("r.network_name = ?")
+            params.append(network_name)
+        if metaheuristic is not None:
+            clauses.append("r.metaheuristic = ?")
+            params.append(metaheuristic)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        cursor = self.connection.execute(
+            "SELECT r.id, r.run_dir, r.batch_dir, r.experiment_name, r.network_name, r.metaheuristic, r.config_id, "
+            "r.entity_count, r.created_at, m.best_cost, m.final_cost, m.final_step, m.time_taken "
+            f"FROM runs r LEFT JOIN metrics m ON m.run_id = r.id {where} ORDER BY r.id",
+            params
+        )
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def config(self, config_id):
+        row = self.connection.execute("SELECT config_json FROM configs WHERE id = ?", (config_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def cost_series(self, run_ids):
+        """
+        Returns {run_id: (steps, costs)} as array('q')/array('d') for the given runs.
+        Each run's series is a single packed row, so this is one bulk read per chunk of runs.
+        """
+        run_ids = list(run_ids)
+        series = {run_id: (array('q'), array('d')) for run_id in run_ids}
+        for i in range(0, len(run_ids), QUERY_CHUNK):
+            chunk = run_ids[i:i + QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for run_id, steps_blob, costs_blob in self.connection.execute(
+                f"SELECT run_id, steps, costs FROM cost_series WHERE run_id IN ({placeholders})", chunk
+            ):
+                series[run_id] = unpack_series(steps_blob, costs_blob)
+        return series
+
+    def batch_summary(self, batch_dir, success_threshold=0.01):
+        """
+        Aggregate final metrics per experiment in a batch, computed in SQL.
+        """
+        cursor = self.connection.execute(
+            "SELECT r.experiment_name, COUNT(*), AVG(m.final_cost), MIN(m.final_cost), MAX(m.final_cost), "
+            "AVG(m.time_taken), SUM(m.final_cost <= ?) "
+            "FROM runs r JOIN metrics m ON m.run_id = r.id WHERE r.batch_dir = ? GROUP BY r.experiment_name",
+            (success_threshold, normalise_path(batch_dir))
+        )
+        columns = ["experiment_name", "runs", "mean_cost", "min_cost", "max_cost", "mean_runtime", "success_count"]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -1,72 +1,167 @@
 # experiments/run_experiment.py
 import yaml
-import math
+import copy
 import random
 import os
 from datetime import datetime
 import json
 import itertools
 import time
+from functools import partial
 
 from src.inference_engine.cost_functions.hamming_distance import calculate_hamming_distance
-from src.inference_engine.cost_functions.attractor_difference import attractor_difference_cost
+from src.inference_engine.cost_functions.attractor_difference import attractor_difference_cost, attractor_trace_cost
 from src.inference_engine.mutation_strategies.flip_mutation import flip_bit
 from src.inference_engine.mutation_strategies.edame_mutation import edame_mutation
-from src.inference_engine.mutation_strategies.mutation_utils import replace_entities_with_state
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
 from src.inference_engine.metaheuristics.genetic_algorithm import genetic_algorithm
-from src.inference_engine.metaheuristics.simulated_annealing import simulated_annealing, TemperatureSchedule
+from src.inference_engine.metaheuristics.island_genetic_algorithm import island_genetic_algorithm
+from src.inference_engine.metaheuristics.simulated_annealing import simulated_annealing, TemperatureSchedule, metropolis_acceptance
+from src.inference_engine.metaheuristics.parallel_tempering import parallel_tempering
+from src.inference_engine.metaheuristics.multi_start import multi_start_simulated_annealing
+from src.inference_engine.metaheuristics.telemetry import TelemetryRecorder
+from src.inference_engine.metaheuristics.profiling import PhaseProfiler
+from src.inference_engine.metaheuristics.checkpoint import Checkpointer, config_fingerprint, claim_latest_checkpoint
 
 from src.boolean_network_representation.network import BooleanNetwork
 from src.boolean_network_representation import rules
 from src.boolean_network_representation.rules import TruthTableToRules
 from src.experiments.save_experiment_summary import save_experiment_summary
+from src.experiments.results_store import DEFAULT_DB_PATH, get_store
+from src.experiments import artifact_renderer
+from src.boolean_network_representation.state_space import transitions_key
 
 
-def log_attractors(network, label, log_dir):
-    attractors = network.detect_attractors()
+def log_attractors(network, label, log_dir, attractors=None):
+    if attractors is None:
+        attractors = network.detect_attractors()
     filepath = os.path.join(log_dir, f"{label}_attractors.txt")
     with open(filepath, 'w') as f:
         for i, cycle in enumerate(attractors):
             f.write(f"Attractor {i+1}: {' -> '.join(cycle)}\n")
 
 
-def main(config_path, progress_callback=None, show_full_plot=True):
+def flip_bit_mutation(network, current_trace, entities):
+    """
+    Module-level flip_bit adapter with the (network, trace) mutation signature - picklable via functools.partial.
+    """
+    return flip_bit(current_trace, entities)
+
+
+def picklable_cost_function(config, target_attractors):
+    """
+    Cost function that can be sent to worker processes. The attractor cost is computed from the candidate trace
+    rather than closing over a network object.
+    """
+    if config['cost_function'] == 'attractor':
+        return partial(
+            attractor_trace_cost,
+            target_attractors=target_attractors,
+            weight_missing=config.get('weight_missing', 1.0),
+            weight_extra=config.get('weight_extra', 1.0)
+        )
+    return calculate_hamming_distance
+
+
+class TargetNetwork:
+    """
+    A target truth table parsed once, with everything derived from it that a run needs
+    (entities, the desired network, its attractors and readable rules). Picklable, so a batch
+    can load the target once and hand it to every run and worker process.
+    """
+
+    def __init__(self, desired_trace, name=None):
+        self.name = name
+        self.desired_trace = {k: v if isinstance(v, list) else list(v) for k, v in desired_trace.items()}
+        self.entity_count = len(next(iter(self.desired_trace)))
+        self.entities = [f'N{i + 1}' for i in range(self.entity_count)]
+
+        self.desired_network = BooleanNetwork(self.entity_count, rule_source="manual")
+        rules_dict = rules.TruthTableToRules.convert(self.desired_trace, self.entities)
+        self.desired_network.current_rules = build_rules(rules_dict, self.entities)
+
+        self.target_attractors = self.desired_network.detect_attractors()
+        self.readable_rules = TruthTableToRules.convert(
+            self.desired_trace,
+            self.entities,
+            minimise=True,
+            readable=True
+        )
+
+    @classmethod
+    def from_file(cls, path, name=None):
+        """
+        Loads a flat truth table JSON, or a saved network file with a "truth_table" key.
+        """
+        with open(path, 'r') as jf:
+            data = json.load(jf)
+        trace = data.get("truth_table", data)
+        return cls(trace, name=name or os.path.splitext(os.path.basename(path))[0])
+
+
+def record_run(db_path, run_dir, config, best_cost, history, final_step, time_taken, telemetry,
+               temperature_log, entity_count):
+    if telemetry.count:
+        steps, costs, temperatures = telemetry.steps, telemetry.costs, telemetry.temperatures
+    else:
+        steps, costs, temperatures = range(len(history)), history, temperature_log
+    get_store(db_path).record_run(
+        run_dir, config,
+        best_cost=best_cost,
+        final_cost=history[-1] if history else best_cost,
+        final_step=final_step,
+        time_taken=time_taken,
+        steps=steps,
+        costs=costs,
+        temperatures=temperatures,
+        entity_count=entity_count
+    )
+
+
+def load_config(config):
+    """
+    Accepts a YAML path or an already-parsed config dict (copied, so the caller's dict is never modified).
+    """
+    if isinstance(config, dict):
+        return copy.deepcopy(config)
+    with open(config, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def main(config, progress_callback=None, show_full_plot=True, target=None, profiler=None, cancel_token=None,
+         run_key=None, telemetry=None):
+    """
+    Runs one experiment.
+
+    config: path to a YAML config or a config dict.
+    target: optional TargetNetwork (or flat truth table dict) - if omitted it is loaded from config["load_network_path"].
+    profiler: optional PhaseProfiler to fill with per-phase SA/GA timings (one is created when config "profile" is on).
+    cancel_token: optional CancellationToken to stop or pause the search (SA, GA, PT; island GA stop only).
+    A stopped run is finished and logged with its best-so-far network; paused time is not counted.
+    telemetry: optional TelemetryRecorder to record the SA cost telemetry into, e.g. to read the recorded step
+    numbers of the (decimated) history afterwards (one is created from config "telemetry" otherwise).
+    run_key: identity of this run among identical ones (batches pass (experiment, repetition)) - it only resumes
+    checkpoints written under the same key.
+    """
     start_time = time.time()
+    # Tokens can outlive a run (one per batch worker process), so only this run's pauses are subtracted
+    paused_before = cancel_token.paused_time if cancel_token is not None else 0.0
 
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config(config)
 
     # 1. Load target truth table
-    with open(config["load_network_path"], 'r') as jf:
-        loaded_trace = json.load(jf)
-        sample_key = next(iter(loaded_trace))
-        entity_count = len(sample_key)
-        entities = [f'N{i + 1}' for i in range(entity_count)]
-        desired_trace = {k: v for k, v in loaded_trace.items()}
-
-    desired_network = BooleanNetwork(entity_count, rule_source="manual")
-    rules_dict = rules.TruthTableToRules.convert(desired_trace, entities)
-    formatted_rules = {
-        entity: replace_entities_with_state(rule, entities)
-        for entity, rule in rules_dict.items()
-    }
-    desired_network.current_rules = [
-        eval(f"lambda state, index: int({formatted_rules[entity]})") if formatted_rules[entity] != '0'
-        else (lambda state, index: 0)
-        for entity in entities
-    ]
+    if target is None:
+        target = TargetNetwork.from_file(config["load_network_path"])
+    elif not isinstance(target, TargetNetwork):
+        target = TargetNetwork(target, name=config.get("network_name"))
+
+    entity_count = target.entity_count
+    entities = target.entities
+    desired_trace = target.desired_trace
+    desired_network = target.desired_network
 
     # 2. Attractors (if needed)
-    target_attractors = desired_network.detect_attractors()
-    #edges for graph
-    desired_attractor_edges = set()
-    desired_attractor_edges = set()
-    for cycle in target_attractors:
-        for i in range(len(cycle)):
-            src = str(cycle[i])  # <-- make sure it's string
-            dst = str(cycle[(i + 1) % len(cycle)])
-            desired_attractor_edges.add((src, dst))
-    # print("[DEBUG] Desired Attractor Edges:", sorted(desired_attractor_edges))
+    target_attractors = target.target_attractors
 
     # Output dir
 
@@ -74,16 +169,44 @@ def main(config_path, progress_callback=None, show_full_plot=True):
     if config.get("is_batch"):
         # Create subfolder per run inside the batch directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        run_dir = os.path.join(config["batch_output_dir"], f"run_{timestamp}")
+        base_dir = config["batch_output_dir"]
+        run_dir = os.path.join(base_dir, f"run_{timestamp}")
     else:
         # Create a unique folder for single run experiments - live_evolution
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         network_path = config.get("load_network_path", "")
         network_filename = os.path.basename(network_path)
-        network_name = config.get("network_name") or os.path.splitext(network_filename)[0]
+        network_name = config.get("network_name") or os.path.splitext(network_filename)[0] or target.name or "network"
         base_dir = os.path.join("experiment_results", network_name)
         run_dir = os.path.join(base_dir, f"run_{timestamp}")
 
+    # Checkpoint / resume (SA and GA) - pick up the latest abandoned run (its owner died) with the same config
+    # and target; runs still in progress hold a RunLock and are never resumed. Config "resume: false" always
+    # starts fresh
+    metaheuristic = config.get('metaheuristic', 'simulated_annealing')
+    checkpointer = None
+    resume_state = None
+    if metaheuristic in ('simulated_annealing', 'genetic_algorithm'):
+        fingerprint = config_fingerprint(config, desired_trace, run_key)
+        run_lock = None
+        # Every batch gets a new timestamped folder, so a restarted batch looks through its sibling batch folders
+        search_dir, pattern, move_to = base_dir, "run_*", None
+        if config.get("is_batch"):
+            search_dir = os.path.dirname(os.path.abspath(base_dir))
+            pattern, move_to = os.path.join("*", "run_*"), base_dir
+        if config.get("resume", True) and os.path.isdir(search_dir):
+            resumed_dir, resume_state, run_lock = claim_latest_checkpoint(search_dir, fingerprint, pattern, move_to)
+            if resumed_dir:
+                print(f"♻️ Resuming from checkpoint in {resumed_dir}")
+                run_dir = resumed_dir
+        default_interval = 10000 if metaheuristic == 'simulated_annealing' else 10
+        checkpointer = Checkpointer(
+            run_dir,
+            interval=config.get("checkpoint_interval", default_interval),
+            metadata={"fingerprint": fingerprint, "metaheuristic": metaheuristic},
+            lock=run_lock,
+        )
+
 
     graphs_dir = os.path.join(run_dir, "graphs")
 
@@ -104,18 +227,12 @@ def main(config_path, progress_callback=None, show_full_plot=True):
 
 
     # Set starting rules
-    net.current_rules = [
-        eval(f"lambda state, index: int({replace_entities_with_state(rule, entities)})")
-        if rule != '0' else (lambda state, index: 0)
-        for rule in random_rules_dict.values()
-    ]
-
-    def wrapped_edame_mutation(network, current_trace):
-        return edame_mutation(network, current_trace, target_attractors)
+    net.current_rules = build_rules(random_rules_dict, entities)
 
+    # partials of module-level functions so the same mutations can be sent to worker processes
     mutation_map = {
-        'flip_bit': lambda net, trace: flip_bit(trace, entities),
-        'edame': wrapped_edame_mutation,
+        'flip_bit': partial(flip_bit_mutation, entities=entities),
+        'edame': partial(edame_mutation, target_attractors=target_attractors),
     }
 
     cost_map = {
@@ -128,8 +245,16 @@ def main(config_path, progress_callback=None, show_full_plot=True):
         )
     }
 
-    metaheuristic = config.get('metaheuristic', 'simulated_annealing')
     temperature_log = None
+    chain_results = None
+    # Per-phase timings for SA/GA (profile: true to turn on)
+    if profiler is None:
+        profiler = PhaseProfiler(enabled=config.get("profile", False))
+    # Optional decimation settings, e.g. telemetry: {every: 10, bucket_size: 1000, max_points: 100000}
+    if telemetry is None:
+        telemetry = TelemetryRecorder(**config.get("telemetry", {}))
+    if resume_state is not None and "telemetry" in resume_state:
+        telemetry.restore(resume_state["telemetry"])
 
     if metaheuristic == 'simulated_annealing':
         temperature = TemperatureSchedule(
@@ -141,7 +266,7 @@ def main(config_path, progress_callback=None, show_full_plot=True):
             desired_trace=desired_trace,
             cost_function=cost_map[config['cost_function']],
             mutation_function=mutation_map[config['mutation_function']],
-            acceptance_function=lambda delta, temp: (delta <= 0 or random.random() < math.exp(-delta / temp)),
+            acceptance_function=metropolis_acceptance,
             temperature_schedule=temperature,
             entities=entities,
             max_iterations=config['max_iterations'],
@@ -149,6 +274,54 @@ def main(config_path, progress_callback=None, show_full_plot=True):
             output_dir=run_dir,
             progress_callback=progress_callback,
             log_results = config.get("log_results", False),
+            plot_progress=config.get("plot_progress", True),
+            telemetry=telemetry,
+            checkpointer=checkpointer,
+            resume_state=resume_state,
+            profiler=profiler,
+            cancel_token=cancel_token,
+        )
+
+    elif metaheuristic == 'parallel_tempering':
+        best_rules, best_cost, history, temperature_log, final_step = parallel_tempering(
+            network=net,
+            desired_trace=desired_trace,
+            cost_function=picklable_cost_function(config, target_attractors),
+            mutation_function=mutation_map[config['mutation_function']],
+            entities=entities,
+            replicas=config.get('replicas'),
+            t_max=config['temperature']['initial'],
+            t_min=config['temperature'].get('minimum', 0.05),
+            max_iterations=config['max_iterations'],
+            swap_interval=config.get('swap_interval', 100),
+            seed=config.get('seed'),
+            log_interval=config.get('log_interval', 250),
+            live_update_interval=config.get('live_update_interval', 1000),
+            output_dir=run_dir,
+            progress_callback=progress_callback,
+            log_results=config.get("log_results", False),
+            plot_progress=config.get("plot_progress", True),
+            telemetry=telemetry,
+            cancel_token=cancel_token,
+        )
+
+    elif metaheuristic == 'multi_start_sa':
+        temperature = TemperatureSchedule(
+            initial_temp=config['temperature']['initial'],
+            cooling_rate=config['temperature']['cooling_rate']
+        )
+        best_rules, best_cost, history, temperature_log, final_step, chain_results = multi_start_simulated_annealing(
+            desired_trace=desired_trace,
+            cost_function=picklable_cost_function(config, target_attractors),
+            mutation_function=mutation_map[config['mutation_function']],
+            temperature_schedule=temperature,
+            entities=entities,
+            starts=config.get('starts', 8),
+            workers=config.get('workers'),
+            max_iterations=config['max_iterations'],
+            log_interval=config.get('log_interval', 250),
+            seed=config.get('seed'),
+            output_dir=run_dir,
         )
 
     elif metaheuristic == 'genetic_algorithm':
@@ -165,11 +338,54 @@ def main(config_path, progress_callback=None, show_full_plot=True):
             output_dir=run_dir,
             live_update_interval=config.get('live_update_interval', 2),
             progress_callback=progress_callback,
-            log_results = config.get("log_results", False)
+            log_results = config.get("log_results", False),
+            plot_progress=config.get("plot_progress", True),
+            checkpointer=checkpointer,
+            resume_state=resume_state,
+            profiler=profiler,
+            cancel_token=cancel_token
+        )
+    elif metaheuristic == 'island_genetic_algorithm':
+        best_rules, best_cost, history, final_step = island_genetic_algorithm(
+            network_class=BooleanNetwork,
+            desired_trace=desired_trace,
+            cost_function=picklable_cost_function(config, target_attractors),
+            mutation_function=mutation_map[config['mutation_function']],
+            entities=entities,
+            pop_size=config.get('pop_size', 50),
+            max_gens=config.get('max_gens', 100),
+            crossover_rate=config.get('crossover_rate', 0.7),
+            mutation_rate=config.get('mutation_rate', 0.01),
+            islands=config.get('islands'),
+            migration_interval=config.get('migration_interval', 10),
+            migration_size=config.get('migration_size', 2),
+            seed=config.get('seed'),
+            output_dir=run_dir,
+            live_update_interval=config.get('live_update_interval', 2),
+            progress_callback=progress_callback,
+            log_results=config.get("log_results", False),
+            plot_progress=config.get("plot_progress", True),
+            cancel_token=cancel_token
         )
     else:
         raise ValueError(f"Unknown metaheuristic '{metaheuristic}'")
 
+    # Search finished - this run should never be resumed again
+    if checkpointer is not None:
+        checkpointer.clear()
+
+    paused_time = 0.0
+    if cancel_token is not None:
+        paused_time = cancel_token.paused_time - paused_before
+        if cancel_token.cancelled:
+            config["stopped_early"] = True  # recorded with the run's config in the summary and results DB
+            print(f"⏹️ Run stopped at step {final_step} - keeping the best network found (cost {best_cost})")
+
+    if profiler.stats:
+        print("\n⏱️ Phase profile:\n" + profiler.format_report())
+        if config.get("log_results", False):
+            profiler.write(run_dir)
+
 
     # Show full-resolution cost plot
     if progress_callback is None and show_full_plot:
@@ -177,13 +393,13 @@ def main(config_path, progress_callback=None, show_full_plot=True):
             import matplotlib.pyplot as plt
             from src.gui.inference.cost_plot_window import CostPlotWindow
 
-            full_steps = list(range(len(history)))  # _ is `history`
+            # SA-family histories may be decimated - use the recorded step numbers
+            full_steps = list(telemetry.steps) if telemetry.count else list(range(len(history)))
             full_window = CostPlotWindow(
                 log_scale=config.get("log_y", False),
                 method=metaheuristic.replace("_", " ").title()
             )
-            for step, cost in enumerate(history):
-                full_window.append(step, cost)
+            full_window.set_history(full_steps, list(history))
 
             full_window.show()
 
@@ -195,23 +411,31 @@ def main(config_path, progress_callback=None, show_full_plot=True):
     # Create new final network and assign the best evolved rules
     final_net = BooleanNetwork(entity_count, rule_source="manual")
     final_net.current_rules = [
-        rule if callable(rule)
-        else eval(f"lambda state, index: int({replace_entities_with_state(rule, entities)})")
-        if rule != '0' else (lambda state, index: 0)
-        for rule in best_rules.values()
+        rule if callable(rule) else build_rules({entity: rule}, entities)[0]
+        for entity, rule in best_rules.items()
     ]
 
+    final_attractors = final_net.detect_attractors()
+
     generate_graphs = config.get("generate_graphs", True)
     if generate_graphs:
 
-        # Generate final graphs and return
-        desired_network.generate_state_graph(filename=os.path.join(graphs_dir, "state_graph_desired"))
-        final_net.generate_state_graph(filename=os.path.join(graphs_dir, "state_graph_final"))
-        desired_network.generate_wiring_diagram(filename=os.path.join(graphs_dir, "wiring_diagram_desired"))
-        final_net.generate_wiring_diagram(filename=os.path.join(graphs_dir, "wiring_diagram_final"))
+        # Graphs render in the background so the next run can start; desired-network renders are
+        # shared by every run on the same target
+        desired_key = transitions_key(desired_trace)
+        artifact_renderer.submit_shared(
+            "state_graph", desired_key, desired_network.generate_state_graph,
+            os.path.join(graphs_dir, "state_graph_desired")
+        )
+        artifact_renderer.submit(final_net.generate_state_graph, os.path.join(graphs_dir, "state_graph_final"))
+        artifact_renderer.submit_shared(
+            "wiring_diagram", desired_key, desired_network.generate_wiring_diagram,
+            os.path.join(graphs_dir, "wiring_diagram_desired")
+        )
+        artifact_renderer.submit(final_net.generate_wiring_diagram, os.path.join(graphs_dir, "wiring_diagram_final"))
 
-        log_attractors(final_net, "final", run_dir)
-        log_attractors(desired_network, "desired", run_dir)
+        artifact_renderer.submit(log_attractors, final_net, "final", run_dir, final_attractors)
+        artifact_renderer.submit(log_attractors, desired_network, "desired", run_dir, target_attractors)
 
     # Format readable Quine-McCluskey BN strings
     final_rules_dict = TruthTableToRules.convert(
@@ -225,13 +449,7 @@ def main(config_path, progress_callback=None, show_full_plot=True):
     }
     final_truth_table = final_net.generate_truth_table()
 
-    desired_rules_dict = TruthTableToRules.convert(
-        desired_trace,
-        entities,
-        minimise=True,
-        readable=True
-    )
-    config["rules"] = desired_rules_dict
+    config["rules"] = target.readable_rules
     if config.get("log_results", False):
         save_experiment_summary(
             run_dir=run_dir,
@@ -239,18 +457,28 @@ def main(config_path, progress_callback=None, show_full_plot=True):
             best_rules=best_rules,
             best_cost=best_cost,
             cost_progress=history,
-            time_taken=time.time() - start_time if "start_time" in locals() else 0,
+            time_taken=time.time() - start_time - paused_time,
             final_network=final_net,
             desired_trace=desired_trace,
             target_attractors=target_attractors,
-            final_attractors=final_net.detect_attractors(),
+            final_attractors=final_attractors,
             final_truth_table=final_truth_table,
             final_rules_readable=final_rules_readable,
-            temperature_log = temperature_log
+            temperature_log = temperature_log,
+            chain_results=chain_results,
+            telemetry=telemetry if telemetry.count else None
 
         )
 
+        # Index the run in the results database (results_db: false to disable)
+        db_path = config.get("results_db", DEFAULT_DB_PATH)
+        if db_path:
+            try:
+                record_run(db_path, run_dir, config, best_cost, history, final_step,
+                           time.time() - start_time - paused_time, telemetry, temperature_log, entity_count)
+            except Exception as e:
+                print(f"⚠️ Could not record run in results database: {e}")
 
 
-    return history, final_net, time.time() - start_time, final_step
+    return history, final_net, time.time() - start_time - paused_time, final_step
 
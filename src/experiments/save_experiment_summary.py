@@ -18,7 +18,9 @@ def save_experiment_summary(
         final_attractors,
         final_truth_table,
         final_rules_readable,
-        temperature_log=None
+        temperature_log=None,
+        chain_results=None,
+        telemetry=None
 ):
     os.makedirs(run_dir, exist_ok=True)
 
@@ -28,19 +30,31 @@ def save_experiment_summary(
 
     # 2. Cost log
     cost_log_path = os.path.join(run_dir, "cost_log.csv")
-    with open(cost_log_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-
-        headers = ["Step", "Cost"]
-        if temperature_log:
-            headers.append("Temperature")
-        writer.writerow(headers)
-
-        for step, cost in enumerate(cost_progress):
-            row = [step, cost]
+    if telemetry is not None:
+        # Decimated telemetry - real step numbers, plus min/max envelope and every improvement
+        write_telemetry_logs(run_dir, telemetry)
+    else:
+        with open(cost_log_path, "w", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+
+            headers = ["Step", "Cost"]
             if temperature_log:
-                row.append(temperature_log[step] if step < len(temperature_log) else "")
-            writer.writerow(row)
+                headers.append("Temperature")
+            writer.writerow(headers)
+
+            for step, cost in enumerate(cost_progress):
+                row = [step, cost]
+                if temperature_log:
+                    row.append(temperature_log[step] if step < len(temperature_log) else "")
+                writer.writerow(row)
+
+    # 2b. Per-chain summary for multi-start runs
+    if chain_results:
+        with open(os.path.join(run_dir, "chains_summary.csv"), "w", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["Chain", "Seed", "Best Cost", "Steps"])
+            for chain in chain_results:
+                writer.writerow([chain["chain"], chain["seed"], chain["best_cost"], chain["final_step"]])
 
     # 3. Parameters summary (dump config YAML to .txt)
     with open(os.path.join(run_dir, "parameters_summary.txt"), "w") as f:
@@ -99,3 +113,26 @@ def save_experiment_summary(
 
         with open(os.path.join(run_dir, "attractors_target.txt"), "w", encoding="utf-8") as f:
             f.write("\n".join(format_attractors(target_attractors)))
+
+
+def write_telemetry_logs(run_dir, telemetry):
+    """
+    Writes a TelemetryRecorder to cost_log.csv (sampled steps), cost_envelope.csv (min/max per bucket)
+    and cost_improvements.csv (every best-so-far improvement).
+    """
+    with open(os.path.join(run_dir, "cost_log.csv"), "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Step", "Cost", "Temperature"])
+        writer.writerows(zip(telemetry.steps, telemetry.costs, telemetry.temperatures))
+
+    starts, mins, maxs = telemetry.envelope()
+    with open(os.path.join(run_dir, "cost_envelope.csv"), "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Bucket Start", "Min Cost", "Max Cost"])
+        writer.writerows(zip(starts, mins, maxs))
+
+    steps, costs = telemetry.improvements()
+    with open(os.path.join(run_dir, "cost_improvements.csv"), "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Step", "Best Cost"])
+        writer.writerows(zip(steps, costs))
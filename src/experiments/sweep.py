@@ -0,0 +1,236 @@
+"""
+Hyperparameter sweeps with successive halving.
+
+    python -m src.experiments.sweep src/experiments/configs/sample_sweep.yaml [--workers W] [--output DIR]
+
+A sweep spec holds a base config plus the parameters to search (grid or random). Every trial starts on a
+small iteration/generation budget; after each rung only the best 1/eta trials continue, on an eta-times
+larger budget, until the full budget is reached. Trials run in parallel through the batch runner.
+"""
+import os
+import sys
+import csv
+import copy
+import math
+import random
+import argparse
+import itertools
+import contextlib
+from datetime import datetime
+
+import yaml
+
+from src.experiments.batch_runner import run_batch
+from src.experiments import cli
+
+# Which config key is the search budget for each metaheuristic
+BUDGET_KEYS = {
+    "simulated_annealing": "max_iterations",
+    "parallel_tempering": "max_iterations",
+    "multi_start_sa": "max_iterations",
+    "genetic_algorithm": "max_gens",
+    "island_genetic_algorithm": "max_gens",
+}
+
+
+def set_path(config, dotted_key, value):
+    """
+    Sets a possibly nested key, e.g. "temperature.initial".
+    """
+    *parents, leaf = dotted_key.split(".")
+    node = config
+    for key in parents:
+        node = node.setdefault(key, {})
+    node[leaf] = value
+
+
+def sample_value(domain, rng):
+    """
+    Draws one value from a list (uniform choice) or a {min, max, log, int} range.
+    """
+    if isinstance(domain, list):
+        return rng.choice(domain)
+    low, high = domain["min"], domain["max"]
+    if domain.get("log"):
+        value = math.exp(rng.uniform(math.log(low), math.log(high)))
+    else:
+        value = rng.uniform(low, high)
+    return int(round(value)) if domain.get("int") else value
+
+
+def expand_trials(spec):
+    """
+    Returns the list of parameter assignments to try: the full grid (every parameter must be a list of values)
+    or `samples` random draws.
+    """
+    parameters = spec["parameters"]
+    if spec.get("search", "grid") == "grid":
+        names = list(parameters)
+        for name in names:
+            if not isinstance(parameters[name], list):
+                raise ValueError(f"Grid search needs a list of values for '{name}' (use search: random for ranges)")
+        return [dict(zip(names, values)) for values in itertools.product(*(parameters[n] for n in names))]
+
+    rng = random.Random(spec.get("seed"))
+    return [
+        {name: sample_value(domain, rng) for name, domain in parameters.items()}
+        for _ in range(spec.get("samples", 20))
+    ]
+
+
+def budget_schedule(min_budget, max_budget, eta):
+    """
+    Rung budgets min_budget, min_budget*eta, ... capped at max_budget (always ending on max_budget).
+    """
+    budgets = [min_budget]
+    while budgets[-1] * eta < max_budget:
+        budgets.append(int(budgets[-1] * eta))
+    if budgets[-1] != max_budget:
+        budgets.append(max_budget)
+    return budgets
+
+
+def load_spec(path):
+    with open(path, "r") as f:
+        spec = yaml.safe_load(f)
+    base = spec.get("base", {})
+    if isinstance(base, str):
+        with open(base, "r") as f:
+            base = yaml.safe_load(f)
+    spec["base"] = base
+    return spec
+
+
+def run_sweep(spec, output_dir=None, workers=None, on_event=None, log_to_stderr=False):
+    """
+    Runs a successive-halving sweep. Returns the trial records sorted best first, each
+    {"trial", "params", "budget", "rung", "cost", "elapsed"} for the last rung the trial reached.
+
+    on_event(event, **fields) is called with "rung", "result", "failure" and "pruned" events.
+    """
+    emit = on_event or (lambda event, **fields: None)
+    base = spec["base"]
+    budget_key = BUDGET_KEYS[base.get("metaheuristic", "simulated_annealing")]
+
+    halving = spec.get("halving", {})
+    eta = halving.get("eta", 3)
+    max_budget = halving.get("max_budget", base[budget_key])
+    min_budget = halving.get("min_budget", max(1, max_budget // eta ** 3))
+    runs_per_trial = spec.get("runs_per_trial", 1)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    sweep_name = spec.get("name", "sweep")
+    output_dir = output_dir or os.path.join("experiment_results", "sweeps", f"{sweep_name}_{timestamp}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    trials = {f"trial_{i:03d}": params for i, params in enumerate(expand_trials(spec))}
+    survivors = list(trials)
+    records = {}
+
+    schedule = budget_schedule(min_budget, max_budget, eta)
+    rung = 0
+    while rung < len(schedule):
+        budget = schedule[rung]
+        emit("rung", rung=rung, budget=budget, trials=len(survivors))
+        rung_dir = os.path.join(output_dir, f"rung_{rung}")
+        os.makedirs(rung_dir, exist_ok=True)
+
+        config_list = []
+        for trial in survivors:
+            config = copy.deepcopy(base)
+            for key, value in trials[trial].items():
+                set_path(config, key, value)
+            config.update({
+                budget_key: budget,
+                "batch_output_dir": rung_dir,
+                "is_batch": True,
+                "generate_graphs": False,
+                "plot_progress": False,
+                "resume": False,
+            })
+            config.setdefault("log_results", False)
+            config_list.append((trial, runs_per_trial, config))
+
+        costs = {trial: [] for trial in survivors}
+        times = {trial: [] for trial in survivors}
+
+        def on_result(trial, run_number, final_cost, elapsed):
+            costs[trial].append(final_cost)
+            times[trial].append(elapsed)
+            emit("result", rung=rung, trial=trial, run=run_number, cost=final_cost, elapsed=elapsed)
+
+        def on_failure(trial, run_number, traceback_str):
+            emit("failure", rung=rung, trial=trial, run=run_number, error=traceback_str)
+
+        run_batch(
+            config_list, workers=workers, on_result=on_result, on_failure=on_failure, log_to_stderr=log_to_stderr
+        )
+
+        for trial in survivors:
+            trial_costs = costs[trial]
+            records[trial] = {
+                "trial": trial,
+                "params": trials[trial],
+                "budget": budget,
+                "rung": rung,
+                "cost": sum(trial_costs) / len(trial_costs) if trial_costs else float("inf"),
+                "elapsed": sum(times[trial]) / len(times[trial]) if times[trial] else float("inf"),
+            }
+
+        # Ties (e.g. several trials reaching cost 0 early) go to the faster trial
+        ranked = sorted(survivors, key=lambda t: (records[t]["cost"], records[t]["elapsed"]))
+        keep = max(1, len(ranked) // eta)
+        for trial in ranked[keep:]:
+            emit("pruned", rung=rung, trial=trial, cost=records[trial]["cost"])
+        survivors = ranked[:keep]
+
+        # A lone survivor has nothing left to be compared with - give it the full budget straight away
+        rung = len(schedule) - 1 if len(survivors) == 1 and rung < len(schedule) - 1 else rung + 1
+
+    results = sorted(records.values(), key=lambda r: (-r["rung"], r["cost"], r["elapsed"]))
+    save_sweep_results(output_dir, base, budget_key, results)
+    return results
+
+
+def save_sweep_results(output_dir, base, budget_key, results):
+    """
+    Writes sweep_results.csv (every trial at its last rung) and best_config.yaml (base config with the
+    winning parameters and the budget it was evaluated on).
+    """
+    param_names = sorted({name for r in results for name in r["params"]})
+    with open(os.path.join(output_dir, "sweep_results.csv"), "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Trial", "Rung", "Budget", "Cost", "Time"] + param_names)
+        for r in results:
+            writer.writerow(
+                [r["trial"], r["rung"], r["budget"], r["cost"], r["elapsed"]] + [r["params"].get(n) for n in param_names]
+            )
+
+    if results:
+        best_config = copy.deepcopy(base)
+        for key, value in results[0]["params"].items():
+            set_path(best_config, key, value)
+        best_config[budget_key] = results[0]["budget"]
+        with open(os.path.join(output_dir, "best_config.yaml"), "w") as f:
+            yaml.dump(best_config, f, sort_keys=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Successive-halving hyperparameter sweep for GA/SA.")
+    parser.add_argument("spec", help="sweep YAML")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default CPU count)")
+    parser.add_argument("--output", default=None, help="sweep output directory")
+    args = parser.parse_args(argv)
+
+    # Events go to stdout as JSON lines (same protocol as the headless runner), everything else to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        results = run_sweep(
+            load_spec(args.spec), output_dir=args.output, workers=args.workers, on_event=cli.emit, log_to_stderr=True
+        )
+    if results:
+        best = results[0]
+        print(f"✅ Best: {best['trial']} cost={best['cost']} at budget {best['budget']} with {best['params']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,13 @@ from matplotlib.figure import Figure
 import networkx as nx
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QPushButton,
-    QTextEdit, QStackedWidget, QSizePolicy, QTableWidget, QTableWidgetItem, QLabel
+    QTextEdit, QStackedWidget, QSizePolicy, QTableView, QLabel, QLineEdit
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 import matplotlib.patches as mpatches
 
-from graphviz import Digraph
+from src.gui.utils.table_models import TruthTableModel
 
 
 class GenerateGraphsWindow(QMainWindow):
@@ -74,9 +74,24 @@ class GenerateGraphsWindow(QMainWindow):
         self.rule_box.setFont(QFont("Segoe UI", 10))
         self.rule_table_layout.addWidget(self.rule_box, 1)
 
-        self.table_widget = QTableWidget()
-        self.table_widget.setFont(QFont("Segoe UI", 10))
-        self.rule_table_layout.addWidget(self.table_widget, 2)
+        # Truth table - a view over the packed table, sortable by column and filterable by next state
+        self.table_panel = QWidget()
+        table_layout = QVBoxLayout(self.table_panel)
+        table_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by next state, e.g. 1?0 (? = any)")
+        self.filter_input.textChanged.connect(self.filter_truth_table)
+        table_layout.addWidget(self.filter_input)
+
+        self.table_view = QTableView()
+        self.table_view.setFont(QFont("Segoe UI", 10))
+        self.table_view.setSortingEnabled(True)
+        self.table_view.horizontalHeader().setResizeContentsPrecision(64)  # size columns from the first rows only
+        table_layout.addWidget(self.table_view)
+        self.table_model = None
+
+        self.rule_table_layout.addWidget(self.table_panel, 2)
 
         self.main_layout.addWidget(self.rule_table_panel)
 
@@ -151,19 +166,24 @@ class GenerateGraphsWindow(QMainWindow):
         rule_lines = [f"{k}' = {v}" for k, v in rules.items()]
         self.rule_box.setText("\n".join(rule_lines))
 
-        self.table_widget.clear()
-        self.table_widget.setRowCount(len(truth_table))
-        self.table_widget.setColumnCount(len(entities) * 2)
-        headers = entities + [f"{e}'" for e in entities]
-        self.table_widget.setHorizontalHeaderLabels(headers)
+        if truth_table and not entities:
+            entities = [chr(65 + i) for i in range(len(next(iter(truth_table))))]
+        self.table_model = TruthTableModel.from_truth_table(truth_table, entities, parent=self)
+        self.table_view.setModel(self.table_model)
+        self.table_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.filter_truth_table(self.filter_input.text())
+        self.table_view.resizeColumnsToContents()
 
-        for row_idx, (input_str, output_list) in enumerate(truth_table.items()):
-            for i, bit in enumerate(input_str):
-                self.table_widget.setItem(row_idx, i, QTableWidgetItem(bit))
-            for j, bit in enumerate(output_list):
-                self.table_widget.setItem(row_idx, len(entities) + j, QTableWidgetItem(str(bit)))
-
-        self.table_widget.resizeColumnsToContents()
+    def filter_truth_table(self, pattern):
+        if self.table_model is None:
+            return
+        try:
+            self.table_model.set_output_filter(pattern)
+            self.filter_input.setStyleSheet("")
+            self.filter_input.setToolTip("")
+        except ValueError as e:
+            self.filter_input.setStyleSheet("border: 1px solid red;")
+            self.filter_input.setToolTip(str(e))
 
     def toggle_rule_table(self):
         self.info_shown = not self.info_shown
@@ -350,6 +370,7 @@ class GenerateGraphsWindow(QMainWindow):
         filepath = os.path.join(export_dir, filename)
 
         # manual implementation of state_graph_generator
+        from graphviz import Digraph
         dot = Digraph(comment=f'State Graph for {network_name}')
         dot.attr(rankdir='LR')  # Left-to-right layout
         dot.attr(label=network_name, fontsize="20", labelloc="t", fontname="Segoe UI")
@@ -1,8 +1,36 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget
 
+
+def minmax_decimate(steps, costs, bins):
+    """
+    Reduces a series to at most 2 * bins points: for each of `bins` equal slices the min and max cost,
+    so the drawn envelope matches the full-resolution line at that pixel width.
+    """
+    n = len(costs)
+    if n <= 2 * bins:
+        return steps.copy(), costs.copy()  # the line must not see later writes into the buffers
+    edges = np.linspace(0, n, bins + 1).astype(np.intp)[:-1]
+    lows = np.minimum.reduceat(costs, edges)
+    highs = np.maximum.reduceat(costs, edges)
+    x = np.repeat(steps[edges], 2)
+    y = np.empty(2 * bins)
+    y[0::2] = lows
+    y[1::2] = highs
+    return x, y
+
+
 class CostPlotWindow(QMainWindow):
+    """
+    Live cost curve. Points are buffered and the existing line is updated in place, decimated to the
+    axes' pixel width and blitted over a cached background, at most once per display refresh. The full
+    figure (ticks, labels) is only redrawn when the data outgrows the current axis limits or the window resizes.
+    """
+
     def __init__(self, log_scale=False, method="Genetic Algorithm"):
         super().__init__()
         self.setWindowTitle("Cost Plot")
@@ -20,33 +48,126 @@ class CostPlotWindow(QMainWindow):
         self.log_scale = log_scale
         self.method = method  # store for later use
 
-        self.steps = []
-        self.costs = []
-
-    def append(self, step, cost):
-        self.steps.append(step)
-        self.costs.append(cost)
-        self.update_plot()
-
-    def update_plot(self):
-        self.ax.clear()
-        self.ax.plot(self.steps, self.costs)
+        # Growable buffers; only [:count] is filled. Growth reallocates, so views handed out stay valid
+        self._steps = np.empty(1024)
+        self._costs = np.empty(1024)
+        self.count = 0
 
         self.ax.set_yscale('log' if self.log_scale else 'linear')
         self.ax.set_ylabel("Cost")
         self.ax.grid(True)
-
         if self.method == "Simulated Annealing":
             self.ax.set_xlabel("Mutation Attempt")
-            self.ax.set_title(f"Simulated Annealing Cost Progress @ Iteration {self.steps[-1]}")
         else:
             self.ax.set_xlabel("Generation")
-            self.ax.set_title(f"Genetic Algorithm Cost Progress @ Generation {self.steps[-1]} (Generation Interval)")
 
-        self.canvas.draw()
+        # Line and title change every frame, so they are left out of the cached background
+        (self.line,) = self.ax.plot([], [], animated=True)
+        self.ax.title.set_animated(True)
+        self.background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+        # Redraws are coalesced to the display refresh rate
+        screen = QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen is not None and screen.refreshRate() > 0 else 60
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(int(1000 / refresh_hz))
+        self.redraw_timer.timeout.connect(self.update_plot)
+
+    @property
+    def steps(self):
+        return self._steps[:self.count]
+
+    @property
+    def costs(self):
+        return self._costs[:self.count]
+
+    def append(self, step, cost):
+        self.extend((step,), (cost,))
+
+    def extend(self, steps, costs):
+        steps = np.asarray(steps, dtype=np.float64)
+        costs = np.asarray(costs, dtype=np.float64)
+        end = self.count + costs.size
+        if end > self._costs.size:
+            capacity = max(end, 2 * self._costs.size)
+            self._steps = np.concatenate([self.steps, np.empty(capacity - self.count)])
+            self._costs = np.concatenate([self.costs, np.empty(capacity - self.count)])
+        self._steps[self.count:end] = steps
+        self._costs[self.count:end] = costs
+        self.count = end
+        self._schedule_redraw()
 
     def set_history(self, steps, costs):
-        self.steps = steps
-        self.costs = costs
+        self.count = 0
+        self.extend(steps, costs)
+        self.redraw_timer.stop()
         self.update_plot()
 
+    def _schedule_redraw(self):
+        if not self.redraw_timer.isActive():
+            self.redraw_timer.start()
+
+    def _title(self):
+        if not self.count:
+            return ""
+        step = int(self.steps[-1])
+        if self.method == "Simulated Annealing":
+            return f"Simulated Annealing Cost Progress @ Iteration {step}"
+        return f"Genetic Algorithm Cost Progress @ Generation {step} (Generation Interval)"
+
+    def _limits_exceeded(self, steps, costs):
+        x_low, x_high = self.ax.get_xlim()
+        y_low, y_high = self.ax.get_ylim()
+        if self.log_scale:
+            costs = costs[costs > 0]  # zero costs are clipped on a log axis, not a reason to rescale
+            if not costs.size:
+                return steps[0] < x_low or steps[-1] > x_high
+        return (
+            steps[0] < x_low or steps[-1] > x_high
+            or costs.min() < y_low or costs.max() > y_high
+        )
+
+    def _rescale(self, steps, costs):
+        """
+        Grows the axes with headroom so limits (and the full redraw they need) change rarely.
+        """
+        x_low, x_high = float(steps[0]), max(float(steps[-1]), 1.0)
+        self.ax.set_xlim(x_low, x_low + (x_high - x_low) * 1.5)
+
+        if self.log_scale:
+            positive = costs[costs > 0]
+            low = float(positive.min()) if positive.size else 1e-3
+            self.ax.set_ylim(low / 2, max(float(costs.max()), low) * 2)
+        else:
+            low, high = float(costs.min()), float(costs.max())
+            margin = (high - low) * 0.1 or max(abs(high) * 0.1, 1)
+            self.ax.set_ylim(low - margin, high + margin)
+
+    def update_plot(self):
+        if not self.count:
+            return
+        steps, costs = self.steps, self.costs
+
+        bins = max(int(self.ax.bbox.width), 1)
+        x, y = minmax_decimate(steps, costs, bins)
+        self.line.set_data(x, y)
+        self.ax.set_title(self._title())
+
+        if self.background is None or self._limits_exceeded(steps, costs):
+            self._rescale(steps, costs)
+            self.canvas.draw()  # _on_draw re-caches the background and draws the line
+            return
+
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def _on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        self.ax.draw_artist(self.line)
+        self.ax.draw_artist(self.ax.title)
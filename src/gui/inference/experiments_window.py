@@ -3,9 +3,8 @@ import json
 import traceback
 from datetime import datetime
 import copy
+import multiprocessing
 import numpy as np
-import pandas as pd
-import seaborn as sns
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
@@ -13,52 +12,46 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-import matplotlib.pyplot as plt
-
-
 from PySide6.QtCore import QThread, Signal, QObject
 
+from src.experiments.results_store import DEFAULT_DB_PATH, get_store
+from src.inference_engine.metaheuristics.cancellation import CancellationToken
+
 class ExperimentWorker(QObject):
     finished = Signal()
     progress = Signal(int, str)  # run number, message
     result = Signal(str, int, float, float)  # experiment name, run number, cost, time
     failed = Signal(str, int, str)  # experiment name, run number, error
 
-    def __init__(self, config_list):
+    def __init__(self, config_list, workers=None):
         super().__init__()
         self.config_list = config_list  # List of tuples: (experiment_name, num_runs, config_dict)
+        self.workers = workers  # worker processes - defaults to CPU count
+        # Shared with the pool's worker processes; stop / pause are called directly from the GUI thread
+        self.cancel_token = CancellationToken(multiprocessing.get_context())
 
-    def run(self):
-        import tempfile
-        import yaml
-        from src.experiments.run_experiment import main as run_experiment_main
-
-        for exp_index, (exp_name, num_runs, config_dict) in enumerate(self.config_list):
-            for run_index in range(num_runs):
-                try:
-                    self.progress.emit(run_index + 1, f"▶️ Running {exp_name} Run {run_index + 1}/{num_runs}...")
-
-                    config_copy = copy.deepcopy(config_dict)
-                    config_copy["experiment_name"] = exp_name
-                    config_copy["batch_output_dir"] = config_dict["batch_output_dir"]
-                    config_copy["is_batch"] = True
-
-                    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as temp_yaml:
-                        yaml.dump(config_copy, temp_yaml)
-                        config_path = temp_yaml.name
+    def stop(self):
+        self.cancel_token.cancel()
 
-                    history, final_net, elapsed, _ = run_experiment_main(config_path, show_full_plot=False)
+    def pause(self):
+        self.cancel_token.pause()
 
-                    if isinstance(history, list) and history:
-                        final_cost = 0 if len(history) < config_dict.get("max_gens", config_dict.get("max_iterations",
-                                                                                                     float('inf'))) else \
-                        history[-1]
-                    else:
-                        final_cost = float("inf")
-                    self.result.emit(exp_name, run_index + 1, final_cost, elapsed)
+    def resume(self):
+        self.cancel_token.resume()
 
-                except Exception as e:
-                    self.failed.emit(exp_name, run_index + 1, traceback.format_exc())
+    def run(self):
+        from src.experiments.batch_runner import run_batch
+
+        # Runs are dispatched to a process pool; signals are emitted here as each run completes
+        run_batch(
+            self.config_list,
+            workers=self.workers,
+            on_start=lambda exp_name, run_number, num_runs: self.progress.emit(
+                run_number, f"▶️ Queued {exp_name} Run {run_number}/{num_runs}..."),
+            on_result=self.result.emit,
+            on_failure=self.failed.emit,
+            cancel_token=self.cancel_token,
+        )
 
         self.finished.emit()
 
@@ -152,7 +145,23 @@ class ExperimentWindow(QMainWindow):
         self.run_button = QPushButton("ðŸš€ Run Batch")
         self.run_button.clicked.connect(self.run_experiments)
         self.run_button.setFixedWidth(300)
-        self.main_layout.addWidget(self.run_button, alignment=Qt.AlignmentFlag.AlignHCenter)
+
+        # Batch controls - running runs stop with their best-so-far network logged, queued runs are skipped
+        self.pause_button = QPushButton("⏸️ Pause")
+        self.pause_button.setCheckable(True)
+        self.pause_button.setEnabled(False)
+        self.pause_button.toggled.connect(self.toggle_pause)
+        self.stop_button = QPushButton("⏹️ Stop")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.stop_experiments)
+
+        run_layout = QHBoxLayout()
+        run_layout.addStretch()
+        run_layout.addWidget(self.run_button)
+        run_layout.addWidget(self.pause_button)
+        run_layout.addWidget(self.stop_button)
+        run_layout.addStretch()
+        self.main_layout.addLayout(run_layout)
 
         # Queue controls
         queue_layout = QHBoxLayout()
@@ -208,6 +217,13 @@ class ExperimentWindow(QMainWindow):
         self.runs_input.setText("30")
         self.param_form.addWidget(self.runs_input)
 
+        label_workers = QLabel("Parallel Worker Processes:")
+        self.param_form.addWidget(label_workers)
+        self.workers_input = QLineEdit()
+        self.workers_input.setFixedWidth(200)
+        self.workers_input.setText(str(os.cpu_count() or 1))
+        self.param_form.addWidget(self.workers_input)
+
         label_cost = QLabel("Cost Function")
         self.cost_dropdown = QComboBox()
         self.cost_dropdown.addItems(["hamming_distance", "attractor_difference"])
@@ -231,8 +247,6 @@ class ExperimentWindow(QMainWindow):
             self.param_form.addWidget(field)
 
     def run_experiments(self):
-        import tempfile
-
         self.output.clear()
         self.progress.setValue(0)
 
@@ -245,16 +259,11 @@ class ExperimentWindow(QMainWindow):
             self.output.append("❌ Invalid network file (missing truth_table).")
             return
 
-        flat_table = {k: v if isinstance(v, list) else list(v) for k, v in data["truth_table"].items()}
         real_name = os.path.splitext(selected_file)[0]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         batch_output_dir = os.path.join("experiment_results", real_name, f"batch_{timestamp}")
         os.makedirs(batch_output_dir, exist_ok=True)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_json:
-            json.dump(flat_table, temp_json)
-            legacy_json_path = temp_json.name
-
         try:
             num_runs = int(self.runs_input.text())
         except Exception as e:
@@ -276,7 +285,7 @@ class ExperimentWindow(QMainWindow):
                 "metaheuristic": "genetic_algorithm",
                 "cost_function": "hamming" if self.cost_dropdown.currentText() == "hamming_distance" else "attractor",
                 "mutation_function": "flip_bit" if "flip" in self.mut_dropdown.currentText() else "edame",
-                "load_network_path": legacy_json_path,
+                "load_network_path": path,
                 "network_name": real_name,
                 "batch_output_dir": batch_output_dir,
                 "log_interval": 9999,
@@ -303,7 +312,7 @@ class ExperimentWindow(QMainWindow):
                 "metaheuristic": "simulated_annealing",
                 "cost_function": "hamming" if self.cost_dropdown.currentText() == "hamming_distance" else "attractor",
                 "mutation_function": "flip_bit" if "flip" in self.mut_dropdown.currentText() else "edame",
-                "load_network_path": legacy_json_path,
+                "load_network_path": path,
                 "network_name": real_name,
                 "batch_output_dir": batch_output_dir,
                 "log_interval": 9999,
@@ -326,7 +335,7 @@ class ExperimentWindow(QMainWindow):
 
         # Launch worker
         self.thread = QThread()
-        self.worker = ExperimentWorker(experiments)
+        self.worker = ExperimentWorker(experiments, workers=self.get_worker_count())
         self.worker.moveToThread(self.thread)
 
         # Signal wiring
@@ -341,10 +350,9 @@ class ExperimentWindow(QMainWindow):
         self.worker.failed.connect(self._on_run_failure_multi)
 
         self.thread.start()
+        self._set_running(True)
 
     def add_to_queue(self):
-        import tempfile
-
         selected_file = self.file_selector.currentText()
         path = os.path.join("saved_networks", selected_file)
         with open(path, "r") as f:
@@ -354,13 +362,8 @@ class ExperimentWindow(QMainWindow):
             self.output.append("❌ Invalid network file (missing truth_table).")
             return
 
-        flat_table = {k: v if isinstance(v, list) else list(v) for k, v in data["truth_table"].items()}
         real_name = os.path.splitext(selected_file)[0]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_json:
-            json.dump(flat_table, temp_json)
-            legacy_json_path = temp_json.name
-
         method = self.meta_selector.currentText()
         try:
             if method == "Genetic Algorithm":
@@ -391,7 +394,7 @@ class ExperimentWindow(QMainWindow):
             "metaheuristic": "simulated_annealing" if method == "Simulated Annealing" else "genetic_algorithm",
             "cost_function": "hamming" if self.cost_dropdown.currentText() == "hamming_distance" else "attractor",
             "mutation_function": "flip_bit" if "flip" in self.mut_dropdown.currentText() else "edame",
-            "load_network_path": legacy_json_path,
+            "load_network_path": path,
             "network_name": real_name,
             "batch_output_dir": batch_output_dir,
             "log_interval": 9999,
@@ -416,7 +419,7 @@ class ExperimentWindow(QMainWindow):
         self.progress.setMaximum(total_runs)
 
         self.thread = QThread()
-        self.worker = ExperimentWorker(self.experiment_queue)
+        self.worker = ExperimentWorker(self.experiment_queue, workers=self.get_worker_count())
         self.worker.moveToThread(self.thread)
 
         self.thread.started.connect(self.worker.run)
@@ -430,8 +433,37 @@ class ExperimentWindow(QMainWindow):
         self.worker.failed.connect(self._on_run_failure_multi)
 
         self.thread.start()
+        self._set_running(True)
         self.output.append("🚀 Running all queued experiments...")
 
+    def _set_running(self, running):
+        self.pause_button.setChecked(False)
+        self.pause_button.setEnabled(running)
+        self.stop_button.setEnabled(running)
+
+    def toggle_pause(self, paused):
+        self.pause_button.setText("▶️ Resume" if paused else "⏸️ Pause")
+        if getattr(self, "worker", None) is None:
+            return
+        if paused:
+            self.worker.pause()
+            self.output.append("⏸️ Batch paused.")
+        else:
+            self.worker.resume()
+
+    def stop_experiments(self):
+        if getattr(self, "worker", None) is not None:
+            self.worker.stop()
+            self.output.append("⏹️ Stopping - running runs will save their best network so far, queued runs are skipped.")
+        self.pause_button.setEnabled(False)
+        self.stop_button.setEnabled(False)
+
+    def get_worker_count(self):
+        try:
+            return max(1, int(self.workers_input.text()))
+        except ValueError:
+            return None  # fall back to CPU count
+
     def _on_run_success(self, run_num, final_cost, elapsed):
         self.progress.setValue(run_num)
         self.output.append(f"✅ Run {run_num} complete. Final Cost = {final_cost} | Time Taken = {elapsed:.2f} sec")
@@ -450,36 +482,33 @@ class ExperimentWindow(QMainWindow):
         self.output.append(f"❌ [{exp_name}] Run {run_num} failed with error:\n{traceback_str}")
 
     def _on_finished(self):
-        self.output.append("✅ All experiments complete.")
-        generate_batch_plots(self.worker.config_dict["batch_output_dir"])
-
-
-def collect_batch_data(batch_dir):
-    costs, times, methods = [], [], []
-
-    for root, _, files in os.walk(batch_dir):
-        if "cost_log.csv" in files:
-            exp_name = os.path.basename(os.path.dirname(root))
-            cost_path = os.path.join(root, "cost_log.csv")
-            df = pd.read_csv(cost_path)
-            if not df.empty:
-                final_cost = df["Cost"].iloc[-1]
-                costs.append(final_cost)
-                methods.append(exp_name)
-
-        if "time_taken.txt" in files:
-            with open(os.path.join(root, "time_taken.txt")) as f:
-                try:
-                    times.append(float(f.readline().split()[0]))
-                except:
-                    pass
+        self._set_running(False)
+        if self.worker.cancel_token.cancelled:
+            self.output.append("⏹️ Batch stopped.")
+        else:
+            self.output.append("✅ All experiments complete.")
+        batch_dirs = {config["batch_output_dir"] for _, _, config in self.worker.config_list}
+        for batch_dir in batch_dirs:
+            generate_batch_plots(batch_dir)
+
+
+def collect_batch_data(batch_dir, db_path=DEFAULT_DB_PATH):
+    runs = get_store(db_path).runs(batch_dir=batch_dir)
+    runs = [run for run in runs if run["final_cost"] is not None]
 
+    costs = [run["final_cost"] for run in runs]
+    times = [run["time_taken"] for run in runs if run["time_taken"] is not None]
+    methods = [run["experiment_name"] or run["metaheuristic"] for run in runs]
     return costs, times, methods
 
 
 def plot_cost_violin(costs, methods, out_dir):
     if not methods:
         return
+    import pandas as pd
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+
     df = pd.DataFrame({"Cost": costs, "Method": methods})
     plt.figure()
     sns.violinplot(x="Method", y="Cost", data=df, inner="point")
@@ -490,36 +519,38 @@ def plot_cost_violin(costs, methods, out_dir):
     plt.close()
 
 
-def plot_average_progress(batch_dir):
-    experiment_runs = {}
+def plot_average_progress(batch_dir, db_path=DEFAULT_DB_PATH, points=500):
+    store = get_store(db_path)
+    runs = store.runs(batch_dir=batch_dir)
+    series = store.cost_series(run["id"] for run in runs)
 
-    for root, _, files in os.walk(batch_dir):
-        if "cost_log.csv" in files:
-            exp_name = os.path.basename(os.path.dirname(root))
-            path = os.path.join(root, "cost_log.csv")
-            df = pd.read_csv(path)
-            if not df.empty:
-                if exp_name not in experiment_runs:
-                    experiment_runs[exp_name] = []
-                experiment_runs[exp_name].append(df["Cost"].values)
+    experiment_runs = {}
+    for run in runs:
+        steps, costs = series[run["id"]]
+        if steps:
+            exp_name = run["experiment_name"] or run["metaheuristic"]
+            experiment_runs.setdefault(exp_name, []).append((np.asarray(steps), np.asarray(costs)))
 
     if not experiment_runs:
         return
 
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(10, 6))
 
-    for exp_name, runs in experiment_runs.items():
-        max_len = max(len(r) for r in runs)
-        padded = np.full((len(runs), max_len), np.nan)
-        for i, r in enumerate(runs):
-            padded[i, :len(r)] = r
+    for exp_name, exp_runs in experiment_runs.items():
+        # Series are decimated - resample every run onto a common step grid, NaN past its last step
+        max_step = max(steps[-1] for steps, _ in exp_runs)
+        grid = np.linspace(0, max_step, points)
+        resampled = np.full((len(exp_runs), points), np.nan)
+        for i, (steps, costs) in enumerate(exp_runs):
+            mask = grid <= steps[-1]
+            resampled[i, mask] = np.interp(grid[mask], steps, costs)
 
-        mean_progress = np.nanmean(padded, axis=0)
-        std_progress = np.nanstd(padded, axis=0)
-        steps = np.arange(1, len(mean_progress) + 1)
+        mean_progress = np.nanmean(resampled, axis=0)
+        std_progress = np.nanstd(resampled, axis=0)
 
-        plt.plot(steps, mean_progress, label=exp_name)
-        plt.fill_between(steps, mean_progress - std_progress, mean_progress + std_progress, alpha=0.2)
+        plt.plot(grid, mean_progress, label=exp_name)
+        plt.fill_between(grid, mean_progress - std_progress, mean_progress + std_progress, alpha=0.2)
 
     plt.xlabel("Step (Iteration/Generation)")
     plt.ylabel("Average Cost")
@@ -532,6 +563,7 @@ def plot_average_progress(batch_dir):
 
 
 def plot_final_cost_histogram(costs, out_dir):
+    import matplotlib.pyplot as plt
     plt.figure()
     plt.hist(costs, bins=15, edgecolor='black')
     plt.title("Final Cost Distribution")
@@ -545,6 +577,7 @@ def plot_final_cost_histogram(costs, out_dir):
 def plot_runtime_boxplot(times, out_dir):
     if not times:
         return
+    import matplotlib.pyplot as plt
     plt.figure()
     plt.boxplot(times, vert=True, patch_artist=True)
     plt.title("Runtime per Run")
@@ -557,6 +590,7 @@ def plot_runtime_boxplot(times, out_dir):
 def plot_success_rate(costs, out_dir, threshold=0.01):
     success = sum(c <= threshold for c in costs)
     fail = len(costs) - success
+    import matplotlib.pyplot as plt
     plt.figure()
     plt.bar(["Success", "Fail"], [success, fail], color=["green", "red"])
     plt.title(f"Runs with Cost ≤ {threshold}")
@@ -1,20 +1,13 @@
 import os
 import json
 import re
-import tempfile
-import networkx as nx
-import yaml
-
-from src.gui.inference.cost_plot_window import CostPlotWindow
-from src.gui.utils.backend_runner import BackendRunner
-from src.experiments.run_experiment import main as run_backend
-from src.gui.visualisation.wiring_diagram_window import WiringDiagramWindow
 
 from PySide6.QtWidgets import (
     QMainWindow, QApplication, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QLabel,
     QMessageBox, QComboBox, QLineEdit, QRadioButton, QButtonGroup, QGroupBox, QSpacerItem,
-    QSizePolicy, QGridLayout
+    QSizePolicy, QGridLayout, QTextEdit
 )
+from PySide6.QtGui import QFontDatabase
 from PySide6.QtCore import QTimer, QThread, Qt
 
 
@@ -39,6 +32,8 @@ def convert_gui_to_legacy(input_path, output_path):
 
 
 def draw_wiring_overlay_arrows(current_rules, target_rules, ax):
+    import networkx as nx
+
     def extract_edges(rules):
         edges = set()
         for node, expr in rules.items():
@@ -191,6 +186,12 @@ class LiveEvolutionWindow(QMainWindow):
         cost_buttons.addWidget(self.cost_button, 0, 0)
         cost_buttons.addWidget(self.fullplot_button, 0, 1)
 
+        self.profile_button = QPushButton("Phase Timing Report after Evolution")
+        self.profile_button.setCheckable(True)
+        self.profile_button.setChecked(False)
+        self.profile_button.setMinimumHeight(40)
+        cost_buttons.addWidget(self.profile_button, 1, 0, 1, 2)
+
 
 
         graph_layout.addLayout(cost_buttons)
@@ -249,11 +250,27 @@ class LiveEvolutionWindow(QMainWindow):
 
         self.go_button = QPushButton("ðŸš€ Start Evolution")
         self.go_button.setFixedWidth(300)
-        self.main_layout.addWidget(self.go_button, alignment=Qt.AlignmentFlag.AlignHCenter)
         self.go_button.clicked.connect(self.start_evolution)
 
-        self.timer = QTimer()
-        self.live_json_path = os.path.join(tempfile.gettempdir(), "current_evolution.json")
+        # Run controls - the search checks for these between steps, so a stopped run still logs its best network
+        self.pause_button = QPushButton("⏸️ Pause")
+        self.pause_button.setCheckable(True)
+        self.pause_button.setEnabled(False)
+        self.pause_button.toggled.connect(self.toggle_pause)
+        self.stop_button = QPushButton("⏹️ Stop")
+        self.stop_button.setEnabled(False)
+        self.stop_button.clicked.connect(self.stop_evolution)
+
+        run_layout = QHBoxLayout()
+        run_layout.addStretch()
+        run_layout.addWidget(self.go_button)
+        run_layout.addWidget(self.pause_button)
+        run_layout.addWidget(self.stop_button)
+        run_layout.addStretch()
+        self.main_layout.addLayout(run_layout)
+
+        self.progress_channel = None
+        self.drain_scheduled = False
         self.last_step = -1
         self.target_rules = {}
         self.attractor_windows = []
@@ -314,6 +331,8 @@ class LiveEvolutionWindow(QMainWindow):
     def start_evolution(self):
         # Cleanup from previous run if needed
         if hasattr(self, "backend_thread") and self.backend_thread.isRunning():
+            if getattr(self, "worker", None) is not None:
+                self.worker.stop()  # otherwise wait() blocks until the search finishes on its own
             self.backend_thread.quit()
             self.backend_thread.wait()
             print("🧹 Previous backend thread cleaned up.")
@@ -396,6 +415,7 @@ class LiveEvolutionWindow(QMainWindow):
             "log_interval": update_interval,
             "live_update_interval": update_interval,
             "generate_graphs": self.export_diagrams_button.isChecked(),
+            "profile": self.profile_button.isChecked(),
         }
 
         if method == "Simulated Annealing":
@@ -420,20 +440,16 @@ class LiveEvolutionWindow(QMainWindow):
         flat_table = full_data.get("truth_table", full_data)
         flat_table = {k: v if isinstance(v, list) else list(v) for k, v in flat_table.items()}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_json:
-            json.dump(flat_table, temp_json)
-            legacy_json_path = temp_json.name
-
-        config_dict["load_network_path"] = legacy_json_path
+        config_dict["load_network_path"] = target_file
         config_dict["network_name"] = self.file_selector.currentText().replace(".json", "")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as temp_yaml:
-            yaml.dump(config_dict, temp_yaml)
-            config_path = temp_yaml.name
-
-        print(f"Running {method} with config at {config_path}")
+        print(f"Running {method} on {config_dict['network_name']}")
         self.show_final_plot = self.fullplot_button.isChecked()
 
+        # Plotting / engine modules are loaded on the first run, not when the window opens
+        from src.gui.inference.cost_plot_window import CostPlotWindow
+        from src.gui.utils.backend_runner import BackendRunner
+
         if self.cost_button.isChecked():
             self.cost_window = CostPlotWindow(
                 log_scale=self.log_checkbox.isChecked(),
@@ -445,7 +461,8 @@ class LiveEvolutionWindow(QMainWindow):
 
         self.backend_thread = QThread()
         self.worker = BackendRunner(
-            config_path,
+            config_dict,
+            target=flat_table,  # parsed into a TargetNetwork on the backend thread
             show_full_plot=self.fullplot_button.isChecked(),
             log_scale=self.log_checkbox.isChecked(),
             method=self.meta_selector.currentText(),
@@ -456,18 +473,45 @@ class LiveEvolutionWindow(QMainWindow):
         self.worker.attractors_update.connect(self.handle_attractor_update)
         self.worker.moveToThread(self.backend_thread)
 
-        if self.cost_window:
-            self.worker.progress.connect(self.cost_window.append)
+        self.progress_channel = self.worker.channel
+        self.progress_channel.ready.connect(self.on_progress_ready)
 
         self.worker.finished.connect(self.backend_thread.quit)
         self.worker.done_with_history.connect(self.show_full_resolution_plot)
+        self.worker.profile_ready.connect(self.show_phase_profile)
         self.worker.finished.connect(self.show_wiring_diagram)
+        self.worker.finished.connect(self.on_evolution_finished)
 
         self.backend_thread.started.connect(self.worker.run)
         self.backend_thread.start()
         self.last_step = -1
         self.cost_data = []
 
+        self.pause_button.setChecked(False)
+        self.pause_button.setEnabled(True)
+        self.stop_button.setEnabled(True)
+
+    def toggle_pause(self, paused):
+        self.pause_button.setText("▶️ Resume" if paused else "⏸️ Pause")
+        if getattr(self, "worker", None) is None:
+            return
+        if paused:
+            self.worker.pause()
+        else:
+            self.worker.resume()
+
+    def stop_evolution(self):
+        if getattr(self, "worker", None) is not None:
+            print("⏹️ Stopping evolution...")
+            self.worker.stop()
+        self.pause_button.setEnabled(False)
+        self.stop_button.setEnabled(False)
+
+    def on_evolution_finished(self):
+        self.pause_button.setChecked(False)
+        self.pause_button.setEnabled(False)
+        self.stop_button.setEnabled(False)
+
     def show_wiring_diagram(self):
         if hasattr(self, 'wiring_button') and self.wiring_button.isChecked():
             try:
@@ -477,6 +521,9 @@ class LiveEvolutionWindow(QMainWindow):
                 if not self.latest_wiring_diagram:
                     print("⚠️ No wiring graph available yet.")
                     return
+                if not self.target_rules:
+                    print("⚠️ Target network has no rules to compare wiring against.")
+                    return
 
                 # Use the final evolved network directly
                 G_current = self.latest_wiring_diagram
@@ -501,10 +548,12 @@ class LiveEvolutionWindow(QMainWindow):
             deps_target = target_net.infer_wiring()
             G_target = target_net.build_wiring_graph(deps_target)
         else:
+            import networkx as nx
             G_target = nx.DiGraph()  # empty fallback
 
         if self.wiring_button.isChecked():
             if not hasattr(self, "wiring_window") or self.wiring_window is None:
+                from src.gui.visualisation.wiring_diagram_window import WiringDiagramWindow
                 self.wiring_window = WiringDiagramWindow(latest_graph, G_target)
                 self.wiring_window.destroyed.connect(lambda: setattr(self, "wiring_window", None))
                 self.wiring_window.show()
@@ -536,66 +585,50 @@ class LiveEvolutionWindow(QMainWindow):
             self.attractors_window.update_data(attractors)
 
 
-    def run_backend_with_config(self, config_path):
-        with open(self.live_json_path, "w") as f:
-            f.write(json.dumps({"step": -1, "rules": {}, "cost": None}))
-
-        script_path = os.path.join("experiments", "experiment_setup", "run_experiment.py")
-        run_backend(
-            config_path,
-            progress_callback=self.cost_window.append if self.cost_window else None,
-            show_full_plot=self.show_final_plot
-        )
+    def on_progress_ready(self):
+        # A custom update rate batches everything published during the wait into one redraw
+        if not self.update_rate_ms:
+            self.update_graph()
+        elif not self.drain_scheduled:
+            self.drain_scheduled = True
+            QTimer.singleShot(self.update_rate_ms, self.update_graph)
 
     def update_graph(self):
-        if not os.path.exists(self.live_json_path):
-            return
-
-        try:
-            with open(self.live_json_path, "r") as f:
-                content = f.read().strip()
-                if not content:
-                    return
-                data = json.loads(content)
-        except Exception as e:
-            print(f"Live JSON read error: {e}")
+        self.drain_scheduled = False
+        if self.progress_channel is None:
             return
 
-        if data.get("step") == self.last_step:
+        snapshots = self.progress_channel.take()
+        if not snapshots:
             return
 
         # Skip ahead to latest step — only show latest
-        self.last_step = data["step"]
-
-        # Draw graph (still every step)
-        if self.show_graph_checkbox.isChecked():
-            rules = data.get("rules", {})
-            score = draw_wiring_overlay_arrows(rules, self.target_rules, self.ax) if self.target_rules else 1.0
-            self.canvas.draw()
-            self.score_label.setText(f"Wiring Similarity: {score * 100:.1f}%")
-
-
-        # Push to external plot window — only newest value
-        if self.self.cost_button.isChecked() and "cost" in data:
-            if not hasattr(self, "cost_window"):
-                self.cost_window = CostPlotWindow(
-                    log_scale=self.log_checkbox.isChecked(),
-                    method=self.meta_selector.currentText()
-                )
-                self.cost_window.show()
-            self.cost_window.append(data["step"], data["cost"])
-
-    def show_full_resolution_plot(self, history, method, log_scale):
+        self.last_step = snapshots[-1].step
+
+        if self.cost_window:
+            self.cost_window.extend([s.step for s in snapshots], [s.cost for s in snapshots])
+
+    def show_full_resolution_plot(self, steps, history, method, log_scale):
         try:
+            from src.gui.inference.cost_plot_window import CostPlotWindow
             self.full_window = CostPlotWindow(log_scale=log_scale, method=method)
-
-            steps = list(range(len(history)))
             self.full_window.set_history(steps, history)
 
             self.full_window.show()
         except Exception as e:
             print("❗ Could not show full-resolution plot:", e)
 
+    def show_phase_profile(self, report):
+        if not self.profile_button.isChecked():
+            return
+        self.profile_window = QTextEdit()
+        self.profile_window.setWindowTitle("Phase Timing Report")
+        self.profile_window.setReadOnly(True)
+        self.profile_window.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.profile_window.setPlainText(report)
+        self.profile_window.resize(720, 360)
+        self.profile_window.show()
+
     def export_final_and_desired_graphs(self):
         try:
             os.makedirs("graph_exports", exist_ok=True)
@@ -8,13 +8,6 @@ from PySide6.QtCore import Qt, QPropertyAnimation, QSequentialAnimationGroup, QE
 
 from PySide6.QtGui import QIcon
 
-from src.gui.inference.live_evolution_window import LiveEvolutionWindow
-from src.gui.network_manipulation.import_network_window import ImportNetworkWindow
-from src.gui.graph_window import GenerateGraphsWindow
-from src.gui.network_manipulation.modify_network_window import ModifyRulesGUI
-from src.gui.network_manipulation.rules_gui import RulesGUI
-from src.gui.network_manipulation.truth_table_input_gui import TruthTableInputGUI
-from src.gui.inference.experiments_window import ExperimentWindow
 
 
 class MainMenu(QMainWindow):
@@ -178,26 +171,32 @@ class MainMenu(QMainWindow):
 
     # --------------------
     # Window Launchers
+    # (each window is imported when first opened - they pull in matplotlib, pandas, networkx, sympy...)
     # --------------------
     def open_import_window(self):
+        from src.gui.network_manipulation.import_network_window import ImportNetworkWindow
         self.import_window = ImportNetworkWindow()
         self.import_window.show()
 
     def open_define_rules_window(self):
+        from src.gui.network_manipulation.rules_gui import RulesGUI
         self.rules_window = RulesGUI()
         self.rules_window.show()
 
 
     def open_truth_table_window(self):
+        from src.gui.network_manipulation.truth_table_input_gui import TruthTableInputGUI
         self.truth_window = TruthTableInputGUI()
         self.truth_window.show()
 
     def open_modify_window(self):
+        from src.gui.network_manipulation.modify_network_window import ModifyRulesGUI
         self.modify_window = ModifyRulesGUI()
         self.modify_window.show()
 
     def open_live_window(self):
         if not hasattr(self, 'live_window') or not self.live_window.isVisible():
+            from src.gui.inference.live_evolution_window import LiveEvolutionWindow
             self.live_window = LiveEvolutionWindow()
             self.live_window.show()
         else:
@@ -205,10 +204,12 @@ class MainMenu(QMainWindow):
             self.live_window.raise_()
 
     def open_graphs_window(self):
+        from src.gui.graph_window import GenerateGraphsWindow
         self.graphs_window = GenerateGraphsWindow()
         self.graphs_window.show()
 
     def open_experiment_window(self):
+        from src.gui.inference.experiments_window import ExperimentWindow
         self.experiment_window = ExperimentWindow(self)
         self.experiment_window.show()
 
@@ -1,13 +1,13 @@
 
 import os
-import pandas as pd
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog,
-    QLineEdit, QHBoxLayout, QTableWidget, QTableWidgetItem, QMessageBox
+    QLineEdit, QHBoxLayout, QTableView, QMessageBox
 )
 from PySide6.QtCore import Qt
 from src.boolean_network_representation.rules import TruthTableToRules
 from src.boolean_network_representation.storage import BooleanNetworkStorage
+from src.gui.utils.table_models import DataFrameModel
 
 
 class ImportNetworkWindow(QMainWindow):
@@ -51,7 +51,8 @@ class ImportNetworkWindow(QMainWindow):
         self.layout.addLayout(name_row)
 
         # Table preview
-        self.preview_table = QTableWidget()
+        self.preview_table = QTableView()
+        self.preview_table.horizontalHeader().setResizeContentsPrecision(64)  # size columns from the first rows only
         self.layout.addWidget(self.preview_table)
 
         # Save button
@@ -92,6 +93,7 @@ class ImportNetworkWindow(QMainWindow):
             self.load_file(path)
 
     def load_file(self, path):
+        import pandas as pd
         try:
             if path.endswith(".csv"):
                 df = pd.read_csv(path)
@@ -106,16 +108,7 @@ class ImportNetworkWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load file:\n{e}")
 
     def display_table(self, df):
-        self.preview_table.clear()
-        self.preview_table.setRowCount(len(df))
-        self.preview_table.setColumnCount(len(df.columns))
-        self.preview_table.setHorizontalHeaderLabels(list(df.columns))
-
-        for i in range(len(df)):
-            for j in range(len(df.columns)):
-                item = QTableWidgetItem(str(df.iat[i, j]))
-                self.preview_table.setItem(i, j, item)
-
+        self.preview_table.setModel(DataFrameModel(df, parent=self))
         self.preview_table.resizeColumnsToContents()
 
     def process_imported_data(self):
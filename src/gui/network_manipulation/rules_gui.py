@@ -1,4 +1,3 @@
-import itertools
 from PySide6.QtWidgets import (
     QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QSpinBox, QHBoxLayout, QLineEdit, QMessageBox, QSizePolicy
 )
@@ -132,27 +131,7 @@ class RulesGUI(QMainWindow):
         return " ".join(translated)
 
     def generate_truth_table(self, entities, rules):
-        entity_count = len(entities)
-        states = list(itertools.product([0, 1], repeat=entity_count))
-        truth_table = {}
-
-        for state in states:
-            inputs = {entities[i]: state[i] for i in range(entity_count)}
-            next_state = []
-
-            for entity in entities:
-                raw_expr = rules[entity]
-                python_expr = RulesGUI.format_rule_for_python(raw_expr)
-                try:
-                    next_state_value = eval(python_expr, {}, inputs)
-                    next_state.append(int(next_state_value))
-                except Exception as e:
-                    print(f"Error evaluating rule for {entity}: {e} | Rule: {python_expr}")
-                    next_state.append(0)
-
-            truth_table["".join(map(str, state))] = next_state
-
-        return truth_table
+        return generate_truth_table(entities, rules, RulesGUI.format_rule_for_python)
 
 
     def save_rules(self):
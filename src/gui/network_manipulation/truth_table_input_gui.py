@@ -1,8 +1,6 @@
-import itertools
-
 from PySide6.QtWidgets import (
-    QMainWindow, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QTableWidget,
-    QTableWidgetItem, QSpinBox, QLineEdit, QMessageBox, QStyledItemDelegate, QSizePolicy, QFrame, QHeaderView
+    QMainWindow, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QTableView,
+    QSpinBox, QLineEdit, QMessageBox, QStyledItemDelegate, QSizePolicy, QFrame, QHeaderView
 )
 from PySide6.QtGui import QFont, QValidator
 from PySide6.QtCore import Qt
@@ -11,6 +9,7 @@ from PySide6.QtCore import Qt
 from src.boolean_network_representation.rules import TruthTableToRules
 from src.data_processing.truth_table_validation import validate_truth_table_inputs
 from src.boolean_network_representation.storage import BooleanNetworkStorage
+from src.gui.utils.table_models import TruthTableModel
 
 
 class BinaryCharValidator(QValidator):
@@ -80,9 +79,10 @@ class TruthTableInputGUI(QMainWindow):
         line.setFrameShadow(QFrame.Sunken)
         main_layout.addWidget(line)
 
-        # Truth Table Widget
-        self.truth_table = QTableWidget()
-        self.truth_table.setSizeAdjustPolicy(QTableWidget.AdjustToContents)
+        # Truth Table View - rows are drawn from the model only when visible
+        self.truth_table = QTableView()
+        self.truth_table.setSizeAdjustPolicy(QTableView.AdjustToContents)
+        self.truth_model = None
         main_layout.addWidget(self.truth_table)
 
         # Save Button
@@ -106,35 +106,15 @@ class TruthTableInputGUI(QMainWindow):
     def generate_truth_table(self):
         entity_count = self.entity_count_selector.value()
         entities = [chr(65 + i) for i in range(entity_count)]
-        states = list(itertools.product([0, 1], repeat=entity_count))
-
-        self.truth_table.setRowCount(len(states))
-        self.truth_table.setColumnCount(2 * entity_count + 1)
 
-        headers = entities + [" "] + [f"{e}'" for e in entities]
-        self.truth_table.setHorizontalHeaderLabels(headers)
+        # Inputs are read-only, a spacer column separates them from the (blank, editable) outputs
+        self.truth_model = TruthTableModel(entities, editable=True, spacer=True, parent=self)
+        self.truth_table.setModel(self.truth_model)
 
         # Dynamic scaling
         scale = max(0.85, min(1.2, 6 / entity_count))
         font = QFont("Segoe UI", int(11 * scale))
 
-        for row, state in enumerate(states):
-            for col, val in enumerate(state):
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                item.setFont(font)
-                self.truth_table.setItem(row, col, item)
-
-            # Spacer
-            spacer = QTableWidgetItem("")
-            spacer.setFlags(Qt.NoItemFlags)
-            self.truth_table.setItem(row, entity_count, spacer)
-
-            for col in range(entity_count + 1, 2 * entity_count + 1):
-                item = QTableWidgetItem("")
-                item.setFont(font)
-                self.truth_table.setItem(row, col, item)
-
         self.truth_table.setFont(font)
         self.truth_table.verticalHeader().setDefaultSectionSize(int(30 * scale))
 
@@ -152,17 +132,9 @@ class TruthTableInputGUI(QMainWindow):
         network_name = self.network_name_input.text().strip()
         filename = network_name if network_name.endswith(".json") else network_name + ".json"
 
-        # Build truth table (string values)
-        truth_table = {}
-        for row in range(self.truth_table.rowCount()):
-            input_state = "".join(self.truth_table.item(row, col).text().strip() for col in range(entity_count))
-            output_bits = []
-            for col in range(entity_count + 1, 2 * entity_count + 1):
-                item = self.truth_table.item(row, col)
-                value = item.text().strip() if item else ""
-                item.setBackground(Qt.white)  # Clear old highlights
-                output_bits.append(value)
-            truth_table[input_state] = output_bits
+        # Build truth table (blank cells as "")
+        truth_table = self.truth_model.to_truth_table()
+        self.truth_model.clear_highlight()
 
 
         is_valid, message = validate_truth_table_inputs(network_name, truth_table, entity_count)
@@ -172,13 +144,11 @@ class TruthTableInputGUI(QMainWindow):
                 import re
                 match = re.search(r"Row (\d+).*column '([A-Z]')", message)
                 if match:
-                    row_idx = int(match.group(1)) - 1
+                    row_idx = int(match.group(1)) - 1  # rows are in state order
                     col_label = match.group(2)
-                    # Get actual column index from header label
-                    for col in range(self.truth_table.columnCount()):
-                        if self.truth_table.horizontalHeaderItem(col).text() == col_label:
-                            self.truth_table.item(row_idx, col).setBackground(Qt.red)
-                            break
+                    entity = entities.index(col_label.rstrip("'"))
+                    self.truth_model.highlight(row_idx, entity)
+                    self.truth_table.scrollTo(self.truth_model.index_for(row_idx, entity))
 
             QMessageBox.warning(self, "Validation Failed", message)
             return
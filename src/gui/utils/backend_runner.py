@@ -1,42 +1,92 @@
 from PySide6.QtCore import QObject, Signal
 from src.experiments.run_experiment import main as run_backend
+from src.inference_engine.metaheuristics.profiling import PhaseProfiler
+from src.inference_engine.metaheuristics.cancellation import CancellationToken
+from src.inference_engine.metaheuristics.telemetry import TelemetryRecorder
+from src.gui.utils.progress_channel import ProgressChannel
+from src.gui.utils.structure_analyser import StructureAnalyser
 import yaml
 
 class BackendRunner(QObject):
     finished = Signal()
-    progress = Signal(int, float)
-    done_with_history = Signal(list, str, bool)
+    done_with_history = Signal(list, list, str, bool)  # steps, costs - SA histories are decimated
     wiring_update = Signal(object)
     attractors_update = Signal(list)
+    profile_ready = Signal(str)  # per-phase timing report, emitted when the run finishes
 
-    def __init__(self, config_path, show_full_plot=False, log_scale=False, method="Genetic Algorithm"):
+    def __init__(self, config, show_full_plot=False, log_scale=False, method="Genetic Algorithm", target=None):
         super().__init__()
-        self.config_path = config_path
+        self.config = config  # config dict (or YAML path)
+        self.target = target  # pre-parsed TargetNetwork, loaded from the config if None
         self.show_full_plot = show_full_plot
         self.log_scale = log_scale
         self.method = method
         self.latest_network = None
         self.log_interval = 1  # default fallback
+        self.telemetry_settings = {}
+        self.profile = False  # per-phase timings only when the run opts in
+        # Progress snapshots for the GUI - created unparented so it stays on the GUI thread after moveToThread
+        self.channel = ProgressChannel()
+        # Stop / pause requests from the GUI thread; the search polls it, so these are plain method calls
+        self.cancel_token = CancellationToken()
 
         # Load log_interval from config
         try:
-            with open(self.config_path, "r") as f:
-                config_data = yaml.safe_load(f)
-                self.log_interval = config_data.get("log_interval", 1)
+            if isinstance(self.config, dict):
+                config_data = self.config
+            else:
+                with open(self.config, "r") as f:
+                    config_data = yaml.safe_load(f)
+            self.log_interval = config_data.get("log_interval", 1)
+            self.telemetry_settings = config_data.get("telemetry", {})
+            self.profile = config_data.get("profile", False)
         except Exception as e:
             print("⚠️ Could not read log_interval from config, using default 1:", e)
 
+    def stop(self):
+        """
+        Stops the search at its next check; the run still finishes with its best-so-far network and logs.
+        """
+        self.cancel_token.cancel()
+
+    def pause(self):
+        self.cancel_token.pause()
+
+    def resume(self):
+        self.cancel_token.resume()
+
     def run(self):
-        history, final_network, _, final_step = run_backend(
-            self.config_path,
-            progress_callback=self._handle_progress,
-            show_full_plot=self.show_full_plot,
-        )
+        try:
+            self._run()
+        finally:
+            self.finished.emit()
+
+    def _run(self):
+        self.profiler = PhaseProfiler(enabled=self.profile)
+        self.telemetry = TelemetryRecorder(**self.telemetry_settings)
+        # Wiring/attractor analysis of progress snapshots runs beside the search, not inside its callback
+        self.analyser = StructureAnalyser(self._emit_structure)
+        try:
+            history, final_network, _, final_step = run_backend(
+                self.config,
+                progress_callback=self._handle_progress,
+                show_full_plot=self.show_full_plot,
+                target=self.target,
+                profiler=self.profiler,
+                cancel_token=self.cancel_token,
+                telemetry=self.telemetry,
+            )
+        finally:
+            # Stale live results must not arrive after the final ones below
+            self.analyser.close()
+        if self.profiler.stats:
+            self.profile_ready.emit(self.profiler.format_report())
 
         self.latest_network = final_network
 
         if self.show_full_plot:
-            self.done_with_history.emit(history, self.method, self.log_scale)
+            steps = list(self.telemetry.steps) if self.telemetry.count else list(range(len(history)))
+            self.done_with_history.emit(steps, list(history), self.method, self.log_scale)
         # Emit final wiring and attractor updates if available
         if self.latest_network:
             try:
@@ -51,19 +101,18 @@ class BackendRunner(QObject):
 
 
     def _handle_progress(self, step, cost, evolving_network=None):
-        self.progress.emit(step, cost)
+        self.channel.publish(step, cost, evolving_network.current_rules if evolving_network is not None else None)
         self.latest_network = evolving_network
 
         if evolving_network is None:
             return
 
         if step % self.log_interval == 0:
-            deps = evolving_network.infer_wiring()
-            graph = evolving_network.build_wiring_graph(deps)
-            self.wiring_update.emit(graph)
+            self.analyser.submit(step, evolving_network.current_rules)
 
-            attractors = evolving_network.detect_attractors()
-            self.attractors_update.emit((step, attractors))
+    def _emit_structure(self, step, graph, attractors):
+        self.wiring_update.emit(graph)
+        self.attractors_update.emit((step, attractors))
 
     def get_current_rules(self):
         return self.latest_network.current_rules if self.latest_network else None
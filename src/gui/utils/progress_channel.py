@@ -0,0 +1,53 @@
+from collections import deque, namedtuple
+
+from PySide6.QtCore import QObject, Signal
+
+# One progress update from the backend: rules is the evolving network's rule list at that step
+ProgressSnapshot = namedtuple("ProgressSnapshot", ["step", "cost", "rules"])
+
+
+class ProgressChannel(QObject):
+    """
+    In-memory channel from the backend thread to the GUI, replacing the temp-file JSON that was polled on a timer.
+
+    The backend publishes snapshots into a bounded ring buffer (deque appends and pops are atomic, so no lock is
+    needed) and at most one `ready` signal is queued at a time - a slow GUI coalesces many updates into one.
+    The GUI drains the buffer with take() (every point since the last read, for cost curves) or reads only the
+    newest snapshot with latest().
+    """
+    ready = Signal()
+
+    def __init__(self, capacity=10000, parent=None):
+        super().__init__(parent)
+        self._buffer = deque(maxlen=capacity)
+        self._latest = None
+        self._notified = False
+
+    def publish(self, step, cost, rules=None):
+        snapshot = ProgressSnapshot(step, cost, rules)
+        self._buffer.append(snapshot)
+        self._latest = snapshot
+        if not self._notified:
+            self._notified = True
+            self.ready.emit()
+
+    def take(self):
+        """
+        Returns every snapshot published since the last take (oldest first, bounded by capacity).
+        """
+        # Re-arm before draining so a publish racing with the drain still gets a signal out
+        self._notified = False
+        snapshots = []
+        while True:
+            try:
+                snapshots.append(self._buffer.popleft())
+            except IndexError:
+                return snapshots
+
+    def latest(self):
+        return self._latest
+
+    def clear(self):
+        self._buffer.clear()
+        self._latest = None
+        self._notified = False
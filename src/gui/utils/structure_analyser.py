@@ -0,0 +1,69 @@
+import threading
+
+from src.boolean_network_representation.network import BooleanNetwork
+
+
+def truth_table_key(network):
+    """
+    Hashable fingerprint of a network's behaviour: its next state for every state, in state order.
+    """
+    return tuple(tuple(next_state) for next_state in network.generate_truth_table().values())
+
+
+class StructureAnalyser:
+    """
+    Runs wiring inference and attractor detection for live progress updates on a background thread,
+    so the optimiser's progress callback only hands over a rules snapshot.
+
+    Requests are coalesced: there is a single pending slot, so a newer snapshot replaces one that has
+    not been started yet and only the latest is ever analysed. A snapshot whose truth table matches
+    the last analysed one is skipped. Results go to on_result(step, wiring_graph, attractors).
+    """
+
+    def __init__(self, on_result):
+        self.on_result = on_result
+        self._pending = None
+        self._last_key = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="structure-analyser", daemon=True)
+        self._thread.start()
+
+    def submit(self, step, rules):
+        with self._condition:
+            self._pending = (step, rules)  # stale request (if any) is dropped
+            self._condition.notify()
+
+    def close(self):
+        """
+        Drops any pending request and waits for the analysis in progress to finish.
+        """
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                step, rules = self._pending
+                self._pending = None
+
+            try:
+                network = BooleanNetwork(len(rules), rule_source="manual")
+                network.current_rules = rules
+                key = truth_table_key(network)
+                if key == self._last_key:
+                    continue
+                self._last_key = key
+
+                graph = network.build_wiring_graph(network.infer_wiring())
+                attractors = network.detect_attractors()
+                self.on_result(step, graph, attractors)
+            except Exception as e:
+                print(f"⚠️ Live structure analysis failed at step {step}: {e}")
@@ -0,0 +1,275 @@
+import numpy as np
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+FILTER_WILDCARDS = "?*-"
+
+# Qt enum attribute lookups are slow in PySide6 and data() runs per cell per role, so resolve them once
+_TEXT_ROLES = (Qt.DisplayRole, Qt.EditRole)
+_DISPLAY_ROLE = Qt.DisplayRole
+_EDIT_ROLE = Qt.EditRole
+_BACKGROUND_ROLE = Qt.BackgroundRole
+_HORIZONTAL = Qt.Horizontal
+_VERTICAL = Qt.Vertical
+_NO_FLAGS = Qt.NoItemFlags
+_CELL_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_EDITABLE_FLAGS = _CELL_FLAGS | Qt.ItemIsEditable
+_EDITABLE = Qt.ItemIsEditable
+
+
+def pack_truth_table(truth_table, entity_count):
+    """
+    Packs {input_state: next_state} into two arrays indexed by the input state's integer value:
+    outputs[s] holds the next state's bits (first entity = most significant bit) and defined[s] marks which
+    of those bits are known. States missing from the table are left undefined.
+    """
+    outputs = np.zeros(2 ** entity_count, dtype=np.uint32)
+    defined = np.zeros(2 ** entity_count, dtype=np.uint32)
+    full = (1 << entity_count) - 1
+    for state, next_state in truth_table.items():
+        index = int(state, 2)
+        outputs[index] = int("".join(str(bit) for bit in next_state), 2)
+        defined[index] = full
+    return outputs, defined
+
+
+class TruthTableModel(QAbstractTableModel):
+    """
+    Truth table model backed by the packed arrays from pack_truth_table, for use with a QTableView.
+
+    Cells are produced in data() as the view asks for them, so only visible rows are ever materialised.
+    Sorting and output-pattern filtering only rebuild an index array of the states to show, in order;
+    the packed data is never copied. With editable=True the output cells accept "0", "1" or blank.
+    """
+
+    def __init__(self, entities, outputs=None, defined=None, editable=False, spacer=False, parent=None):
+        super().__init__(parent)
+        self.entities = list(entities)
+        self.entity_count = len(self.entities)
+        self.size = 2 ** self.entity_count
+        self.outputs = outputs if outputs is not None else np.zeros(self.size, dtype=np.uint32)
+        self.defined = defined if defined is not None else np.zeros(self.size, dtype=np.uint32)
+        self.editable = editable
+        self.spacer = spacer
+        self.output_offset = self.entity_count + (1 if spacer else 0)
+
+        self._rows = None  # states to show in view order; None shows every state in state order
+        self._sort = None  # (column, Qt.SortOrder)
+        self._filter = None  # (mask, value) over the packed outputs
+        self._highlight = None  # (state, entity) of an output cell flagged invalid
+
+    @classmethod
+    def from_truth_table(cls, truth_table, entities, **kwargs):
+        outputs, defined = pack_truth_table(truth_table, len(entities))
+        return cls(entities, outputs, defined, **kwargs)
+
+    # --------------------
+    # Qt model interface
+    # --------------------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.size if self._rows is None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.output_offset + self.entity_count
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == _VERTICAL:
+            return str(self.state_for_row(section) + 1)  # row labels follow the state through sorting/filtering
+        if section < self.entity_count:
+            return self.entities[section]
+        if section < self.output_offset:
+            return " "
+        return f"{self.entities[section - self.output_offset]}'"
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role in _TEXT_ROLES:
+            state = self.state_for_row(index.row())
+            if column < self.entity_count:
+                return str((state >> self._shift(column)) & 1)
+            if column < self.output_offset:
+                return ""
+            return self._output_text(state, column - self.output_offset)
+        if role == _BACKGROUND_ROLE and self._highlight is not None and column >= self.output_offset:
+            if self._highlight == (self.state_for_row(index.row()), column - self.output_offset):
+                return QColor(Qt.red)
+        return None
+
+    def flags(self, index):
+        if not index.isValid() or self.output_offset > index.column() >= self.entity_count:
+            return _NO_FLAGS
+        if self.editable and index.column() >= self.output_offset:
+            return _EDITABLE_FLAGS
+        return _CELL_FLAGS
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != _EDIT_ROLE or not (self.flags(index) & _EDITABLE):
+            return False
+        value = str(value).strip()
+        if value not in ("0", "1", ""):
+            return False
+
+        state = self.state_for_row(index.row())
+        entity = index.column() - self.output_offset
+        bit = np.uint32(1 << self._shift(entity))
+        if value == "":
+            self.defined[state] &= ~bit
+        else:
+            self.defined[state] |= bit
+            if value == "1":
+                self.outputs[state] |= bit
+            else:
+                self.outputs[state] &= ~bit
+        if self._highlight == (state, entity):
+            self._highlight = None
+        self.dataChanged.emit(index, index)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort = (column, order) if 0 <= column < self.columnCount() else None
+        self._update_rows()
+
+    # --------------------
+    # Filtering / lookup
+    # --------------------
+    def set_output_filter(self, pattern):
+        """
+        Shows only states whose next state matches pattern, one character per entity: 0, 1 or a wildcard
+        (? * -). A blank pattern shows every state. Raises ValueError for a malformed pattern.
+        """
+        pattern = pattern.replace(" ", "")
+        if not pattern:
+            self._filter = None
+        else:
+            if len(pattern) != self.entity_count or any(c not in "01" + FILTER_WILDCARDS for c in pattern):
+                raise ValueError(f"Pattern must be {self.entity_count} characters of 0, 1 or ?")
+            mask = int("".join("0" if c in FILTER_WILDCARDS else "1" for c in pattern), 2)
+            value = int("".join("1" if c == "1" else "0" for c in pattern), 2)
+            self._filter = (mask, value)
+        self._update_rows()
+
+    def state_for_row(self, row):
+        return row if self._rows is None else int(self._rows[row])
+
+    def state_string(self, state):
+        return format(state, f"0{self.entity_count}b")
+
+    def index_for(self, state, entity):
+        """
+        Model index of a state's output cell, or an invalid index if that state is filtered out.
+        """
+        if self._rows is None:
+            row = state
+        else:
+            rows = np.flatnonzero(self._rows == state)
+            if not len(rows):
+                return QModelIndex()
+            row = int(rows[0])
+        return self.index(row, self.output_offset + entity)
+
+    def highlight(self, state, entity):
+        """
+        Marks one output cell as invalid (drawn red) until it is edited or the highlight is cleared.
+        """
+        previous, self._highlight = self._highlight, (state, entity)
+        for cell in (previous, self._highlight):
+            if cell is not None:
+                index = self.index_for(*cell)
+                if index.isValid():
+                    self.dataChanged.emit(index, index, [_BACKGROUND_ROLE])
+
+    def clear_highlight(self):
+        previous, self._highlight = self._highlight, None
+        if previous is not None:
+            index = self.index_for(*previous)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [_BACKGROUND_ROLE])
+
+    def to_truth_table(self):
+        """
+        {input_state: [bit, ...]} for every state, in state order; undefined cells are "".
+        """
+        return {
+            self.state_string(state): [self._output_value(state, entity) for entity in range(self.entity_count)]
+            for state in range(self.size)
+        }
+
+    # --------------------
+    # Internals
+    # --------------------
+    def _shift(self, entity):
+        return self.entity_count - 1 - entity
+
+    def _output_value(self, state, entity):
+        shift = self._shift(entity)
+        if not (int(self.defined[state]) >> shift) & 1:
+            return ""
+        return (int(self.outputs[state]) >> shift) & 1
+
+    def _output_text(self, state, entity):
+        return str(self._output_value(state, entity))
+
+    def _column_key(self, column, states):
+        if column < self.entity_count:
+            return (states >> self._shift(column)) & 1
+        if column < self.output_offset:
+            return np.zeros(len(states), dtype=np.uint32)
+        shift = self._shift(column - self.output_offset)
+        bits = (self.outputs[states] >> shift) & 1
+        return np.where((self.defined[states] >> shift) & 1, bits, 2)  # blanks sort last
+
+    def _update_rows(self):
+        self.beginResetModel()
+        if self._filter is None and self._sort is None:
+            self._rows = None
+        else:
+            states = np.arange(self.size, dtype=np.uint32)
+            if self._filter is not None:
+                mask, value = self._filter
+                matches = ((self.outputs & mask) == value) & ((self.defined & mask) == mask)
+                states = states[matches]
+            if self._sort is not None:
+                column, order = self._sort
+                key = self._column_key(column, states).astype(np.int64)
+                if order == Qt.DescendingOrder:
+                    key = -key
+                states = states[np.argsort(key, kind="stable")]
+            self._rows = states
+        self.endResetModel()
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    Read-only view of a pandas DataFrame; cells are formatted only when the view shows them.
+    """
+
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self.df = df
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.df.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == _HORIZONTAL:
+            return str(self.df.columns[section])
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == _DISPLAY_ROLE:
+            return str(self.df.iat[index.row(), index.column()])
+        return None
@@ -0,0 +1,116 @@
+import math
+from collections import OrderedDict
+
+import networkx as nx
+
+from src.boolean_network_representation.state_space import successor_array, basin_decomposition, transitions_key
+
+LAYOUT_MODES = ("auto", "basin", "spring", "incremental")
+AUTO_BASIN_THRESHOLD = 64  # state graphs above this many states default to the basin layout
+INCREMENTAL_ITERATIONS = 15
+CACHE_SIZE = 32
+
+# (mode, transition table hash) -> {state: (x, y)}, least recently used first
+_layout_cache = OrderedDict()
+
+
+def basin_tree_layout(transitions, ring_step=1.0):
+    """
+    Deterministic layout in linear time from the successor array: each attractor cycle is a ring,
+    its transient trees radiate outward (one ring per step from the cycle) inside angular sectors sized
+    by subtree, and basins are tiled on a grid, largest first.
+    """
+    states, successors = successor_array(transitions)
+    cycles, basin, depth = basin_decomposition(successors)
+    n = len(states)
+
+    max_depth = max(depth, default=0)
+    by_depth = [[] for _ in range(max_depth + 1)]
+    for i in range(n):
+        by_depth[depth[i]].append(i)
+
+    # Subtree sizes, deepest states first
+    weight = [1] * n
+    for d in range(max_depth, 0, -1):
+        for i in by_depth[d]:
+            weight[successors[i]] += weight[i]
+
+    children = [[] for _ in range(n)]
+    for d in range(1, max_depth + 1):
+        for i in by_depth[d]:
+            children[successors[i]].append(i)
+
+    # Angular sectors: cycle states share the full circle, children split their parent's sector
+    sector_start = [0.0] * n
+    sector_span = [0.0] * n
+    for cycle in cycles:
+        total = sum(weight[i] for i in cycle)
+        cursor = 0.0
+        for i in cycle:
+            sector_start[i] = cursor
+            sector_span[i] = 2 * math.pi * weight[i] / total
+            cursor += sector_span[i]
+    for d in range(max_depth + 1):
+        for parent in by_depth[d]:
+            child_total = weight[parent] - 1
+            cursor = sector_start[parent]
+            for child in children[parent]:
+                sector_start[child] = cursor
+                sector_span[child] = sector_span[parent] * weight[child] / child_total
+                cursor += sector_span[child]
+
+    # Ring radii per basin
+    cycle_radius = [max(0.5, 0.15 * len(cycle)) for cycle in cycles]
+    basin_depth = [0] * len(cycles)
+    for i in range(n):
+        basin_depth[basin[i]] = max(basin_depth[basin[i]], depth[i])
+    extent = [cycle_radius[k] + basin_depth[k] * ring_step for k in range(len(cycles))]
+
+    # Tile basins on a square-ish grid, largest basin first
+    order = sorted(range(len(cycles)), key=lambda k: -extent[k])
+    columns = max(1, math.ceil(math.sqrt(len(cycles))))
+    cell = 2 * max(extent, default=1.0) + ring_step
+    centre = [None] * len(cycles)
+    for slot, k in enumerate(order):
+        centre[k] = ((slot % columns) * cell, -(slot // columns) * cell)
+
+    pos = {}
+    for i in range(n):
+        k = basin[i]
+        radius = cycle_radius[k] + depth[i] * ring_step
+        angle = sector_start[i] + sector_span[i] / 2
+        pos[states[i]] = (centre[k][0] + radius * math.cos(angle), centre[k][1] + radius * math.sin(angle))
+    return pos
+
+
+def state_graph_layout(graph, transitions, mode="auto", previous=None):
+    """
+    Node positions for a state graph, cached by transition-table hash so an unchanged table is never
+    laid out twice.
+
+    Modes: "basin" (basin_tree_layout), "spring" (seeded force layout), "incremental" (a short force
+    layout starting from the previous positions, so live updates move nodes smoothly) and "auto"
+    (basin layout for large graphs, spring otherwise).
+    """
+    if mode not in LAYOUT_MODES:
+        raise ValueError(f"Unknown layout mode '{mode}' (choose from {', '.join(LAYOUT_MODES)})")
+    if mode == "auto":
+        mode = "basin" if graph.number_of_nodes() > AUTO_BASIN_THRESHOLD else "spring"
+
+    key = (mode, transitions_key(transitions))
+    if key in _layout_cache:
+        _layout_cache.move_to_end(key)
+        return _layout_cache[key]
+
+    if mode == "basin":
+        pos = basin_tree_layout(transitions)
+    elif mode == "incremental" and previous:
+        start = {node: previous[node] for node in graph if node in previous}
+        pos = nx.spring_layout(graph, pos=start or None, iterations=INCREMENTAL_ITERATIONS, seed=42)
+    else:
+        pos = nx.spring_layout(graph, seed=42)
+
+    _layout_cache[key] = pos
+    if len(_layout_cache) > CACHE_SIZE:
+        _layout_cache.popitem(last=False)
+    return pos
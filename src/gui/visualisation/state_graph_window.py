@@ -3,18 +3,23 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import networkx as nx
 
+from src.gui.visualisation.state_graph_layout import state_graph_layout
+
+LABEL_LIMIT = 64  # above this many states, labels and large markers are dropped
+
 class StateGraphWindow(QMainWindow):
     """
     A window that displays the state-transition graph of a Boolean Network,
     highlighting the attractors (cycles) in a different color.
     """
-    def __init__(self, transitions, attractors, title="State Graph", parent=None):
+    def __init__(self, transitions, attractors, title="State Graph", parent=None, layout="auto"):
         """
         Args:
             transitions: dict of {state_str: next_state_str}
             attractors: list of attractor cycles, each cycle is a list of states
             title: Window title
             parent: Optional parent widget
+            layout: "auto", "basin", "spring" or "incremental" (see state_graph_layout)
         """
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -23,6 +28,8 @@ class StateGraphWindow(QMainWindow):
         # Store data for later re-draw
         self.transitions = transitions
         self.attractors = attractors
+        self.layout = layout
+        self.pos = None
 
         # Set up the Matplotlib canvas
         layout = QVBoxLayout()
@@ -61,10 +68,10 @@ class StateGraphWindow(QMainWindow):
                 dst = cycle[(i + 1) % len(cycle)]
                 attractor_edges.add((src, dst))
 
-        # 3. Layout
-        # We'll keep a consistent layout by sorting states, or you can use spring_layout
-        # for a more dynamic display. For large networks, spring_layout might look better.
-        pos = nx.spring_layout(G, seed=42)
+        # 3. Layout - cached per transition table; incremental mode starts from the previous positions
+        pos = state_graph_layout(G, self.transitions, mode=self.layout, previous=self.pos)
+        self.pos = pos
+        small = G.number_of_nodes() <= LABEL_LIMIT
 
         # 4. Draw nodes
         #    - attractor nodes in one color, non-attractor in another
@@ -75,8 +82,9 @@ class StateGraphWindow(QMainWindow):
             else:
                 node_colors.append("lightgray")
 
-        nx.draw_networkx_nodes(G, pos, node_size=1200, ax=self.ax, node_color=node_colors)
-        nx.draw_networkx_labels(G, pos, ax=self.ax, font_size=10)
+        nx.draw_networkx_nodes(G, pos, node_size=1200 if small else 20, ax=self.ax, node_color=node_colors)
+        if small:
+            nx.draw_networkx_labels(G, pos, ax=self.ax, font_size=10)
 
         # 5. Draw edges
         #    - attractor edges in thick red, others in black
@@ -86,8 +94,13 @@ class StateGraphWindow(QMainWindow):
                 continue
             normal_edges.append(e)
 
-        nx.draw_networkx_edges(G, pos, edgelist=normal_edges, ax=self.ax,
-                               edge_color="black", arrows=True, connectionstyle='arc3,rad=0.1')
+        if small:
+            nx.draw_networkx_edges(G, pos, edgelist=normal_edges, ax=self.ax,
+                                   edge_color="black", arrows=True, connectionstyle='arc3,rad=0.1')
+        else:
+            # Plain line collection - one arrow patch per edge is far too slow for 2^n states
+            nx.draw_networkx_edges(G, pos, edgelist=normal_edges, ax=self.ax,
+                                   edge_color="black", arrows=False, width=0.4)
 
         # highlight attractor edges
         nx.draw_networkx_edges(G, pos, edgelist=list(attractor_edges), ax=self.ax,
@@ -26,3 +26,42 @@ def attractor_difference_cost(target_attractors, observed_attractors, weight_mis
     # Weighted cost: missing and extra attractors
     cost = weight_missing * sum(missing.values()) + weight_extra * sum(extra.values())
     return cost
+
+
+def attractors_from_trace(trace):
+    """
+    Finds the attractor cycles of a truth table {state: next_state_list} directly, without rebuilding rules.
+    Cycles use the same minimum-rotation form as BooleanNetwork.detect_attractors.
+    """
+    next_of = {state: "".join(map(str, next_state)) for state, next_state in trace.items()}
+    attractors = []
+    seen = set()
+
+    for initial_state in next_of:
+        if initial_state in seen:
+            continue
+        path = {}
+        current = initial_state
+        while current not in path and current not in seen:
+            path[current] = len(path)
+            current = next_of[current]
+        seen.update(path)
+
+        if current in path:  # closed a new cycle on this walk
+            cycle = list(path)[path[current]:]
+            attractors.append(min(cycle[i:] + cycle[:i] for i in range(len(cycle))))
+
+    return attractors
+
+
+def attractor_trace_cost(desired_trace, current_trace, target_attractors, weight_missing=1.0, weight_extra=1.0):
+    """
+    Attractor difference cost computed from the candidate truth table itself.
+    Module-level (picklable) so it can be handed to worker processes, e.g. with functools.partial.
+    """
+    return attractor_difference_cost(
+        target_attractors,
+        attractors_from_trace(current_trace),
+        weight_missing=weight_missing,
+        weight_extra=weight_extra
+    )
@@ -0,0 +1,59 @@
+"""
+Cooperative cancellation and pause for running searches.
+
+A CancellationToken is shared between whoever controls a run (a GUI button, a batch) and the search loop.
+The search calls checkpoint() at cheap intervals - every CHECK_INTERVAL SA iterations, every GA generation -
+which blocks while the token is paused and returns True once it is cancelled. A cancelled search stops like
+an early-stopped one, so the run still returns and logs its best-so-far network.
+"""
+import time
+import threading
+
+CHECK_INTERVAL = 64  # SA iterations between token checks
+
+
+class CancellationToken:
+    """
+    Stop / pause flag for one run or batch. Pass a multiprocessing context to share it with worker
+    processes (through a pool initializer - multiprocessing Events can only be shared by inheritance).
+
+    is_set() mirrors threading.Event, so a token can be passed wherever a stop_event is accepted.
+    """
+
+    def __init__(self, ctx=None):
+        events = ctx if ctx is not None else threading
+        self._cancelled = events.Event()
+        self._running = events.Event()
+        self._running.set()
+        self.paused_time = 0.0  # seconds this process spent blocked in checkpoint()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._running.set()  # wake a paused search so it can stop
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def is_set(self):
+        return self._cancelled.is_set()
+
+    def checkpoint(self):
+        """
+        Blocks while paused; returns True if the run should stop.
+        """
+        if not self._running.is_set():
+            start = time.perf_counter()
+            self._running.wait()
+            self.paused_time += time.perf_counter() - start
+        return self._cancelled.is_set()
@@ -0,0 +1,187 @@
+import os
+import glob
+import gzip
+import json
+import time
+import pickle
+import hashlib
+
+try:
+    import fcntl
+except ImportError:  # Windows - run locks fall back to a heartbeat on the lock file
+    fcntl = None
+
+CHECKPOINT_FILENAME = "checkpoint.pkl.gz"
+LOCK_FILENAME = "checkpoint.lock"
+LOCK_STALE_SECONDS = 600  # without fcntl, a lock not refreshed for this long belongs to a dead run
+
+# Config keys that do not change the search itself - ignored when matching a checkpoint to a config
+VOLATILE_CONFIG_KEYS = {
+    "load_network_path", "batch_output_dir", "is_batch", "experiment_name", "network_name", "log_interval",
+    "live_update_interval", "generate_graphs", "log_results", "rules", "checkpoint_interval", "resume", "log_y",
+    "plot_progress", "results_db", "profile",
+}
+
+
+def config_fingerprint(config, desired_trace, run_key=None):
+    """
+    Hash of the search-relevant config plus the target truth table, used to match checkpoints to runs.
+    run_key identifies one run among identical ones (a batch's (experiment, repetition)), so each only
+    ever resumes its own checkpoint.
+    """
+    relevant = {k: v for k, v in config.items() if k not in VOLATILE_CONFIG_KEYS}
+    payload = json.dumps({"config": relevant, "target": desired_trace, "run": run_key}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class RunLock:
+    """
+    Marks a run directory as owned by a live run, so its checkpoint is never resumed from under it.
+
+    With fcntl the lock is an flock on the lock file, which the OS drops when the owner exits or crashes.
+    Without it the owner's pid is written to the file and its mtime is refreshed on every checkpoint;
+    a lock older than LOCK_STALE_SECONDS counts as abandoned.
+    """
+
+    def __init__(self, run_dir):
+        self.path = os.path.join(run_dir, LOCK_FILENAME)
+        self._file = None
+
+    def acquire(self):
+        """
+        Returns True if this process now owns the run directory, False if a live run holds it.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if fcntl is None:
+            try:
+                if time.time() - os.path.getmtime(self.path) < LOCK_STALE_SECONDS:
+                    return False
+            except OSError:
+                pass  # no lock file - nobody owns the directory
+            with open(self.path, "w") as f:
+                f.write(str(os.getpid()))
+            return True
+
+        f = open(self.path, "a+")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        f.seek(0)
+        f.truncate()
+        f.write(str(os.getpid()))
+        f.flush()
+        self._file = f
+        return True
+
+    def heartbeat(self):
+        if fcntl is None:
+            try:
+                os.utime(self.path)
+            except OSError:
+                pass
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Checkpointer:
+    """
+    Periodically writes the full optimiser state to a compressed pickle in the run directory.
+    Writes go to a temp file and are swapped in with os.replace, so a crash mid-write never corrupts
+    the previous checkpoint. The run directory is locked (RunLock) until clear(), so other runs only
+    resume it once its owner has died.
+    """
+
+    def __init__(self, run_dir, interval, metadata=None, lock=None):
+        self.path = os.path.join(run_dir, CHECKPOINT_FILENAME)
+        self.interval = interval
+        self.metadata = metadata or {}
+        self.lock = lock
+        if self.lock is None:
+            self.lock = RunLock(run_dir)
+            self.lock.acquire()  # fresh run directory - nobody else can hold it
+
+    def due(self, step):
+        return bool(self.interval) and step > 0 and step % self.interval == 0
+
+    def save(self, state):
+        temp_path = self.path + ".tmp"
+        with gzip.open(temp_path, "wb", compresslevel=3) as f:
+            pickle.dump({"metadata": self.metadata, "state": state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.path)
+        self.lock.heartbeat()
+
+    def clear(self):
+        """
+        Removes this run's checkpoint (and any claimed copy) once the run has finished, then unlocks the directory.
+        """
+        for path in glob.glob(self.path + "*"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.lock.release()
+
+
+def load_checkpoint(path):
+    with gzip.open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def claim_latest_checkpoint(search_dir, fingerprint, pattern="run_*", move_to=None):
+    """
+    Finds the most recent abandoned run under search_dir (pattern/checkpoint) whose fingerprint matches.
+    Runs whose owner still holds the directory's RunLock are skipped. The checkpoint is claimed by taking the
+    lock and renaming the file, so two new runs never resume the same one. With move_to, a claimed run folder
+    from elsewhere is moved into that directory (a restarted batch takes over runs from its previous batch folder).
+
+    Returns (run_dir, state, lock) - pass the lock on to the run's Checkpointer - or (None, None, None).
+    """
+    candidates = glob.glob(os.path.join(search_dir, pattern, CHECKPOINT_FILENAME))
+    candidates.sort(key=os.path.getmtime, reverse=True)
+
+    for path in candidates:
+        run_dir = os.path.dirname(path)
+        lock = RunLock(run_dir)
+        if not lock.acquire():
+            continue  # its run is still going
+
+        try:
+            checkpoint = load_checkpoint(path)
+        except Exception as e:
+            print(f"⚠️ Skipping unreadable checkpoint {path}: {e}")
+            lock.release()
+            continue
+
+        if checkpoint["metadata"].get("fingerprint") != fingerprint:
+            lock.release()
+            continue
+
+        claimed_path = f"{path}.{os.getpid()}.resumed"
+        try:
+            os.rename(path, claimed_path)
+        except OSError:
+            lock.release()
+            continue  # claimed by another run in the meantime
+
+        if move_to and os.path.abspath(os.path.dirname(run_dir)) != os.path.abspath(move_to):
+            moved_dir = os.path.join(move_to, os.path.basename(run_dir))
+            try:
+                os.makedirs(move_to, exist_ok=True)
+                os.rename(run_dir, moved_dir)
+                run_dir = moved_dir
+                lock.path = os.path.join(run_dir, LOCK_FILENAME)
+            except OSError as e:
+                print(f"⚠️ Resuming {run_dir} in place, could not move it into {move_to}: {e}")
+
+        return run_dir, checkpoint["state"], lock
+
+    return None, None, None
@@ -1,24 +1,12 @@
 
 import random
 import os
-import matplotlib.pyplot as plt
-import json
-from tempfile import gettempdir
 from src.inference_engine.crossover_strategies.one_point_crossover import one_point_crossover
+from src.inference_engine.metaheuristics.profiling import active_profiler, activate, profile_phase
+from src.inference_engine.metaheuristics.progress_sink import ProgressSink
 
+PROGRESS_TITLE = "Genetic Algorithm Progress @ Generation {step}"
 
-def write_live_json(step, rules, fitness, attractors=None):
-    if attractors is None:
-        attractors = []
-    output = {
-        "step": step,
-        "rules": {f"N{i + 1}": str(rules[i]) for i in range(len(rules))},
-        "fitness": fitness,
-        "attractors": attractors
-    }
-    path = os.path.join(gettempdir(), "current_evolution.json")
-    with open(path, "w") as f:
-        json.dump(output, f)
 
 def genetic_algorithm(
     network_class,
@@ -34,88 +22,130 @@ def genetic_algorithm(
     live_update_interval=2,
     cost_window=None,
     progress_callback=None,
-    log_results=False
+    log_results=False,
+    plot_progress=True,
+    checkpointer=None,
+    resume_state=None,
+    profiler=None,
+    cancel_token=None
 ):
-    population = [network_class(len(entities)) for _ in range(pop_size)]
-    best_network = None
-    best_cost = float('inf')
-    cost_progress = []
+    # Per-phase timings (no-op unless a profiler is passed or already active)
+    profiler = profiler if profiler is not None else active_profiler()
+
+    if resume_state is not None:
+        # Continue from a checkpoint written by a previous (crashed or interrupted) run
+        print(f"♻️ Resuming genetic algorithm from generation {resume_state['generation']}")
+        population = resume_state["population"]
+        best_network = resume_state["best_network"]
+        best_cost = resume_state["best_cost"]
+        cost_progress = resume_state["cost_progress"]
+        start_gen = resume_state["generation"]
+        random.setstate(resume_state["random_state"])
+    else:
+        population = [network_class(len(entities)) for _ in range(pop_size)]
+        best_network = None
+        best_cost = float('inf')
+        cost_progress = []
+        start_gen = 0
 
     run_dir = output_dir
     os.makedirs(run_dir, exist_ok=True)
 
+    # Cost points are buffered and plotted once at the end, off the search thread
+    sink = ProgressSink(run_dir, PROGRESS_TITLE, "Generation")
+    sink.extend(range(len(cost_progress)), cost_progress)
+
     #timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     #run_dir = os.path.join(output_dir, f"run_{timestamp}")
     #os.makedirs(run_dir, exist_ok=True)
 
-    def evaluate_population(population):
-        return [
-            cost_function(desired_trace, net.generate_truth_table())
-            for net in population
-        ]
-
-    for gen in range(max_gens):
-        costs = evaluate_population(population)
-        cost_progress.append(min(costs))
-
-        current_best = min(population, key=lambda net: cost_function(desired_trace, net.generate_truth_table()))
-        current_fitness = cost_function(desired_trace, current_best.generate_truth_table())
+    def evaluate(net):
+        with profiler.phase("truth_table"):
+            trace = net.generate_truth_table()
+        with profiler.phase("cost"):
+            return cost_function(desired_trace, trace)
 
-        # ✅ Always emit progress
-        if progress_callback and (gen % live_update_interval == 0):
-            progress_callback(gen, current_fitness, current_best)
+    def evaluate_population(population):
+        return [evaluate(net) for net in population]
+
+    with activate(profiler):
+        for gen in range(start_gen, max_gens):
+            costs = evaluate_population(population)
+            cost_progress.append(min(costs))
+            sink.append(gen, cost_progress[-1])
+
+            current_best = min(population, key=evaluate)
+            current_fitness = evaluate(current_best)
+
+            # ✅ Always emit progress
+            if progress_callback and (gen % live_update_interval == 0):
+                with profiler.phase("callbacks"):
+                    progress_callback(gen, current_fitness, current_best)
+
+            with profiler.phase("selection"):
+                sorted_population = [x for _, x in sorted(zip(costs, population), key=lambda pair: pair[0])]
+                selected_parents = sorted_population[:pop_size // 2]
+
+            population = breed_next_generation(selected_parents, pop_size, crossover_rate, mutation_rate, mutation_function)
+            best_network = min(population, key=evaluate)
+            best_cost = evaluate(best_network)
+
+            if gen % live_update_interval == 0:
+                print(f"Generation {gen}: Best Cost = {best_cost}")
+
+            # ✅ Early stopping condition
+            if best_cost == 0:
+                print(f"✅ Early stopping at generation {gen} — cost reached 0.")
+                break
+
+            if checkpointer is not None and checkpointer.due(gen + 1):
+                with profiler.phase("checkpoint"):
+                    checkpointer.save({
+                        "algorithm": "genetic_algorithm",
+                        "generation": gen + 1,
+                        "population": population,
+                        "best_network": best_network,
+                        "best_cost": best_cost,
+                        "cost_progress": cost_progress,
+                        "random_state": random.getstate(),
+                    })
+
+            # Stop / pause between generations - the best network so far is still returned
+            if cancel_token is not None and cancel_token.checkpoint():
+                print(f"⏹️ Genetic algorithm stopped at generation {gen}")
+                break
+
+    if log_results and plot_progress:
+        with profiler.phase("plotting"):
+            sink.render()
 
-        sorted_population = [x for _, x in sorted(zip(costs, population), key=lambda pair: pair[0])]
-        selected_parents = sorted_population[:pop_size // 2]
+    best_rules_named = {entities[i]: rule for i, rule in enumerate(best_network.current_rules)}
+    final_step = len(cost_progress) - 1
+    return best_rules_named, best_cost, cost_progress, final_step
 
-        next_generation = []
-        while len(next_generation) < pop_size:
-            parent1, parent2 = random.sample(selected_parents, 2)
+def breed_next_generation(selected_parents, pop_size, crossover_rate, mutation_rate, mutation_function):
+    """
+    Builds the next generation from the selected parents via one-point crossover and mutation.
+    Shared by the single-population GA and the island model.
+    """
+    next_generation = []
+    while len(next_generation) < pop_size:
+        parent1, parent2 = random.sample(selected_parents, 2)
+        with profile_phase("crossover"):
             child = one_point_crossover(parent1, parent2) if random.random() < crossover_rate else parent1
-            if random.random() < mutation_rate:
+        if random.random() < mutation_rate:
+            with profile_phase("truth_table"):
                 truth_table = child.generate_truth_table()
+            with profile_phase("mutation"):
                 _, mutated_rules = mutation_function(child, truth_table)
-                child.current_rules = mutated_rules
-            next_generation.append(child)
-
-        population = next_generation
-        best_network = min(population, key=lambda net: cost_function(desired_trace, net.generate_truth_table()))
-        best_cost = cost_function(desired_trace, best_network.generate_truth_table())
-
-        if gen % live_update_interval == 0:
-            print(f"Generation {gen}: Best Cost = {best_cost}")
-            _plot_progress(cost_progress, gen, run_dir)
-
-        # ✅ Early stopping condition
-        if best_cost == 0:
-            print(f"✅ Early stopping at generation {gen} — cost reached 0.")
-            break
-
-
-    if log_results:
-        _plot_progress(cost_progress, max_gens, run_dir)
-    # ✅ Delete all other progress plots except the final one
-    final_plot = f"progress_{len(cost_progress) - 1}.png"
-    for fname in os.listdir(run_dir):
-        if fname.startswith("progress_") and fname.endswith(".png") and fname != final_plot:
-            try:
-                os.remove(os.path.join(run_dir, fname))
-            except Exception as e:
-                print(f"⚠️ Could not delete {fname}: {e}")
-
-    best_rules_named = {entities[i]: rule for i, rule in enumerate(best_network.current_rules)}
-    final_step = len(cost_progress) - 1
-    return best_rules_named, best_cost, cost_progress, final_step
+            child.current_rules = mutated_rules
+        next_generation.append(child)
+    return next_generation
 
 def _plot_progress(costs, step, out_dir):
-    plt.figure(figsize=(10, 5))
-    plt.plot(costs)
-    plt.yscale('linear')
-    plt.xlabel("Generation")
-    plt.ylabel("Cost")
-    plt.title(f"Genetic Algorithm Progress @ Generation {step}")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(os.path.join(out_dir, f"progress_{step}.png"))
-    plt.close()
-
+    """
+    Queues the progress plot for a finished cost list on the background render thread.
+    """
+    sink = ProgressSink(out_dir, PROGRESS_TITLE, "Generation")
+    sink.extend(range(len(costs)), costs)
+    return sink.render(step)
@@ -0,0 +1,205 @@
+import os
+import queue
+import random
+import traceback
+import multiprocessing as mp
+
+from src.inference_engine.metaheuristics.genetic_algorithm import breed_next_generation, _plot_progress
+
+
+def _run_island(
+    island_id,
+    seed,
+    network_class,
+    desired_trace,
+    pop_size,
+    max_gens,
+    crossover_rate,
+    mutation_rate,
+    entity_count,
+    cost_function,
+    mutation_function,
+    migration_interval,
+    migration_size,
+    live_update_interval,
+    inbox,
+    outbox,
+    events,
+    stop_event
+):
+    """
+    Worker process: evolves one subpopulation and exchanges its best individuals with the next island in the ring.
+    Reports progress and the final result over the shared events queue.
+    """
+    # Migration is best-effort - never block process exit on unread migrants
+    inbox.cancel_join_thread()
+    outbox.cancel_join_thread()
+
+    try:
+        random.seed(seed)
+        population = [network_class(entity_count) for _ in range(pop_size)]
+        cost_progress = []
+        best_network = None
+        best_cost = float('inf')
+
+        for gen in range(max_gens):
+            if stop_event.is_set():
+                break
+
+            costs = [cost_function(desired_trace, net.generate_truth_table()) for net in population]
+            ranked = sorted(zip(costs, range(len(population))), key=lambda pair: pair[0])
+            population = [population[i] for _, i in ranked]
+            costs = [c for c, _ in ranked]
+            cost_progress.append(costs[0])
+
+            if costs[0] < best_cost:
+                best_cost = costs[0]
+                best_network = population[0]
+
+            if gen % live_update_interval == 0:
+                events.put(("progress", island_id, (gen, costs[0], population[0])))
+
+            if best_cost == 0:
+                print(f"✅ Island {island_id} reached cost 0 at generation {gen}.")
+                stop_event.set()
+                break
+
+            # Migration: send best to neighbour, replace our worst with any migrants that have arrived and
+            # re-rank, so migrants that beat our parents get to breed
+            if migration_interval and gen > 0 and gen % migration_interval == 0:
+                outbox.put(population[:migration_size])
+                migrants = []
+                while True:
+                    try:
+                        migrants.extend(inbox.get_nowait())
+                    except queue.Empty:
+                        break
+                if migrants:
+                    migrants = migrants[:pop_size // 2]
+                    migrant_costs = [cost_function(desired_trace, net.generate_truth_table()) for net in migrants]
+                    keep = len(population) - len(migrants)
+                    merged = sorted(
+                        zip(costs[:keep] + migrant_costs, population[:keep] + migrants), key=lambda pair: pair[0]
+                    )
+                    population = [net for _, net in merged]
+
+            selected_parents = population[:pop_size // 2]
+            population = breed_next_generation(
+                selected_parents, pop_size, crossover_rate, mutation_rate, mutation_function
+            )
+
+        events.put(("result", island_id, (best_network, best_cost, cost_progress)))
+    except Exception:
+        events.put(("error", island_id, traceback.format_exc()))
+
+
+def island_genetic_algorithm(
+    network_class,
+    desired_trace,
+    pop_size,
+    max_gens,
+    crossover_rate,
+    mutation_rate,
+    entities,
+    cost_function,
+    mutation_function,
+    islands=None,
+    migration_interval=10,
+    migration_size=2,
+    seed=None,
+    output_dir="results",
+    live_update_interval=2,
+    progress_callback=None,
+    log_results=False,
+    plot_progress=True,
+    cancel_token=None
+):
+    """
+    Island-model Genetic Algorithm.
+
+    Runs `islands` subpopulations of `pop_size` in separate processes (one per core by default). Every
+    `migration_interval` generations each island sends its `migration_size` best individuals to the next
+    island in a ring. All islands stop as soon as any of them reaches cost 0, or when cancel_token is cancelled
+    (islands run independently, so they cannot be paused).
+
+    cost_function and mutation_function must be picklable (module-level functions or functools.partial).
+    Returns the same tuple as genetic_algorithm; the cost progress is the best cost across islands per generation.
+    """
+    islands = islands or os.cpu_count() or 1
+    migration_size = max(1, min(migration_size, pop_size // 2))
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+
+    run_dir = output_dir
+    os.makedirs(run_dir, exist_ok=True)
+
+    ctx = mp.get_context()
+    events = ctx.Queue()
+    stop_event = ctx.Event()
+    inboxes = [ctx.Queue() for _ in range(islands)]
+
+    processes = []
+    for island_id in range(islands):
+        process = ctx.Process(
+            target=_run_island,
+            args=(
+                island_id, base_seed + island_id, network_class, desired_trace, pop_size, max_gens,
+                crossover_rate, mutation_rate, len(entities), cost_function, mutation_function,
+                migration_interval, migration_size, live_update_interval,
+                inboxes[island_id], inboxes[(island_id + 1) % islands], events, stop_event
+            ),
+            daemon=True
+        )
+        process.start()
+        processes.append(process)
+
+    results = {}
+    errors = []
+    last_emitted_gen = -1
+    try:
+        while len(results) + len(errors) < islands:
+            if cancel_token is not None and cancel_token.is_set():
+                stop_event.set()  # islands finish their generation and report their best
+            try:
+                kind, island_id, payload = events.get(timeout=0.5)
+            except queue.Empty:
+                if not any(p.is_alive() for p in processes):
+                    break
+                continue
+
+            if kind == "progress":
+                gen, cost, network = payload
+                if gen > last_emitted_gen:
+                    last_emitted_gen = gen
+                    print(f"Island {island_id} Generation {gen}: Best Cost = {cost}")
+                    if progress_callback:
+                        progress_callback(gen, cost, network)
+            elif kind == "result":
+                results[island_id] = payload
+            else:
+                errors.append(payload)
+                stop_event.set()
+    finally:
+        stop_event.set()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    if not results:
+        raise RuntimeError("All islands failed:\n" + "\n".join(errors))
+
+    best_network, best_cost, _ = min(results.values(), key=lambda r: r[1])
+
+    # Global best-so-far per generation across islands (islands that stopped early hold their last value)
+    longest = max(len(progress) for _, _, progress in results.values())
+    cost_progress = [
+        min(progress[min(gen, len(progress) - 1)] for _, _, progress in results.values() if progress)
+        for gen in range(longest)
+    ]
+
+    if log_results and plot_progress:
+        _plot_progress(cost_progress, max_gens, run_dir)
+
+    best_rules_named = {entities[i]: rule for i, rule in enumerate(best_network.current_rules)}
+    final_step = len(cost_progress) - 1
+    return best_rules_named, best_cost, cost_progress, final_step
@@ -0,0 +1,128 @@
+import os
+import random
+import itertools
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.boolean_network_representation.network import BooleanNetwork
+from src.boolean_network_representation.rules import TruthTableToRules
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
+from src.inference_engine.metaheuristics.simulated_annealing import simulated_annealing, metropolis_acceptance
+
+# Set in each pool worker by _init_chain_worker - multiprocessing Events can only be shared through inheritance
+_stop_event = None
+
+
+def _init_chain_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+
+def random_network(entities):
+    """
+    Builds a network from a uniformly random truth table (same start as run_experiment).
+    """
+    input_states = [''.join(bits) for bits in itertools.product('01', repeat=len(entities))]
+    random_trace = {state: [random.randint(0, 1) for _ in entities] for state in input_states}
+    network = BooleanNetwork(len(entities), rule_source="manual")
+    network.current_rules = build_rules(TruthTableToRules.convert(random_trace, entities), entities)
+    return network
+
+
+def _run_chain(chain_id, seed, entities, desired_trace, cost_function, mutation_function,
+               temperature_schedule, max_iterations, log_interval, output_dir):
+    """
+    Pool task: one independently seeded SA chain from its own random start.
+    Sets the shared stop event when it solves the target so every other chain stops.
+    """
+    if _stop_event.is_set():
+        return {"chain": chain_id, "seed": seed, "skipped": True}
+
+    random.seed(seed)
+    best_rules, best_cost, cost_progress, temperatures, final_step = simulated_annealing(
+        network=random_network(entities),
+        desired_trace=desired_trace,
+        cost_function=cost_function,
+        mutation_function=mutation_function,
+        acceptance_function=metropolis_acceptance,
+        temperature_schedule=temperature_schedule,
+        entities=entities,
+        max_iterations=max_iterations,
+        log_interval=log_interval,
+        live_update_interval=max_iterations + 1,
+        output_dir=output_dir,
+        stop_event=_stop_event,
+    )
+
+    if best_cost == 0:
+        _stop_event.set()
+
+    return {
+        "chain": chain_id,
+        "seed": seed,
+        "skipped": False,
+        "best_rules": best_rules,
+        "best_cost": best_cost,
+        "cost_progress": cost_progress,
+        "temperatures": temperatures,
+        "final_step": final_step,
+    }
+
+
+def multi_start_simulated_annealing(
+    desired_trace,
+    cost_function,
+    mutation_function,
+    temperature_schedule,
+    entities,
+    starts=8,
+    workers=None,
+    max_iterations=100000,
+    log_interval=1000,
+    seed=None,
+    output_dir="results"
+):
+    """
+    Runs `starts` independently seeded SA chains in a process pool of `workers` processes.
+    A shared multiprocessing Event stops every chain as soon as any chain reaches cost 0; queued chains
+    that have not started yet are skipped.
+
+    cost_function and mutation_function must be picklable (module-level functions or functools.partial).
+
+    Returns the winning chain as (best_rules, best_cost, cost_progress, temperatures, final_step) followed by
+    the list of per-chain result dicts (chain, seed, best_cost, cost_progress, temperatures, final_step),
+    ordered by chain number. Skipped chains are omitted.
+    """
+    workers = workers or min(starts, os.cpu_count() or 1)
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    os.makedirs(output_dir, exist_ok=True)
+
+    ctx = mp.get_context()
+    stop_event = ctx.Event()
+    chains = []
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_chain_worker, initargs=(stop_event,)) as pool:
+        futures = [
+            pool.submit(_run_chain, chain_id, base_seed + chain_id, entities, desired_trace, cost_function,
+                        mutation_function, temperature_schedule, max_iterations, log_interval, output_dir)
+            for chain_id in range(starts)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if result["skipped"]:
+                continue
+            print(f"Chain {result['chain']} finished: Best Cost = {result['best_cost']} "
+                  f"after {result['final_step']} steps")
+            chains.append(result)
+
+    chains.sort(key=lambda r: r["chain"])
+    winner = min(chains, key=lambda r: (r["best_cost"], r["final_step"]))
+    return (
+        winner["best_rules"],
+        winner["best_cost"],
+        winner["cost_progress"],
+        winner["temperatures"],
+        winner["final_step"],
+        chains,
+    )
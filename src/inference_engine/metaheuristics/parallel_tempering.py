@@ -0,0 +1,214 @@
+import os
+import copy
+import math
+import random
+import traceback
+import multiprocessing as mp
+
+from src.boolean_network_representation.rules import TruthTableToRules
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
+from src.inference_engine.metaheuristics.simulated_annealing import metropolis_acceptance, _plot_progress
+from src.inference_engine.metaheuristics.telemetry import TelemetryRecorder
+
+
+def temperature_ladder(t_max, t_min, replicas):
+    """
+    Geometric ladder of replica temperatures, hottest first.
+    """
+    if replicas == 1:
+        return [t_min]
+    ratio = (t_min / t_max) ** (1 / (replicas - 1))
+    return [t_max * ratio ** k for k in range(replicas)]
+
+
+def _run_replica(conn, seed, network, desired_trace, cost_function, mutation_function):
+    """
+    Worker process: one annealing chain at whatever fixed temperature the coordinator assigns each round.
+    Commands: ("run", temperature, steps, send_network) and ("stop",).
+    """
+    try:
+        random.seed(seed)
+        current_trace = network.generate_truth_table()
+        current_cost = cost_function(desired_trace, current_trace)
+        best_cost = current_cost
+        best_rules = list(network.current_rules)
+
+        while True:
+            command = conn.recv()
+            if command[0] == "stop":
+                conn.send(("result", best_rules, best_cost))
+                break
+
+            _, temperature, steps, send_network = command
+            segment = []
+            for _ in range(steps):
+                mutated_trace, mutated_rules = mutation_function(network, current_trace)
+                new_cost = cost_function(desired_trace, mutated_trace)
+
+                if metropolis_acceptance(new_cost - current_cost, temperature):
+                    current_trace = mutated_trace
+                    current_cost = new_cost
+                    network.current_rules = mutated_rules
+
+                    if current_cost < best_cost:
+                        best_cost = current_cost
+                        best_rules = list(mutated_rules)
+
+                segment.append(current_cost)
+                if best_cost == 0:
+                    break
+
+            conn.send(("done", current_cost, best_cost, segment, network if send_network else None))
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+def parallel_tempering(
+    network,
+    desired_trace,
+    cost_function,
+    mutation_function,
+    entities,
+    replicas=None,
+    t_max=5.0,
+    t_min=0.05,
+    max_iterations=100000,
+    swap_interval=100,
+    seed=None,
+    log_interval=1000,
+    live_update_interval=1000,
+    output_dir="results",
+    progress_callback=None,
+    log_results=False,
+    plot_progress=True,
+    telemetry=None,
+    cancel_token=None
+):
+    """
+    Replica-exchange (parallel tempering) Simulated Annealing.
+
+    Runs `replicas` chains in separate processes at a geometric ladder of fixed temperatures between t_max and
+    t_min. Every `swap_interval` iterations neighbouring temperatures are swapped using the Metropolis criterion
+    min(1, exp((1/T_i - 1/T_j)(E_i - E_j))). Swapping temperatures rather than states keeps messages tiny.
+
+    cost_function and mutation_function must be picklable (module-level functions or functools.partial).
+    Returns the same tuple as simulated_annealing. The cost history and temperatures follow whichever replica
+    holds the coldest temperature; the returned rules are the best found by any replica.
+    """
+    replicas = replicas or os.cpu_count() or 1
+    ladder = temperature_ladder(t_max, t_min, replicas)
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    swap_rng = random.Random(base_seed)
+
+    # Same entity-safe rule rebuild as simulated_annealing
+    initial_trace = network.generate_truth_table()
+    network.current_rules = build_rules(TruthTableToRules.convert(initial_trace, entities), entities)
+
+    run_dir = output_dir
+    os.makedirs(run_dir, exist_ok=True)
+
+    ctx = mp.get_context()
+    connections = []
+    processes = []
+    for replica in range(replicas):
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_run_replica,
+            args=(child_conn, base_seed + replica + 1, copy.deepcopy(network),
+                  desired_trace, cost_function, mutation_function),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        connections.append(parent_conn)
+        processes.append(process)
+
+    def receive(conn):
+        message = conn.recv()
+        if message[0] == "error":
+            raise RuntimeError(f"Replica failed:\n{message[1]}")
+        return message
+
+    # replica_at[k] is the replica currently running at ladder[k]
+    replica_at = list(range(replicas))
+    if telemetry is None:
+        telemetry = TelemetryRecorder()
+    iteration = 0
+    swaps_accepted = 0
+    swaps_attempted = 0
+    next_log = 0
+    next_update = live_update_interval
+
+    try:
+        while iteration < max_iterations:
+            # Replicas sit idle between segments, so pausing here pauses the whole ladder
+            if cancel_token is not None and cancel_token.checkpoint():
+                print(f"⏹️ Parallel tempering stopped at iteration {iteration}")
+                break
+            steps = min(swap_interval, max_iterations - iteration)
+            send_network = progress_callback is not None and iteration + steps >= next_update
+
+            for k, replica in enumerate(replica_at):
+                connections[replica].send(("run", ladder[k], steps, send_network and k == replicas - 1))
+
+            energies = {}
+            best_costs = {}
+            coldest_network = None
+            for k, replica in enumerate(replica_at):
+                _, current_cost, best_cost, segment, net = receive(connections[replica])
+                energies[replica] = current_cost
+                best_costs[replica] = best_cost
+                if k == replicas - 1:
+                    for cost in segment:
+                        telemetry.record(cost, ladder[k])
+                    coldest_network = net
+
+            iteration += steps
+            coldest_cost = energies[replica_at[-1]]
+
+            if iteration >= next_log:
+                print(f"Iter {iteration}: Coldest Cost = {coldest_cost:.4f}, Best = {min(best_costs.values()):.4f}, "
+                      f"Swap Rate = {swaps_accepted / max(swaps_attempted, 1):.2f}")
+                next_log = iteration + log_interval
+
+            if send_network and coldest_network is not None:
+                progress_callback(iteration, coldest_cost, coldest_network)
+                next_update = iteration + live_update_interval
+
+            if min(best_costs.values()) == 0:
+                break
+
+            # Alternate even/odd neighbour pairs each round
+            offset = (iteration // swap_interval) % 2
+            for k in range(offset, replicas - 1, 2):
+                hot, cold = replica_at[k], replica_at[k + 1]
+                exponent = (1 / ladder[k + 1] - 1 / ladder[k]) * (energies[cold] - energies[hot])
+                swaps_attempted += 1
+                if exponent >= 0 or swap_rng.random() < math.exp(exponent):
+                    replica_at[k], replica_at[k + 1] = cold, hot
+                    swaps_accepted += 1
+
+        results = []
+        for conn in connections:
+            conn.send(("stop",))
+            results.append(receive(conn))
+    finally:
+        for conn in connections:
+            conn.close()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    _, best_rules, best_cost = min(results, key=lambda r: r[2])
+
+    cost_progress = list(telemetry.costs)
+    temperatures = list(telemetry.temperatures)
+    if log_results and plot_progress:
+        _plot_progress(cost_progress, iteration, run_dir, steps=telemetry.steps)
+
+    best_rules_named = {entities[i]: rule for i, rule in enumerate(best_rules)}
+    final_step = telemetry.final_step
+    return best_rules_named, best_cost, cost_progress, temperatures, final_step
@@ -0,0 +1,148 @@
+import os
+import json
+import time
+import contextlib
+
+PROFILE_FILENAME = "phase_profile.txt"
+
+
+class _Phase:
+    """
+    Re-usable timer for one named phase. Nested phases are subtracted from their parent's self time.
+    """
+    __slots__ = ("profiler", "name", "start", "child_time")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.child_time = 0.0
+        self.profiler._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1].child_time += elapsed
+        stats = self.profiler.stats.get(self.name)
+        if stats is None:
+            stats = self.profiler.stats[self.name] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - self.child_time
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class PhaseProfiler:
+    """
+    Accumulates wall time and call counts per named phase of a search loop
+    (mutation, rule regeneration, truth-table build, cost, acceptance, callbacks, plotting...).
+
+        with profiler.phase("cost"):
+            cost = cost_function(desired, trace)
+
+    Phases can nest; each phase reports total time and self time (total minus nested phases).
+    A disabled profiler hands out a shared no-op context, so instrumentation costs almost nothing.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.stats = {}  # name -> [calls, total seconds, self seconds]
+        self._stack = []
+        self._phases = {}
+        self.started = time.perf_counter()
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL_PHASE
+        timer = self._phases.get(name)
+        if timer is None or timer in self._stack:
+            timer = _Phase(self, name)
+            self._phases[name] = timer
+        return timer
+
+    def report(self):
+        """
+        Returns one dict per phase, sorted by self time (largest first).
+        """
+        wall = time.perf_counter() - self.started
+        rows = [
+            {
+                "phase": name,
+                "calls": calls,
+                "total_s": total,
+                "self_s": self_time,
+                "mean_ms": total / calls * 1e3 if calls else 0.0,
+                "percent": self_time / wall * 100 if wall else 0.0,
+            }
+            for name, (calls, total, self_time) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["self_s"], reverse=True)
+        return rows
+
+    def format_report(self):
+        rows = self.report()
+        lines = [f"{'Phase':<22}{'Calls':>10}{'Total (s)':>12}{'Self (s)':>12}{'Mean (ms)':>12}{'Self %':>9}"]
+        for row in rows:
+            lines.append(
+                f"{row['phase']:<22}{row['calls']:>10}{row['total_s']:>12.3f}{row['self_s']:>12.3f}"
+                f"{row['mean_ms']:>12.4f}{row['percent']:>8.1f}%"
+            )
+        lines.append(f"Wall time: {time.perf_counter() - self.started:.3f} s")
+        return "\n".join(lines)
+
+    def write(self, run_dir):
+        """
+        Writes phase_profile.txt (table) and phase_profile.json to the run directory.
+        """
+        os.makedirs(run_dir, exist_ok=True)
+        with open(os.path.join(run_dir, PROFILE_FILENAME), "w", encoding="utf-8") as f:
+            f.write(self.format_report() + "\n")
+        with open(os.path.join(run_dir, "phase_profile.json"), "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+# Profiler used by code that is not handed one explicitly (mutation strategies, cost functions)
+_active = PhaseProfiler(enabled=False)
+
+
+def active_profiler():
+    return _active
+
+
+def profile_phase(name):
+    """
+    Times a phase on the active profiler - a no-op unless a run has activated one.
+    """
+    return _active.phase(name)
+
+
+@contextlib.contextmanager
+def activate(profiler):
+    """
+    Makes profiler the active one for the duration of a run.
+    """
+    global _active
+    previous = _active
+    _active = profiler if profiler is not None else previous
+    try:
+        yield _active
+    finally:
+        _active = previous
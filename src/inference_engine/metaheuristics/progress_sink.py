@@ -0,0 +1,97 @@
+import os
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+# One shared render thread per process - plots queue up instead of stalling the search loop
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _render_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-plot")
+        return _executor
+
+
+def render_progress_png(path, steps, costs, title, xlabel):
+    """
+    Draws one cost-progress figure and saves it to path. Uses the object-oriented Agg API (no pyplot state),
+    so it is safe to call from the background render thread.
+    """
+    # lazy - keeps headless runs free of matplotlib unless plots are wanted
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(10, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if steps is not None:
+        ax.plot(steps, costs)
+    else:
+        ax.plot(costs)
+    ax.set_yscale('linear')
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Cost")
+    ax.set_title(title)
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(path)
+    return path
+
+
+class ProgressSink:
+    """
+    Buffers (step, cost) points during a search and renders the progress plot at most once per request,
+    on a background thread. The search loop only pays for an array append.
+
+        sink = ProgressSink(run_dir, "Genetic Algorithm Progress @ Generation {step}", "Generation")
+        sink.append(gen, best_cost)
+        ...
+        sink.render()   # returns a Future; sink.wait() blocks until pending renders are written
+    """
+
+    def __init__(self, out_dir, title, xlabel):
+        # title may contain {step}
+        self.out_dir = out_dir
+        self.title = title
+        self.xlabel = xlabel
+        self.steps = array('q')
+        self.costs = array('d')
+        self._pending = []
+
+    def append(self, step, cost):
+        self.steps.append(step)
+        self.costs.append(cost)
+
+    def extend(self, steps, costs):
+        self.steps.extend(steps)
+        self.costs.extend(costs)
+
+    def render(self, step=None):
+        """
+        Queues a render of the points buffered so far to progress_<step>.png (default: last buffered step).
+        """
+        if not self.costs:
+            return None
+        step = self.steps[-1] if step is None else step
+        path = os.path.join(self.out_dir, f"progress_{step}.png")
+        # Snapshot the buffers so the search can keep appending while the plot is drawn
+        future = _render_executor().submit(
+            render_progress_png, path, self.steps[:], self.costs[:], self.title.format(step=step), self.xlabel
+        )
+        future.add_done_callback(_report_failure)
+        self._pending = [f for f in self._pending if not f.done()] + [future]
+        return future
+
+    def wait(self):
+        for future in self._pending:
+            future.exception()
+        self._pending = []
+
+
+def _report_failure(future):
+    if future.exception() is not None:
+        print(f"⚠️ Progress plot failed: {future.exception()}")
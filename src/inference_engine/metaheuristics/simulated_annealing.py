@@ -1,26 +1,23 @@
 
 import os
-import matplotlib.pyplot as plt
-import json
-from tempfile import gettempdir
+import math
+import random
 
 from src.boolean_network_representation.network import BooleanNetwork
-from src.inference_engine.mutation_strategies.mutation_utils import replace_entities_with_state
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
 from src.boolean_network_representation.rules import TruthTableToRules
+from src.inference_engine.metaheuristics.telemetry import TelemetryRecorder
+from src.inference_engine.metaheuristics.profiling import active_profiler, activate
+from src.inference_engine.metaheuristics.progress_sink import ProgressSink
+from src.inference_engine.metaheuristics.cancellation import CHECK_INTERVAL
 
 
-def write_live_json(step, rules, fitness, attractors=None):
-    if attractors is None:
-        attractors = []
-    output = {
-        "step": step,
-        "rules": {f"N{i + 1}": str(rules[i]) for i in range(len(rules))},
-        "fitness": fitness,
-        "attractors": attractors
-    }
-    path = os.path.join(gettempdir(), "current_evolution.json")
-    with open(path, "w") as f:
-        json.dump(output, f)
+def metropolis_acceptance(delta_cost, temperature):
+    """
+    Metropolis criterion - always accept improvements, accept worse moves with probability exp(-delta / T).
+    Module-level so it can be sent to worker processes.
+    """
+    return delta_cost <= 0 or random.random() < math.exp(-delta_cost / temperature)
 
 class TemperatureSchedule:
     def __init__(self, initial_temp, cooling_rate):
@@ -45,85 +42,126 @@ def simulated_annealing(
     cost_window=None,
     progress_callback=None,
     log_results=False,
-
+    plot_progress=True,
+    stop_event=None,
+    telemetry=None,
+    checkpointer=None,
+    resume_state=None,
+    profiler=None,
+    cancel_token=None,
 ):
-    initial_trace = network.generate_truth_table()
-    entities = [f"N{i + 1}" for i in range(len(initial_trace[next(iter(initial_trace))]))]
-    rules_dict = TruthTableToRules.convert(initial_trace, entities)
-
-    print("✅ [DEBUG] Rebuilding SA rules with entity-safe lambdas...")  # <--- this line
-
-    network.current_rules = [
-        eval(f"lambda state, index: int({replace_entities_with_state(rule, entities)})")
-        if rule != '0' else (lambda state, index: 0)
-        for rule in rules_dict.values()
-    ]
-
-    current_trace = network.generate_truth_table()
-    current_cost = cost_function(desired_trace, current_trace)
-    best_cost = current_cost
-    best_trace = current_trace.copy()
-    best_rules = network.current_rules.copy()
-
-    temperature = temperature_schedule.initial_temp
-    iteration = 0
-    cost_progress = [current_cost]
-    temperatures = [temperature] # logging
+    entities = [f"N{i + 1}" for i in range(network.entity_count)]
+    # Per-phase timings (no-op unless a profiler is passed or already active)
+    profiler = profiler if profiler is not None else active_profiler()
+
+    if resume_state is not None:
+        # Continue from a checkpoint written by a previous (crashed or interrupted) run
+        print(f"♻️ Resuming simulated annealing from iteration {resume_state['iteration']}")
+        network.current_rules = resume_state["current_rules"]
+        current_trace = resume_state["current_trace"]
+        current_cost = resume_state["current_cost"]
+        best_cost = resume_state["best_cost"]
+        best_rules = resume_state["best_rules"]
+        temperature = resume_state["temperature"]
+        iteration = resume_state["iteration"]
+        telemetry = resume_state["telemetry"]
+        random.setstate(resume_state["random_state"])
+    else:
+        initial_trace = network.generate_truth_table()
+        rules_dict = TruthTableToRules.convert(initial_trace, entities)
+
+        network.current_rules = build_rules(rules_dict, entities)
+
+        current_trace = network.generate_truth_table()
+        current_cost = cost_function(desired_trace, current_trace)
+        best_cost = current_cost
+        best_rules = network.current_rules.copy()
+
+        temperature = temperature_schedule.initial_temp
+        iteration = 0
+        # logging - bounded-memory cost/temperature buffers (full resolution up to telemetry.max_points)
+        if telemetry is None:
+            telemetry = TelemetryRecorder()
+        telemetry.record(current_cost, temperature)
 
     run_dir = output_dir
     os.makedirs(run_dir, exist_ok=True)
 
-    while iteration < max_iterations:
-        mutated_trace, mutated_rules = mutation_function(network, current_trace)
-        new_cost = cost_function(desired_trace, mutated_trace)
-        delta_cost = new_cost - current_cost
-
-        if acceptance_function(delta_cost, temperature):
-            current_trace = mutated_trace
-            current_cost = new_cost
-            network.current_rules = mutated_rules
-
-            if current_cost < best_cost:
-                best_cost = current_cost
-                best_trace = mutated_trace.copy()
-                best_rules = mutated_rules.copy()
-                best_network = BooleanNetwork(len(entities))
-
-        cost_progress.append(current_cost)
-        temperature = temperature_schedule.cool(temperature)
-        temperatures.append(temperature)
-
-        if iteration % log_interval == 0:
-            print(f"Iter {iteration}: Cost = {current_cost:.4f}, Temp = {temperature:.4f}")
-
-        if best_cost == 0:
-            break
-
-
-        iteration += 1
-        # Sends current iteration cost - meanwhile ga sends best in the generation not ever
-        if progress_callback and (iteration % live_update_interval == 0):
-            print(f"[DEBUG] Emitting progress at {iteration}")
-            progress_callback(iteration, current_cost, network)
-    if log_results:
-        _plot_progress(cost_progress, iteration, run_dir)
+    with activate(profiler):
+        while iteration < max_iterations:
+            # Shared stop flag (e.g. another multi-start chain already reached cost 0)
+            if stop_event is not None and stop_event.is_set():
+                break
+            # Stop / pause from the GUI or batch runner - the best-so-far rules are still returned
+            if cancel_token is not None and iteration % CHECK_INTERVAL == 0 and cancel_token.checkpoint():
+                print(f"⏹️ Simulated annealing stopped at iteration {iteration}")
+                break
+
+            with profiler.phase("mutation"):
+                mutated_trace, mutated_rules = mutation_function(network, current_trace)
+            with profiler.phase("cost"):
+                new_cost = cost_function(desired_trace, mutated_trace)
+            delta_cost = new_cost - current_cost
+
+            with profiler.phase("acceptance"):
+                accepted = acceptance_function(delta_cost, temperature)
+            if accepted:
+                current_trace = mutated_trace
+                current_cost = new_cost
+                network.current_rules = mutated_rules
+
+                if current_cost < best_cost:
+                    best_cost = current_cost
+                    best_rules = mutated_rules.copy()
+
+            with profiler.phase("telemetry"):
+                temperature = temperature_schedule.cool(temperature)
+                telemetry.record(current_cost, temperature)
+
+            if iteration % log_interval == 0:
+                print(f"Iter {iteration}: Cost = {current_cost:.4f}, Temp = {temperature:.4f}")
+
+            if best_cost == 0:
+                break
+
+
+            iteration += 1
+
+            if checkpointer is not None and checkpointer.due(iteration):
+                with profiler.phase("checkpoint"):
+                    checkpointer.save({
+                        "algorithm": "simulated_annealing",
+                        "iteration": iteration,
+                        "current_rules": network.current_rules,
+                        "current_trace": current_trace,
+                        "current_cost": current_cost,
+                        "best_cost": best_cost,
+                        "best_rules": best_rules,
+                        "temperature": temperature,
+                        "telemetry": telemetry,
+                        "random_state": random.getstate(),
+                    })
+
+            # Sends current iteration cost - meanwhile ga sends best in the generation not ever
+            if progress_callback and (iteration % live_update_interval == 0):
+                print(f"[DEBUG] Emitting progress at {iteration}")
+                with profiler.phase("callbacks"):
+                    progress_callback(iteration, current_cost, network)
+    cost_progress = list(telemetry.costs)
+    temperatures = list(telemetry.temperatures)
+    if log_results and plot_progress:
+        with profiler.phase("plotting"):
+            _plot_progress(cost_progress, iteration, run_dir, steps=telemetry.steps)
     best_rules_named = {entities[i]: rule for i, rule in enumerate(best_rules)}
     best_network = BooleanNetwork(len(entities))
     best_network.current_rules = best_rules
-    final_step = len(cost_progress) - 1
+    final_step = telemetry.final_step
     return best_rules_named, best_cost, cost_progress, temperatures, final_step
 
-def _plot_progress(costs, step, out_dir):
-    plt.figure(figsize=(10, 5))
-    plt.plot(costs)
-    plt.yscale('linear')
-    plt.xlabel("Mutation Attempt")
-    plt.ylabel("Cost")
-    plt.title(f"Simulated Annealing Progress @ Step {step}")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(os.path.join(out_dir, f"progress_{step}.png"))
-    plt.close()
-
-
-
+def _plot_progress(costs, step, out_dir, steps=None):
+    """
+    Queues the progress plot on the background render thread (same path as the GA progress sink).
+    """
+    sink = ProgressSink(out_dir, "Simulated Annealing Progress @ Step {step}", "Mutation Attempt")
+    sink.extend(range(len(costs)) if steps is None else steps, costs)
+    return sink.render(step)
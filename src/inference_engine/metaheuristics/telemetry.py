@@ -0,0 +1,143 @@
+from array import array
+
+
+class TelemetryRecorder:
+    """
+    Bounded-memory recorder for per-step cost (and temperature) telemetry.
+
+    Values are stored in typed array('d') buffers rather than lists of boxed floats, with three views:
+    - samples: every `every`-th step. When more than `max_points` samples are held, the stride doubles and
+      every other sample is dropped, so memory stays bounded however long the run is.
+    - envelope: min/max cost per bucket of `bucket_size` steps (buckets merge pairwise past `max_points`),
+      so spikes between samples are not lost.
+    - improvements: every step where the best-so-far cost decreased (bounded by the number of distinct costs).
+
+    Steps count from 0 (the initial cost). The last recorded step is always included in the samples.
+    """
+
+    def __init__(self, every=1, bucket_size=1000, max_points=100000, keep_improvements=True):
+        self.every = max(1, int(every))
+        self.bucket_size = max(1, int(bucket_size))
+        self.max_points = max(2, int(max_points))
+        self.keep_improvements = keep_improvements
+
+        self.count = 0
+        self.best = float('inf')
+        self.last = None  # (step, cost, temperature)
+
+        self._steps = array('q')
+        self._costs = array('d')
+        self._temperatures = array('d')
+
+        self._bucket_starts = array('q')
+        self._bucket_mins = array('d')
+        self._bucket_maxs = array('d')
+        self._open_bucket = None  # [start, min, max]
+
+        self._improvement_steps = array('q')
+        self._improvement_costs = array('d')
+
+    def record(self, cost, temperature=float('nan')):
+        """
+        Records the cost (and optional temperature) of the next step.
+        """
+        step = self.count
+        self.count += 1
+        self.last = (step, cost, temperature)
+
+        if cost < self.best:
+            self.best = cost
+            if self.keep_improvements:
+                self._improvement_steps.append(step)
+                self._improvement_costs.append(cost)
+
+        if step % self.every == 0:
+            self._steps.append(step)
+            self._costs.append(cost)
+            self._temperatures.append(temperature)
+            if len(self._steps) > self.max_points:
+                self._halve_samples()
+
+        bucket = self._open_bucket
+        if bucket is None:
+            self._open_bucket = [step, cost, cost]
+        else:
+            if cost < bucket[1]:
+                bucket[1] = cost
+            if cost > bucket[2]:
+                bucket[2] = cost
+        if step - self._open_bucket[0] + 1 >= self.bucket_size:
+            self._close_bucket()
+
+    def _halve_samples(self):
+        self.every *= 2
+        keep = [i for i, step in enumerate(self._steps) if step % self.every == 0]
+        self._steps = array('q', (self._steps[i] for i in keep))
+        self._costs = array('d', (self._costs[i] for i in keep))
+        self._temperatures = array('d', (self._temperatures[i] for i in keep))
+
+    def _close_bucket(self):
+        start, low, high = self._open_bucket
+        self._open_bucket = None
+        self._bucket_starts.append(start)
+        self._bucket_mins.append(low)
+        self._bucket_maxs.append(high)
+
+        if len(self._bucket_starts) > self.max_points:
+            # Merge neighbouring buckets so the envelope stays bounded too
+            self.bucket_size *= 2
+            starts, mins, maxs = self._bucket_starts, self._bucket_mins, self._bucket_maxs
+            pairs = range(0, len(starts) - 1, 2)
+            self._bucket_starts = array('q', (starts[i] for i in pairs))
+            self._bucket_mins = array('d', (min(mins[i], mins[i + 1]) for i in pairs))
+            self._bucket_maxs = array('d', (max(maxs[i], maxs[i + 1]) for i in pairs))
+            if len(starts) % 2:
+                self._open_bucket = [starts[-1], mins[-1], maxs[-1]]
+
+    def restore(self, other):
+        """
+        Continues from another recorder's data (e.g. one restored from a checkpoint), in place.
+        """
+        self.__dict__.update(other.__dict__)
+
+    def _with_last(self, buffer, index):
+        if self.last is None or (self._steps and self._steps[-1] == self.last[0]):
+            return buffer
+        return buffer + array(buffer.typecode, [self.last[index]])
+
+    @property
+    def steps(self):
+        return self._with_last(self._steps, 0)
+
+    @property
+    def costs(self):
+        return self._with_last(self._costs, 1)
+
+    @property
+    def temperatures(self):
+        return self._with_last(self._temperatures, 2)
+
+    @property
+    def final_step(self):
+        return self.count - 1
+
+    def envelope(self):
+        """
+        Returns (bucket start steps, bucket min costs, bucket max costs), including the open bucket.
+        """
+        starts, mins, maxs = self._bucket_starts, self._bucket_mins, self._bucket_maxs
+        if self._open_bucket is not None:
+            start, low, high = self._open_bucket
+            starts = starts + array('q', [start])
+            mins = mins + array('d', [low])
+            maxs = maxs + array('d', [high])
+        return starts, mins, maxs
+
+    def improvements(self):
+        """
+        Returns (steps, costs) of every best-so-far improvement.
+        """
+        return self._improvement_steps, self._improvement_costs
+
+    def __len__(self):
+        return len(self.steps)
@@ -1,6 +1,7 @@
 import random
 from src.boolean_network_representation.rules import TruthTableToRules
-from src.inference_engine.mutation_strategies.mutation_utils import replace_entities_with_state
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
+from src.inference_engine.metaheuristics.profiling import profile_phase
 
 
 def edame_mutation(network, current_trace, target_attractors):
@@ -19,7 +20,8 @@ def edame_mutation(network, current_trace, target_attractors):
     Modifications have been made for integration with this project.
 
     """
-    current_attractors = network.detect_attractors()
+    with profile_phase("attractor_detection"):
+        current_attractors = network.detect_attractors()
 
     # set attractors to state sets
     target_states = set(s for cycle in target_attractors for s in cycle)
@@ -57,11 +59,8 @@ def edame_mutation(network, current_trace, target_attractors):
     mutated_trace[state_to_flip] = new_next_state
 
     # Regenerate rules
-    mutated_rules_dict = TruthTableToRules.convert(mutated_trace, network.nodes)
-    mutated_rules = [
-        eval(f"lambda state, index: int({replace_entities_with_state(rule, network.nodes)})")
-        if rule != '0' else (lambda state, index: 0)
-        for rule in mutated_rules_dict.values()
-    ]
+    with profile_phase("rule_regeneration"):
+        mutated_rules_dict = TruthTableToRules.convert(mutated_trace, network.nodes)
+        mutated_rules = build_rules(mutated_rules_dict, network.nodes)
 
     return mutated_trace, mutated_rules
\ No newline at end of file
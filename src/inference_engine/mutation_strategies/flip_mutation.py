@@ -1,7 +1,8 @@
 import random
 import copy
 from src.boolean_network_representation.rules import TruthTableToRules
-from src.inference_engine.mutation_strategies.mutation_utils import replace_entities_with_state
+from src.inference_engine.mutation_strategies.mutation_utils import build_rules
+from src.inference_engine.metaheuristics.profiling import profile_phase
 
 def flip_bit(truth_table, entities):
     """
@@ -19,13 +20,10 @@ def flip_bit(truth_table, entities):
     bit_index = random.randint(0, len(mutated[random_state]) - 1)
     mutated[random_state][bit_index] = 1 - mutated[random_state][bit_index]
 
-    new_rules_dict = TruthTableToRules.convert(mutated, entities)
+    with profile_phase("rule_regeneration"):
+        new_rules_dict = TruthTableToRules.convert(mutated, entities)
 
-    # Make the rules callable transform each rule to a lambda function
-    new_rules = [
-        eval(f"lambda state, index: int({replace_entities_with_state(rule, entities)})")
-        if rule != '0' else (lambda state, index: 0)
-        for rule in new_rules_dict.values()
-    ]
+        # Make the rules callable (picklable compiled rules)
+        new_rules = build_rules(new_rules_dict, entities)
 
     return mutated, new_rules  # Return mutated trace and callable rules
@@ -1,3 +1,6 @@
+from src.boolean_network_representation.rules import CompiledRule
+
+
 def replace_entities_with_state(rule, entities):
     """
     Replaces entity names with state[i] references.
@@ -8,3 +11,13 @@ def replace_entities_with_state(rule, entities):
     for i, entity in enumerate(entities):
         rule = rule.replace(entity, f"state[{i}]")
     return rule
+
+
+def build_rules(rules_dict, entities):
+    """
+    Turns a {entity: rule string} dict (from TruthTableToRules.convert) into picklable CompiledRule callables.
+    """
+    return [
+        CompiledRule(replace_entities_with_state(rule, entities)) if rule != '0' else CompiledRule("0")
+        for rule in rules_dict.values()
+    ]